@@ -10,6 +10,14 @@ from allure_commons.types import Severity
 from allure_commons.utils import uuid4, now
 from src.utils.common_utils import pretty_time
 
+from src.apis.cassette import Cassette
+from src.apis.quote_service import QuoteService
+from src.apis.rate_limiter import RateLimiter, RetryBudget
+from src.apis.response_cache import ResponseCache
+from src.apis.session_pool import SessionPool
+from src.core.actions.base_actions import BaseActions
+from src.core.actions.wait_ledger import WaitLedger
+from src.core.actions.wait_scheduler import WaitScheduler
 from src.core.config_manager import Config
 from src.core.driver.driver_manager import DriverManager
 from src.data.consts import ROOTDIR, VIDEO_DIR, MULTI_OMS, WEB_APP_DEVICE, PLATFORMS
@@ -33,12 +41,14 @@ def pytest_addoption(parser: pytest.Parser):
     parser.addoption("--browser", default="chrome", help="Browser for web tests (chrome, firefox, safari)")
     parser.addoption("--headless", action="store_true", help="Run browser in headless mode")
     parser.addoption("--enable_cdp", help="Enable dev tool to log API requests")
+    parser.addoption("--fixed_waits", action="store_true", default=False, help="Use requested element timeouts as is, instead of the ones learned per locator")
 
     # for testing chart render time
     parser.addoption("--charttime", default="", help="Allow maximum chart render time")
     parser.addoption("--cd", action="store_true", help="Whether to choose driver to run on argo cd")
     parser.addoption("--debuglog", action="store_true", default=False, help="Whether to log the debug log to console")
     parser.addoption("--video", action="store_true", default=False, help="Whether to record video locally")
+    parser.addoption("--api-cassette", choices=[Cassette.RECORD, Cassette.REPLAY], help="Record API responses per test package, or replay them without the backend")
 
 builtins.own_fixture = []
 
@@ -52,6 +62,7 @@ def pytest_configure(config):
 def pytest_sessionstart(session: pytest.Session):
     RuntimeConfig.log_debug = session.config.getoption("debuglog")
     RuntimeConfig.argo_cd = session.config.getoption("cd")
+    WaitScheduler.enabled = not session.config.getoption("fixed_waits")
 
     if RuntimeConfig.log_debug:
         setup_logging(logging.DEBUG)
@@ -101,6 +112,7 @@ def pytest_sessionstart(session: pytest.Session):
     logger.info(f">> Env: {env!r}")
     logger.info(f">> Server: {server!r}")
     Config.load_config(env, client)
+    Cassette.setup(session.config.getoption("api_cassette"))
 
     # Save options to Runtime Config
     RuntimeConfig.allure_dir = allure_dir
@@ -149,6 +161,13 @@ def pytest_runtest_setup(item: pytest.Item):
     server = RuntimeConfig.server
     account = RuntimeConfig.account
 
+    # Switch API cassette per test package
+    Cassette.use(os.path.relpath(item.path.parent, ROOTDIR / "tests"))
+
+    # Each test gets its own API retry budget, and its element waits accounted
+    RetryBudget.reset()
+    WaitLedger.start_test(item.nodeid)
+
     # Set up Allure test structure
     module = item.nodeid.split("::")[0].split("/")[2:-1]  # not count test, web, and test name
     sub_suite = " - ".join(item.capitalize() for item in module)
@@ -206,6 +225,17 @@ def pytest_sessionfinish(session: pytest.Session):
     logger.debug("===== pytest_sessionfinish ==== ")
 
     DriverManager.quit_driver(RuntimeConfig.platform)
+    SessionPool.log_stats()
+    ResponseCache.log_stats()
+    QuoteService.log_stats()
+    RateLimiter.log_stats()
+    BaseActions.log_stats()
+    WaitScheduler.log_stats()
+    WaitLedger.log_report()
+    SessionPool.close_all()
+    Cassette.save()
+    WaitScheduler.save()
+
     allure_dir = RuntimeConfig.allure_dir
 
     if allure_dir and os.path.exists(ROOTDIR / allure_dir):
@@ -297,6 +327,9 @@ def pytest_fixture_post_finalizer(fixturedef, request):
 
 
 def pytest_runtest_logreport(report):
+    if report.when == "teardown":
+        WaitLedger.end_test()
+
     if report.when == "call":
         printlog = logger.info if report.outcome == "passed" else logger.warning
         print("\x00") # print a non-printable character to break a new line on console
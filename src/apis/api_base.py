@@ -1,6 +1,7 @@
 import requests
-from requests.adapters import HTTPAdapter
 
+from src.apis.response_cache import ResponseCache
+from src.apis.session_pool import SessionPool
 from src.core.config_manager import Config
 from src.core.decorators import after_request
 from src.data.project_info import RuntimeConfig
@@ -9,52 +10,78 @@ from src.data.project_info import RuntimeConfig
 class BaseAPI:
     def __init__(self, headers=None):
         self.headers = headers or RuntimeConfig.headers
-        self.session = self._create_session()
 
-    @staticmethod
-    def _create_session():
-        """Create a session with connection pooling"""
-        session = requests.Session()
+    @property
+    def session(self) -> requests.Session:
+        """Shared keep-alive session for the current base url"""
+        return SessionPool.get_session(self.api_url())
 
-        # Configure connection pooling only
-        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20)
+    def _use_new_token(self, old_auth: str) -> None:
+        """Custom headers (not the shared RuntimeConfig.headers) still holding old_auth get the token of the last login"""
+        if self.headers is not RuntimeConfig.headers and self.headers.get("Authorization") == old_auth:
+            self.headers["Authorization"] = RuntimeConfig.headers["Authorization"]
 
-        session.mount("http://", adapter)
-        session.mount("https://", adapter)
+    def refresh_token(self) -> None:
+        """Called before each request: login again if the token of the last login is about to expire"""
+        from src.apis.auth_api import AuthAPI
+        old_auth = RuntimeConfig.headers.get("Authorization")
+        if AuthAPI.refresh_expiring():
+            self._use_new_token(old_auth)
+
+    def reauthenticate(self) -> bool:
+        """Login again after a 401 response, return True if the request can be retried with the new token"""
+        from src.apis.auth_api import AuthAPI
+        old_auth = self.headers.get("Authorization", "")
+        rejected_token = old_auth.removeprefix("Bearer ")
+        if not rejected_token or not AuthAPI.relogin(rejected_token):
+            return False
+
+        self._use_new_token(old_auth)
+        return True
 
-        return session
-    
     @staticmethod
     def api_url():
         api_url = f"{Config.config.base_url}/api" if not RuntimeConfig.url else f"{RuntimeConfig.url}/api"
         return api_url
 
+    def get(self, endpoint: str, params: dict = None, fields_to_show=None, apply_retries=True, parse_result=True, truncate_len=5, use_cache=False):
+        """
+        GET request, use_cache=True serves registered endpoints from ResponseCache.
+        Cache hits skip the request handling (rate limit, circuit breaker, logging) and the network altogether.
+        """
+        def _fetch():
+            return self._get(endpoint, params, fields_to_show, apply_retries, parse_result, truncate_len)
+
+        # only parsed results of requests with retries are cached: any other error response is returned as is
+        if use_cache and apply_retries and parse_result and ResponseCache.is_cacheable(endpoint):
+            return ResponseCache.get_or_fetch(endpoint, params, self.headers, _fetch)
+
+        return _fetch()
+
     @after_request(base_delay=1.0, max_delay=10.0)
-    def get(self, endpoint: str, params: dict = None, fields_to_show=None, apply_retries=True, parse_result=True, truncate_len=5):
-        resp = self.session.get(url=f"{self.api_url()}{endpoint}", headers=self.headers, params=params or {})
-        return resp
+    def _get(self, endpoint: str, params: dict = None, fields_to_show=None, apply_retries=True, parse_result=True, truncate_len=5):
+        return self.session.get(url=f"{self.api_url()}{endpoint}", headers=self.headers, params=params or {})
 
     @after_request(base_delay=1.0, max_delay=10.0)
     def post(self, endpoint: str, payload: dict = None, fields_to_show=None, apply_retries=True, parse_result=True, truncate_len=5):
         resp = self.session.post(url=f"{self.api_url()}{endpoint}", headers=self.headers, json=payload)
+        ResponseCache.invalidate(endpoint)
         return resp
 
     @after_request(base_delay=1.0, max_delay=10.0)
     def put(self, endpoint: str, payload: dict = None, fields_to_show=None, apply_retries=True, parse_result=True, truncate_len=5):
         resp = self.session.put(url=f"{self.api_url()}{endpoint}", headers=self.headers, json=payload)
+        ResponseCache.invalidate(endpoint)
         return resp
     
     @after_request(base_delay=1.0, max_delay=10)
     def delete(self, endpoint: str,  params: dict = None, fields_to_show=None, apply_retries=True, parse_result=True, truncate_len=5):
         resp = self.session.delete(url=f"{self.api_url()}{endpoint}", params=params, headers=self.headers)
+        ResponseCache.invalidate(endpoint)
         return resp
 
     @after_request(base_delay=1.0, max_delay=10.0)
     def patch(self, endpoint: str, payload: dict = None, fields_to_show=None, apply_retries=True, parse_result=True, truncate_len=5):
         resp = self.session.patch(url=f"{self.api_url()}{endpoint}", headers=self.headers, json=payload)
+        ResponseCache.invalidate(endpoint)
         return resp
-
-    def __del__(self):
-        """Clean up session when object is destroyed"""
-        if hasattr(self, 'session'):
-            self.session.close()
@@ -20,7 +20,7 @@ class APIClient:
         # Initialize authentication first
         self.auth = AuthAPI(userid=userid, password=password)
         
-        # Initialize other API clients with shared session
+        # Initialize other API clients, all of them share the process-wide SessionPool
         self.trade = TradeAPI()
         self.order = OrderAPI()
         self.user = UserAPI()
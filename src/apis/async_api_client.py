@@ -0,0 +1,83 @@
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable
+
+from src.apis.auth_api import AuthAPI
+from src.apis.market_api import MarketAPI
+from src.apis.notification import NotificationAPI
+from src.apis.order_api import OrderAPI
+from src.apis.session_pool import SessionPool
+from src.apis.statistics_api import StatisticsAPI
+from src.apis.trade_api import TradeAPI
+
+
+class AsyncAPI:
+    """
+    Awaitable view of a sync API module.
+    Every public method of the wrapped API is exposed as a coroutine which runs the original method
+    in a worker thread, so retries and request logging from after_request stay exactly the same.
+    """
+
+    def __init__(self, api, executor: ThreadPoolExecutor):
+        self._api = api
+        self._executor = executor
+
+    def __getattr__(self, name):
+        attr = getattr(self._api, name)
+        if not callable(attr):
+            return attr
+
+        async def _call(*args, **kwargs):
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, functools.partial(attr, *args, **kwargs))
+
+        _call.__name__ = name
+        _call.__doc__ = attr.__doc__
+        return _call
+
+
+class AsyncAPIClient:
+    """
+    Async API client mirroring APIClient for fan-out in fixtures.
+    Concurrent calls are bounded by max_concurrency and share the process-wide SessionPool.
+
+    Worker threads are released by close(), or on leaving the with block.
+
+    Example:
+        with AsyncAPIClient() as client:
+            market, pending = client.gather(
+                client.order.get_counts(symbol, OrderType.MARKET),
+                client.order.get_counts(symbol, OrderType.LIMIT),
+            )
+    """
+
+    def __init__(self, userid=None, password=None, max_concurrency: int = SessionPool.POOL_MAXSIZE):
+        # Login synchronously once, all members reuse the token stored in RuntimeConfig.headers
+        AuthAPI(userid=userid, password=password)
+
+        # Bound the number of in-flight requests, the executor is not tied to any event loop
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="async-api")
+        self.trade = AsyncAPI(TradeAPI(), self._executor)
+        self.order = AsyncAPI(OrderAPI(), self._executor)
+        self.market = AsyncAPI(MarketAPI(), self._executor)
+        self.statistics = AsyncAPI(StatisticsAPI(), self._executor)
+        self.notification = AsyncAPI(NotificationAPI(), self._executor)
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @staticmethod
+    def gather(*coros: Awaitable, return_exceptions=False) -> list[Any]:
+        """Run coroutines concurrently from sync code (fixtures), return results in the same order"""
+
+        async def _gather():
+            return await asyncio.gather(*coros, return_exceptions=return_exceptions)
+
+        return asyncio.run(_gather())
@@ -1,5 +1,10 @@
 import os
+import threading
+import time
+
 from src.apis.api_base import BaseAPI
+from src.apis.cassette import Cassette
+from src.apis.token_cache import TokenCache
 from src.core.config_manager import Config
 from src.data.enums import Client, AccountType
 from src.data.project_info import RuntimeConfig
@@ -22,31 +27,109 @@ class AuthAPI(BaseAPI):
         }
     }
 
-    def __init__(self, userid: str = None, password: str = None):
-        super().__init__(self.__headers)
+    # credentials of the last login, used to re-login on 401 or before its token expires
+    _last_login = (None, None)
+    _refresh_at = 0.0
+    _refresh_lock = threading.Lock()
+
+    def __init__(self, userid: str = None, password: str = None, rejected_token: str = None):
+        # login requests are always sent without the (possibly rejected) token
+        super().__init__({k: v for k, v in self.__headers.items() if k != "Authorization"})
         self.userid = userid
         self.password = password
         self.client = RuntimeConfig.client
         self.account_type = RuntimeConfig.account or AccountType.LIVE
-        self.get_token()
-
-    def get_token(self):
-
-        if "Authorization" not in RuntimeConfig.headers:
-            credentials = Config.credentials()
-            payload = {
-                "source": "WEB",
-                "password": self.password or credentials.password,
-                "userId": self.userid or credentials.username
-            }
-            logger.info("[API] Login auto client")
-            resp = self.post(
-                endpoint=self.endpoints.get(self.client, self.endpoints.get(Client.TRANSACT_CLOUD))[self.account_type],
-                payload=payload
-            )
-
-            self.__headers["Authorization"] = f"Bearer {resp['token']}"
-            RuntimeConfig.headers = self.__headers
+        self.get_token(rejected_token)
+
+    def _cache_key(self) -> str:
+        return TokenCache.make_key(self.api_url(), self.client, RuntimeConfig.server, self.account_type, self.userid or Config.credentials().username)
+
+    def _login(self) -> str:
+        credentials = Config.credentials()
+        payload = {
+            "source": "WEB",
+            "password": self.password or credentials.password,
+            "userId": self.userid or credentials.username
+        }
+        logger.info("[API] Login auto client")
+        resp = self.post(
+            endpoint=self.endpoints.get(self.client, self.endpoints.get(Client.TRANSACT_CLOUD))[self.account_type],
+            payload=payload
+        )
+        return resp["token"]
+
+    def get_token(self, rejected_token: str = None):
+        """
+        Set Authorization header from the on-disk token cache, login only if no valid token is cached.
+        Tokens about to expire are refreshed proactively (before each request, see refresh_expiring),
+        rejected_token is dropped from the cache and never reused.
+        The header is process-wide (RuntimeConfig.headers) on purpose: logging in as another user switches
+        all API instances to that user, and a 401 re-logs in as the last logged-in user.
+        With an API cassette the token cache is left out: logins are recorded/ replayed, replayed tokens are redacted.
+        """
+        key = self._cache_key()
+        current_token = RuntimeConfig.headers.get("Authorization", "").removeprefix("Bearer ")
+        use_cache = not Cassette.mode
+
+        if use_cache:
+            token = TokenCache.get(key)
+        else:
+            is_valid = AuthAPI._last_login == (self.userid, self.password) and time.time() < AuthAPI._refresh_at
+            token = current_token if is_valid else None
+
+        if current_token and current_token == token and token != rejected_token:
             return self.__headers
 
+        if not use_cache:
+            token = self._login()
+
+        elif not token or token == rejected_token:
+            with TokenCache.lock():
+                if rejected_token:
+                    TokenCache.invalidate(key, rejected_token)
+
+                # another worker might have logged in while waiting for the lock
+                token = TokenCache.get(key)
+                if not token or token == rejected_token:
+                    token = self._login()
+                    TokenCache.set(key, token)
+        else:
+            logger.debug("[API] Reuse cached auth token")
+
+        AuthAPI._last_login = (self.userid, self.password)
+        AuthAPI._refresh_at = TokenCache.refresh_at(token)
+        self.__headers["Authorization"] = f"Bearer {token}"
+        RuntimeConfig.headers = self.__headers
         return self.__headers
+
+    @classmethod
+    def relogin(cls, rejected_token: str) -> bool:
+        """Login again after the token is rejected (401), shared headers of all API instances are updated in place"""
+        logger.warning("[API] Auth token rejected, login again")
+        userid, password = cls._last_login
+        cls(userid=userid, password=password, rejected_token=rejected_token)
+        return True
+
+    @classmethod
+    def refresh_expiring(cls) -> bool:
+        """Login again if the token of the last login is about to expire, return True if it was refreshed"""
+        if not cls._refresh_at or time.time() < cls._refresh_at:
+            return False
+
+        with cls._refresh_lock:
+            # another thread might have refreshed it while waiting for the lock
+            if time.time() < cls._refresh_at:
+                return False
+
+            logger.debug("[API] Auth token about to expire, refresh it")
+            userid, password = cls._last_login
+            cls(userid=userid, password=password)
+            return True
+
+    def refresh_token(self) -> None:
+        # login requests never refresh the token
+        pass
+
+    def reauthenticate(self) -> bool:
+        # never re-login on a failed login request
+        return False
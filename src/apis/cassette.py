@@ -0,0 +1,208 @@
+import json
+import os
+import threading
+from collections import defaultdict
+from urllib.parse import urlsplit, parse_qsl
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+from src.data.consts import CASSETTE_DIR
+from src.utils.common_utils import file_lock
+from src.utils.logging_utils import logger
+
+
+class CassetteMissError(requests.RequestException):
+    """Raised in replay mode when no recorded response matches the request"""
+
+
+class Cassette:
+    """
+    Record/replay of API interactions, one cassette file per test package.
+    - record: requests go to the WT backend, request/response pairs are saved to CASSETTE_DIR,
+      merged per request key with the file saved by other xdist workers
+    - replay: recorded responses are served back without any network call
+    Requests sent before the first test package (session setup) use the SESSION cassette,
+    which replay also falls back to for requests not recorded in the package cassette.
+
+    Requests are matched on method, endpoint and normalized query params.
+    Dynamic fields (DYNAMIC_FIELDS) are templated, so they do not break matching between runs.
+    Credentials and tokens (REDACTED_FIELDS) of response bodies are redacted before writing, request bodies are not kept.
+    Identical requests are replayed in recorded order, the last one is repeated once exhausted.
+    """
+
+    RECORD = "record"
+    REPLAY = "replay"
+
+    DYNAMIC_FIELDS = {"clOrdId", "from", "to", "timestamp", "expiration"}
+    REDACTED_FIELDS = {"password", "newPassword", "oldPassword", "token", "accessToken", "refreshToken"}
+    REDACTED = "***"
+    SESSION = "session"
+
+    mode: str = ""
+    _name: str = SESSION
+    _interactions: dict[str, list[dict]] = defaultdict(list)
+    _session_interactions: dict[str, list[dict]] = defaultdict(list)  # replay fallback
+    _cursors: dict[tuple, int] = defaultdict(int)  # (cassette, key): next interaction
+    _lock = threading.Lock()
+
+    @classmethod
+    def setup(cls, mode: str = None) -> None:
+        if mode and mode not in (cls.RECORD, cls.REPLAY):
+            raise ValueError(f"Invalid api cassette mode: {mode!r}, expected: {cls.RECORD!r} or {cls.REPLAY!r}")
+
+        cls.mode = mode or ""
+        if cls.mode:
+            logger.info(f">> API cassette: {cls.mode!r}")
+
+        cls._name = cls.SESSION
+        cls._interactions = cls._session_interactions = cls._load(cls.SESSION) if cls.mode == cls.REPLAY else defaultdict(list)
+
+    @classmethod
+    def _path(cls, name: str):
+        return CASSETTE_DIR / f"{name}.json"
+
+    @classmethod
+    def _read(cls, path) -> list[dict]:
+        try:
+            with open(path, "r") as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return []
+
+    @classmethod
+    def _load(cls, name: str) -> dict[str, list[dict]]:
+        interactions = defaultdict(list)
+        path = cls._path(name)
+        if not os.path.exists(path):
+            logger.warning(f"[API] No cassette recorded for {name!r}")
+            return interactions
+
+        for interaction in cls._read(path):
+            interactions[interaction["key"]].append(interaction)
+        return interactions
+
+    @classmethod
+    def use(cls, name: str) -> None:
+        """Switch to the cassette of a test package, save the previous one in record mode"""
+        if not cls.mode or name == cls._name:
+            return
+
+        cls.save()
+
+        with cls._lock:
+            cls._name = name
+            cls._interactions = cls._load(name) if cls.mode == cls.REPLAY else defaultdict(list)
+
+    @classmethod
+    def save(cls) -> None:
+        """Write the current cassette, interactions recorded here replace the ones of the same requests in the file"""
+        if cls.mode != cls.RECORD or not cls._interactions:
+            return
+
+        path = cls._path(cls._name)
+        os.makedirs(path.parent, exist_ok=True)
+
+        with cls._lock:
+            recorded = dict(cls._interactions)
+
+        with file_lock(path.with_suffix(".lock")):
+            merged = [item for item in cls._read(path) if item["key"] not in recorded]
+            merged += [item for items in recorded.values() for item in items]
+
+            tmp_file = path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_file, "w") as f:
+                json.dump(merged, f, indent=2)
+            os.replace(tmp_file, path)
+
+        logger.debug(f"[API] Cassette saved: {path}")
+
+    @classmethod
+    def _template(cls, data):
+        """Replace dynamic field values with a placeholder"""
+        if isinstance(data, dict):
+            return {k: f"{{{{{k}}}}}" if k in cls.DYNAMIC_FIELDS else cls._template(v) for k, v in data.items()}
+
+        if isinstance(data, list):
+            return [cls._template(item) for item in data]
+
+        return data
+
+    @classmethod
+    def _redact(cls, data):
+        """Replace credential and token values with REDACTED"""
+        if isinstance(data, dict):
+            return {k: cls.REDACTED if k in cls.REDACTED_FIELDS else cls._redact(v) for k, v in data.items()}
+
+        if isinstance(data, list):
+            return [cls._redact(item) for item in data]
+
+        return data
+
+    @classmethod
+    def _make_key(cls, request: requests.PreparedRequest) -> str:
+        url = urlsplit(request.url)
+        endpoint = url.path.split("/api", 1)[-1]
+        params = cls._template(dict(sorted(parse_qsl(url.query))))
+        query = "&".join(f"{k}={v}" for k, v in params.items())
+        return f"{request.method} {endpoint}" + (f"?{query}" if query else "")
+
+    @classmethod
+    def record(cls, request: requests.PreparedRequest, resp: requests.Response) -> None:
+        body = resp.text
+        try:
+            body = json.dumps(cls._redact(resp.json())) if body else body
+        except ValueError:
+            pass
+
+        key = cls._make_key(request)
+        with cls._lock:
+            cls._interactions[key].append(dict(
+                key=key,
+                status=resp.status_code,
+                reason=resp.reason,
+                headers={"Content-Type": resp.headers.get("Content-Type", "application/json")},
+                body=body,
+            ))
+
+    @classmethod
+    def replay(cls, request: requests.PreparedRequest) -> requests.Response:
+        key = cls._make_key(request)
+
+        with cls._lock:
+            name, recorded = cls._name, cls._interactions.get(key)
+            if not recorded:
+                name, recorded = cls.SESSION, cls._session_interactions.get(key)
+
+            if not recorded:
+                raise CassetteMissError(f"No recorded response for {key!r} in cassette {cls._name!r}")
+
+            cursor = (name, key)
+            interaction = recorded[min(cls._cursors[cursor], len(recorded) - 1)]
+            cls._cursors[cursor] += 1
+
+        resp = requests.Response()
+        resp.status_code = interaction["status"]
+        resp.reason = interaction["reason"]
+        resp.headers = CaseInsensitiveDict(interaction["headers"])
+        resp._content = interaction["body"].encode()
+        resp.encoding = "utf-8"
+        resp.url = request.url
+        resp.request = request
+        return resp
+
+
+class CassetteAdapter(HTTPAdapter):
+    """HTTPAdapter recording responses to / replaying responses from the current Cassette"""
+
+    def send(self, request, **kwargs):
+        if Cassette.mode == Cassette.REPLAY:
+            return Cassette.replay(request)
+
+        resp = super().send(request, **kwargs)
+
+        if Cassette.mode == Cassette.RECORD:
+            Cassette.record(request, resp)
+
+        return resp
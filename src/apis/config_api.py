@@ -12,7 +12,7 @@ class ConfigAPI(BaseAPI):
         Calls the API and returns the product subscription as a single string, e.g. "PREMIUM".
         Assumes there is always exactly one subscription.
         """
-        resp = self.get(endpoint=self._endpoint)
+        resp = self.get(endpoint=self._endpoint, use_cache=True)
 
         prod_list_info = resp["productSubscriptionList"]
         subscription = prod_list_info[0]["productSubscription"]  # take the first item
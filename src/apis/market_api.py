@@ -19,21 +19,21 @@ class MarketAPI(BaseAPI):
     def __init__(self):
         super().__init__()
 
-    def get_symbol_details(self, symbol: str):
+    def get_symbol_details(self, symbol: str, use_cache=False):
         fields_to_show = ["symbol", "decimal", "pointStep", "contractSize"]
 
         logger.debug(f"[API] Get symbol details (symbol:{symbol})")
-        resp = self.get(endpoint=self._symbol_details, params={"symbol": symbol}, fields_to_show=fields_to_show)
+        resp = self.get(endpoint=self._symbol_details, params={"symbol": symbol}, fields_to_show=fields_to_show, use_cache=use_cache)
         return resp
 
-    def get_watchlist_items(self, tab: WatchListTab, get_symbols=True):
+    def get_watchlist_items(self, tab: WatchListTab, get_symbols=True, use_cache=False):
 
         _endpoint = self._watchlists
         if tab == WatchListTab.ALL or tab in WatchListTab.sub_tabs():
             _endpoint = self._all
 
         logger.debug(f"[API] Get watchlist symbols (tab:{tab.value})")
-        resp = self.get(_endpoint, params={"code": self.watchlist_map.get(tab)}, fields_to_show=["symbol", "type", "status"], truncate_len=10)
+        resp = self.get(_endpoint, params={"code": self.watchlist_map.get(tab)}, fields_to_show=["symbol", "type", "status"], truncate_len=10, use_cache=use_cache)
 
         if get_symbols:
             res = [item["symbol"] for item in resp]
@@ -1,13 +1,56 @@
+import threading
+import time
+from collections import defaultdict
+
+import requests
+
 from src.apis.api_base import BaseAPI
+from src.data.consts import FAILED_ICON_COLOR
 from src.data.enums import AssetTabs, OrderType
 from src.utils.logging_utils import logger
 
 
+class OrderIndex:
+    """
+    In-process index of placed orders by order id and by symbol.
+    Every order fetch refreshes the fetched scope (asset tab + symbol), so orders closed in between are dropped.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._by_id: dict[int | str, tuple[AssetTabs, dict]] = {}
+        self._by_symbol: dict[str, set] = defaultdict(set)
+
+    def update(self, tab: AssetTabs, orders: list[dict], symbol: str = None) -> None:
+        with self._lock:
+            scope = self._by_symbol.get(symbol, set()) if symbol else self._by_id
+            stale = [order_id for order_id in scope if self._by_id[order_id][0] == tab]
+            for order_id in stale:
+                _, order = self._by_id.pop(order_id)
+                self._by_symbol[order["symbol"]].discard(order_id)
+
+            for order in orders:
+                self._by_id[order["orderId"]] = (tab, order)
+                self._by_symbol[order["symbol"]].add(order["orderId"])
+
+    def get(self, order_id) -> dict | None:
+        item = self._by_id.get(order_id)
+        return item[1] if item else None
+
+    def get_by_symbol(self, symbol: str, tab: AssetTabs = None) -> list[dict]:
+        with self._lock:
+            items = [self._by_id[order_id] for order_id in self._by_symbol.get(symbol, ())]
+        return [order for _tab, order in items if not tab or _tab == tab]
+
+
 class OrderAPI(BaseAPI):
     _counts_endpoint = "/order/v1/counts"
     _pending_endpoint = "/order/v1/pending"
     _open_endpoint = "/order/v2"
 
+    # shared by all instances, as APIClient() is created per call in fixtures
+    index = OrderIndex()
+
     def __init__(self):
         super().__init__()
 
@@ -43,9 +86,10 @@ class OrderAPI(BaseAPI):
 
         endpoint = self._pending_endpoint if tab == AssetTabs.PENDING_ORDER else self._open_endpoint
 
-        logger.info(f"[API] Get placed order details: {tab.title()} - ({'All' if not symbol else f'symbol:{symbol}'})")
+        logger.debug(f"[API] Get placed order details: {tab.title()} - ({'All' if not symbol else f'symbol:{symbol}'})")
         resp = self.get(endpoint, {"symbol": symbol}, fields_to_show=["orderId", "symbol", "takeProfit", "stopLoss", "isEnable"])
         resp = [item for item in resp if item['symbol']]
+        self.index.update(tab, resp, symbol)
 
         if exclude_issue_symbols:
             resp = [item for item in resp if item['isEnable'] and item["closable"] and item["editable"]]
@@ -66,3 +110,46 @@ class OrderAPI(BaseAPI):
         resp = self.get_orders_details(symbol, order_type)
         order_ids = [item.get("orderId") for item in resp]
         return order_ids
+
+    def wait_for_orders(
+            self,
+            order_ids: list,
+            order_type: OrderType = OrderType.MARKET,
+            symbol: str = None,
+            timeout: float = 10,
+            interval: float = 0.2,
+            max_interval: float = 2.0
+    ) -> dict:
+        """
+        Poll placed orders until all order_ids are returned, one fetch confirms all waiting ids.
+        Polling starts with a short interval and backs off exponentially up to max_interval.
+        :param order_ids: order ids to confirm
+        :param order_type: order type (Market: open positions, others: pending orders)
+        :param symbol: specific symbol of the orders, if not provided, fetch all symbols
+        :param timeout: max total waiting time (in seconds)
+        :return: Return order details by order id
+        """
+        waiting = set(order_ids)
+        found = {}
+        deadline = time.monotonic() + timeout
+
+        while True:
+            self.get_orders_details(symbol, order_type, exclude_issue_symbols=False)
+
+            for order_id in list(waiting):
+                order_details = self.index.get(order_id)
+                if order_details:
+                    found[order_id] = order_details
+                    waiting.discard(order_id)
+
+            if not waiting:
+                return found
+
+            if time.monotonic() + interval > deadline:
+                error_msg = f"[API] {FAILED_ICON_COLOR} Failed to get order details - order_ids: {sorted(waiting)}"
+                logger.error(error_msg)
+                raise requests.RequestException(error_msg)
+
+            logger.debug(f"[API] {len(waiting)} orders not returned yet, retry in {interval:.1f}s")
+            time.sleep(interval)
+            interval = min(interval * 2, max_interval)
@@ -0,0 +1,118 @@
+import threading
+import time
+from collections import defaultdict
+
+from src.data.enums import TradeType
+from src.utils import DotDict
+from src.utils.format_utils import format_with_decimal
+from src.utils.logging_utils import logger
+
+
+class QuoteService:
+    """
+    Symbol specs and live quotes used to build order payloads, shared by every TradeAPI instance.
+    - Static specs (pointStep, contractSize) are kept for SPEC_TTL.
+    - Prices (ask/bid) expire after PRICE_TTL, and are refreshed on demand after a rejected order.
+    - Order placement outcomes are counted, so rejection and retry rates can be followed across runs.
+    """
+
+    SPEC_TTL = 60 * 60
+    PRICE_TTL = 5
+
+    _specs: dict[str, tuple[float, DotDict]] = {}
+    _prices: dict[str, tuple[float, dict]] = {}
+    _symbol_locks: dict[str, threading.Lock] = defaultdict(threading.Lock)
+    _lock = threading.Lock()
+    _stats = DotDict(quote_fetches=0, placed=0, rejected=0, retried=0)
+
+    @staticmethod
+    def _fetch(symbol: str) -> dict:
+        from src.apis.market_api import MarketAPI  # avoid circular import
+
+        # bypass the response cache, its TTL is meant for static details
+        return MarketAPI().get_symbol_details(symbol, use_cache=False)
+
+    @staticmethod
+    def _format_price(price, point_step):
+        return float(format_with_decimal(price, point_step)) if price else price
+
+    @classmethod
+    def _load(cls, symbol: str, refresh_price=False) -> None:
+        """Fetch symbol details once for all threads waiting on the same symbol, store both specs and prices"""
+        with cls._lock:
+            symbol_lock = cls._symbol_locks[symbol]
+
+        with symbol_lock:
+            now = time.monotonic()
+            spec_entry, price_entry = cls._specs.get(symbol), cls._prices.get(symbol)
+            spec_fresh = spec_entry and spec_entry[0] > now
+            price_fresh = price_entry and price_entry[0] > now and not refresh_price
+
+            if spec_fresh and price_fresh:
+                return
+
+            resp = cls._fetch(symbol)
+            now = time.monotonic()
+
+            with cls._lock:
+                cls._stats.quote_fetches += 1
+                cls._specs[symbol] = (now + cls.SPEC_TTL, DotDict(point_step=resp["pointStep"], contract_size=resp["contractSize"]))
+                cls._prices[symbol] = (now + cls.PRICE_TTL, {
+                    TradeType.BUY: cls._format_price(resp["ask"], resp["pointStep"]),
+                    TradeType.SELL: cls._format_price(resp["bid"], resp["pointStep"]),
+                })
+
+    @classmethod
+    def get_specs(cls, symbol: str) -> DotDict:
+        """Return static symbol specs: point_step, contract_size"""
+        entry = cls._specs.get(symbol)
+        if not entry or entry[0] <= time.monotonic():
+            cls._load(symbol)
+        return cls._specs[symbol][1]
+
+    @classmethod
+    def get_prices(cls, symbol: str, refresh=False) -> dict:
+        """
+        Return current {TradeType.BUY: ask, TradeType.SELL: bid} prices of a symbol
+        :param refresh: Force fetching a new quote (e.g. after the order was rejected)
+        """
+        entry = cls._prices.get(symbol)
+        if refresh or not entry or entry[0] <= time.monotonic():
+            cls._load(symbol, refresh_price=refresh)
+        return cls._prices[symbol][1]
+
+    @classmethod
+    def get_price(cls, symbol: str, trade_type: TradeType, refresh=False) -> float:
+        return cls.get_prices(symbol, refresh)[trade_type]
+
+    @classmethod
+    def record_order(cls, accepted: bool, attempt: int = 0) -> None:
+        """Count order placement outcome, attempt is the 0-based retry index of the placement"""
+        with cls._lock:
+            if accepted:
+                cls._stats.placed += 1
+                cls._stats.retried += int(attempt > 0)
+            else:
+                cls._stats.rejected += 1
+
+    @classmethod
+    def stats(cls) -> DotDict:
+        stats = DotDict(cls._stats)
+        attempts = stats.placed + stats.rejected
+        stats.rejection_rate = stats.rejected / attempts if attempts else 0
+        return stats
+
+    @classmethod
+    def clear(cls) -> None:
+        with cls._lock:
+            cls._specs.clear()
+            cls._prices.clear()
+
+    @classmethod
+    def log_stats(cls) -> None:
+        stats = cls.stats()
+        if stats.placed or stats.rejected:
+            logger.debug(
+                f"[API] Quotes - fetches: {stats.quote_fetches}, orders placed: {stats.placed}, "
+                f"rejected: {stats.rejected} ({stats.rejection_rate:.0%}), placed after retry: {stats.retried}"
+            )
@@ -0,0 +1,241 @@
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
+
+import requests
+
+from src.data.consts import RATE_LIMIT_FILE, WARNING_ICON
+from src.utils import DotDict
+from src.utils.common_utils import file_lock
+from src.utils.logging_utils import logger
+
+
+def _endpoint_family(endpoint: str) -> str:
+    """/trade/v2/market -> trade"""
+    return (endpoint or "").strip("/").split("/", 1)[0] or "default"
+
+
+class CircuitOpenError(requests.RequestException):
+    """Raised without sending the request while the circuit of an endpoint family is open"""
+
+
+class RetryBudgetExceeded(requests.RequestException):
+    """Raised instead of retrying once the current test used up its retry budget"""
+
+
+class RateLimiter:
+    """
+    Token bucket rate limiter per endpoint family (first path segment of the endpoint), shared by all threads.
+    When running with xdist, buckets are stored in RATE_LIMIT_FILE so all worker processes share the same rate.
+    Each file access takes a batch of tokens (BATCH_SECONDS of the rate), the next requests of the worker use it
+    without touching the file. Tokens of a batch left unused after BATCH_TTL are dropped.
+    Endpoint families answering with Retry-After are paused for all callers until the given time
+    (other workers may still send what is left of their batch).
+    """
+
+    # endpoint family: (requests per second, burst size)
+    RATES = {
+        "trade": (5, 10),
+        "order": (10, 20),
+        "default": (20, 40),
+    }
+
+    BATCH_SECONDS = 0.5
+    BATCH_TTL = 1
+
+    shared = bool(os.environ.get("PYTEST_XDIST_WORKER"))
+
+    _buckets: dict[str, dict] = {}
+    _batches: dict[str, dict] = {}  # shared mode, tokens taken by this worker: family: {tokens, expires}
+    _lock = threading.Lock()
+    _lock_file = RATE_LIMIT_FILE.with_suffix(".lock")
+    _stats = DotDict(throttled=0, waited=0.0)
+
+    @classmethod
+    @contextmanager
+    def _state(cls):
+        """Yield buckets for update, loaded from/ saved to RATE_LIMIT_FILE in shared mode"""
+        with cls._lock:
+            if not cls.shared:
+                yield cls._buckets
+                return
+
+            with file_lock(cls._lock_file):
+                try:
+                    with open(RATE_LIMIT_FILE, "r") as f:
+                        buckets = json.load(f)
+                except (FileNotFoundError, ValueError):
+                    buckets = {}
+
+                yield buckets
+
+                tmp_file = RATE_LIMIT_FILE.with_suffix(".tmp")
+                with open(tmp_file, "w") as f:
+                    json.dump(buckets, f)
+                os.replace(tmp_file, RATE_LIMIT_FILE)
+
+    @classmethod
+    def _take(cls, family: str) -> float:
+        """Take a token, return 0 on success or the time to wait before the next try"""
+        rate, burst = cls.RATES.get(family, cls.RATES["default"])
+        now = time.time()
+
+        if cls.shared:
+            with cls._lock:
+                batch = cls._batches.get(family)
+                if batch and batch["tokens"] >= 1 and batch["expires"] > now:
+                    batch["tokens"] -= 1
+                    return 0
+
+        with cls._state() as buckets:
+            bucket = buckets.setdefault(family, dict(tokens=burst, updated=now, blocked_until=0))
+
+            if bucket["blocked_until"] > now:
+                return bucket["blocked_until"] - now
+
+            bucket["tokens"] = min(burst, bucket["tokens"] + (now - bucket["updated"]) * rate)
+            bucket["updated"] = now
+
+            batch_size = max(1, int(rate * cls.BATCH_SECONDS)) if cls.shared else 1
+            if bucket["tokens"] >= 1:
+                taken = min(int(bucket["tokens"]), batch_size)
+                bucket["tokens"] -= taken
+                if taken > 1:
+                    cls._batches[family] = dict(tokens=taken - 1, expires=now + cls.BATCH_TTL)
+                return 0
+
+            # throttled: wait for a whole batch rather than coming back to the file for each token
+            return (batch_size - bucket["tokens"]) / rate
+
+    @classmethod
+    def acquire(cls, endpoint: str) -> None:
+        """Block until a request to the endpoint is allowed"""
+        family = _endpoint_family(endpoint)
+
+        while wait := cls._take(family):
+            with cls._lock:
+                cls._stats.throttled += 1
+                cls._stats.waited += wait
+            time.sleep(wait)
+
+    @classmethod
+    def block(cls, endpoint: str, seconds: float) -> None:
+        """Pause all requests to the endpoint family, e.g. for the Retry-After time sent by the server"""
+        family = _endpoint_family(endpoint)
+        with cls._state() as buckets:
+            bucket = buckets.setdefault(family, dict(tokens=0, updated=time.time(), blocked_until=0))
+            bucket["blocked_until"] = max(bucket["blocked_until"], time.time() + seconds)
+            cls._batches.pop(family, None)
+
+        logger.warning(f"[API] {WARNING_ICON} Server asked to slow down, pausing /{family} requests for {seconds:.1f}s")
+
+    @staticmethod
+    def get_retry_after(resp) -> float:
+        """Return Retry-After of a throttled (429/503) response in seconds, 0 if not present"""
+        if getattr(resp, "status_code", None) not in (429, 503):
+            return 0
+
+        value = resp.headers.get("Retry-After")
+        if not value:
+            return 0
+
+        try:
+            return max(float(value), 0)
+        except ValueError:
+            try:
+                return max(parsedate_to_datetime(value).timestamp() - time.time(), 0)
+            except (TypeError, ValueError):
+                return 0
+
+    @classmethod
+    def log_stats(cls) -> None:
+        if cls._stats.throttled:
+            logger.debug(f"[API] Rate limiter - throttled: {cls._stats.throttled} times, waited: {cls._stats.waited:.1f}s")
+
+
+class CircuitBreaker:
+    """
+    Fail fast for an endpoint family that keeps failing (5xx or connection errors).
+    After FAILURE_THRESHOLD consecutive failures the circuit opens and requests raise CircuitOpenError,
+    after RESET_TIMEOUT one trial request is let through, its success closes the circuit again.
+    """
+
+    FAILURE_THRESHOLD = 5
+    RESET_TIMEOUT = 30
+
+    _failures: dict[str, int] = defaultdict(int)
+    _opened_at: dict[str, float] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def check(cls, endpoint: str) -> None:
+        family = _endpoint_family(endpoint)
+
+        with cls._lock:
+            opened_at = cls._opened_at.get(family)
+            if opened_at is None:
+                return
+
+            now = time.monotonic()
+            if now - opened_at < cls.RESET_TIMEOUT:
+                raise CircuitOpenError(
+                    f"[API] Circuit open for /{family} after {cls._failures[family]} consecutive failures, "
+                    f"retry in {cls.RESET_TIMEOUT - (now - opened_at):.0f}s"
+                )
+
+            # half-open: let this request through, the others keep failing fast until it completes
+            cls._opened_at[family] = now
+
+    @classmethod
+    def record(cls, endpoint: str, success: bool) -> None:
+        family = _endpoint_family(endpoint)
+
+        with cls._lock:
+            if success:
+                cls._failures.pop(family, None)
+                cls._opened_at.pop(family, None)
+                return
+
+            cls._failures[family] += 1
+            if cls._failures[family] >= cls.FAILURE_THRESHOLD:
+                if family not in cls._opened_at:
+                    logger.warning(f"[API] {WARNING_ICON} Circuit opened for /{family} after {cls._failures[family]} consecutive failures")
+                cls._opened_at[family] = time.monotonic()
+
+
+class RetryBudget:
+    """
+    Retries and backoff sleep time allowed per test, reset at the start of each test.
+    A backoff longer than the budget left (e.g. Retry-After over MAX_DELAY) raises at once instead of waiting:
+    the request could not be retried within the budget anyway.
+    """
+
+    MAX_RETRIES = 10
+    MAX_DELAY = 30
+
+    _retries = 0
+    _delay = 0.0
+    _lock = threading.Lock()
+
+    @classmethod
+    def reset(cls) -> None:
+        with cls._lock:
+            cls._retries = 0
+            cls._delay = 0.0
+
+    @classmethod
+    def consume(cls, delay: float) -> None:
+        """Take one retry sleeping for delay seconds from the budget, raise RetryBudgetExceeded if not enough left"""
+        with cls._lock:
+            if cls._retries >= cls.MAX_RETRIES or cls._delay + delay > cls.MAX_DELAY:
+                raise RetryBudgetExceeded(
+                    f"[API] Retry budget exceeded for this test - retries: {cls._retries}/{cls.MAX_RETRIES}, "
+                    f"backoff: {cls._delay:.1f}s/{cls.MAX_DELAY}s, next backoff: {delay:.1f}s"
+                )
+
+            cls._retries += 1
+            cls._delay += delay
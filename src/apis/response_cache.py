@@ -0,0 +1,102 @@
+import copy
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable
+
+from src.utils import DotDict
+from src.utils.logging_utils import logger
+
+
+class ResponseCache:
+    """
+    TTL cache for the parsed results of idempotent GET endpoints, shared by every BaseAPI instance.
+    - Opt-in: only GETs with use_cache=True on endpoints registered in TTL are cached.
+      Data changed from the UI (watchlists, account) is never registered, as UI writes cannot invalidate it.
+    - Writes on related endpoints (POST/PUT/PATCH/DELETE) drop the cached entries listed in INVALIDATE.
+    - Concurrent identical requests are coalesced into one network call.
+    - Every caller, the one fetching included, gets its own copy of the result: changing it leaves the cache intact.
+    """
+
+    # endpoint: time to live (in seconds)
+    TTL = {
+        "/market/v1/symbol/detail": 30,
+        "/market/v1/symbols/all": 300,
+        "/config/v1/company/user": 600,
+    }
+
+    # mutated endpoint: cached endpoints to invalidate
+    INVALIDATE = {
+        "/user/v1/preference": ["/config/v1/company/user"],
+    }
+
+    _entries: dict[tuple, tuple[float, Any]] = {}
+    _inflight: dict[tuple, Future] = {}
+    _lock = threading.Lock()
+    _stats = DotDict(hits=0, misses=0, coalesced=0)
+
+    @classmethod
+    def is_cacheable(cls, endpoint: str) -> bool:
+        return endpoint in cls.TTL
+
+    @staticmethod
+    def _make_key(endpoint: str, params: dict = None, headers: dict = None) -> tuple:
+        params = tuple(sorted((k, str(v)) for k, v in (params or {}).items() if v is not None))
+        return (headers or {}).get("Authorization", ""), endpoint, params
+
+    @classmethod
+    def get_or_fetch(cls, endpoint: str, params: dict, headers: dict, fetch: Callable[[], Any]) -> Any:
+        """Return a copy of the fresh cached result, or fetch it once for all concurrent callers of the same key"""
+        key = cls._make_key(endpoint, params, headers)
+
+        with cls._lock:
+            entry = cls._entries.get(key)
+            if entry and entry[0] > time.monotonic():
+                cls._stats.hits += 1
+                logger.debug(f"[API] Cache hit: {endpoint} {dict(key[2]) or ''}")
+                return copy.deepcopy(entry[1])
+
+            future = cls._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = cls._inflight[key] = Future()
+                cls._stats.misses += 1
+            else:
+                cls._stats.coalesced += 1
+
+        if not owner:
+            return copy.deepcopy(future.result())
+
+        try:
+            res = fetch()
+            if res is not None:
+                with cls._lock:
+                    cls._entries[key] = (time.monotonic() + cls.TTL[endpoint], res)
+            future.set_result(res)
+            return copy.deepcopy(res)
+
+        except Exception as e:
+            future.set_exception(e)
+            raise
+
+        finally:
+            with cls._lock:
+                cls._inflight.pop(key, None)
+
+    @classmethod
+    def invalidate(cls, endpoint: str) -> None:
+        """Drop cached entries related to a mutated endpoint"""
+        targets = set(cls.INVALIDATE.get(endpoint, [])) | {endpoint}
+        with cls._lock:
+            for key in [key for key in cls._entries if key[1] in targets]:
+                del cls._entries[key]
+
+    @classmethod
+    def clear(cls) -> None:
+        with cls._lock:
+            cls._entries.clear()
+
+    @classmethod
+    def log_stats(cls) -> None:
+        if cls._stats.hits or cls._stats.misses:
+            logger.debug(f"[API] Response cache - hits: {cls._stats.hits}, misses: {cls._stats.misses}, coalesced: {cls._stats.coalesced}")
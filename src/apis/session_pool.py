@@ -0,0 +1,83 @@
+import threading
+from http.cookiejar import DefaultCookiePolicy
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from src.apis.cassette import Cassette, CassetteAdapter
+from src.utils import DotDict
+from src.utils.logging_utils import logger
+
+
+class SessionPool:
+    """
+    Process-wide keep-alive sessions shared by every BaseAPI instance.
+    Sessions are keyed by base URL only, so creating a new APIClient() (or logging in again)
+    reuses the already opened TCP/TLS connections instead of opening new sockets.
+    Auth headers are sent with each request and cookies are not kept, sessions hold no user state.
+    """
+
+    POOL_CONNECTIONS = 10
+    POOL_MAXSIZE = 20
+
+    _sessions: dict[str, requests.Session] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_session(cls, base_url: str) -> requests.Session:
+        """Return the shared session for this base url, create it on first use"""
+        session = cls._sessions.get(base_url)
+        if session is None:
+            with cls._lock:
+                session = cls._sessions.get(base_url)
+                if session is None:
+                    session = cls._create_session()
+                    cls._sessions[base_url] = session
+
+        return session
+
+    @classmethod
+    def _create_session(cls) -> requests.Session:
+        """Create a session with connection pooling"""
+        session = requests.Session()
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+
+        adapter_cls = CassetteAdapter if Cassette.mode else HTTPAdapter
+        adapter = adapter_cls(pool_connections=cls.POOL_CONNECTIONS, pool_maxsize=cls.POOL_MAXSIZE)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+
+        return session
+
+    @classmethod
+    def stats(cls) -> DotDict:
+        """Return how many requests were sent, how many connections were opened and reused"""
+        requests_sent = opened = 0
+
+        for session in list(cls._sessions.values()):
+            for adapter in set(session.adapters.values()):
+                pools = adapter.poolmanager.pools
+                for pool_key in pools.keys():
+                    pool = pools.get(pool_key)
+                    if pool:
+                        requests_sent += pool.num_requests
+                        opened += pool.num_connections
+
+        return DotDict(sessions=len(cls._sessions), requests=requests_sent, opened=opened, reused=max(requests_sent - opened, 0))
+
+    @classmethod
+    def log_stats(cls) -> None:
+        stats = cls.stats()
+        if stats.requests:
+            logger.debug(
+                f"[API] Connection pool - sessions: {stats.sessions}, requests: {stats.requests}, "
+                f"opened: {stats.opened}, reused: {stats.reused} ({stats.reused / stats.requests:.0%})"
+            )
+
+    @classmethod
+    def close_all(cls) -> None:
+        """Close all shared sessions, called once at the end of the test session"""
+        with cls._lock:
+            for session in cls._sessions.values():
+                session.close()
+            cls._sessions.clear()
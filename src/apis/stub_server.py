@@ -0,0 +1,301 @@
+"""
+Local stand-in for the WT backend, used to load-test and profile the API layer offline.
+
+Run:
+    python -m src.apis.stub_server --port 8080 --latency 50 --error-rate 0.05
+
+Then point the framework to it with: --url=http://localhost:8080
+"""
+import argparse
+import itertools
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qsl
+
+from src.apis.auth_api import AuthAPI
+from src.utils.logging_utils import logger
+
+SYMBOLS = [
+    dict(symbol="BTCUSD", type="CRYPTO", ask=65000.12, bid=64990.55, decimal=2, pointStep=0.01, contractSize=1),
+    dict(symbol="ETHUSD", type="CRYPTO", ask=3200.45, bid=3199.15, decimal=2, pointStep=0.01, contractSize=1),
+    dict(symbol="US30", type="INDEX", ask=39000.5, bid=38998.5, decimal=1, pointStep=0.1, contractSize=1),
+    dict(symbol="AAPL", type="SHARE", ask=190.12, bid=190.02, decimal=2, pointStep=0.01, contractSize=1),
+    dict(symbol="EURUSD", type="FOREX", ask=1.08523, bid=1.08511, decimal=5, pointStep=0.00001, contractSize=100000),
+    dict(symbol="XAUUSD", type="COM", ask=2350.25, bid=2349.85, decimal=2, pointStep=0.01, contractSize=100),
+]
+
+
+class StubState:
+    """In-memory backend state shared by all request handlers"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.order_ids = itertools.count(int(time.time()))
+        self.orders: dict[int, dict] = {}  # orderId: order (open positions + pending orders)
+        self.starred: list[str] = []
+        self.unread_notifications = 0
+        self.preferences: dict[str, str] = {}
+
+    def place_order(self, payload: dict, is_market: bool) -> dict:
+        details = next((s for s in SYMBOLS if s["symbol"] == payload.get("symbol")), None)
+        if not details:
+            raise KeyError(f"Symbol not found: {payload.get('symbol')}")
+
+        with self.lock:
+            order_id = next(self.order_ids)
+            is_buy = payload.get("orderType", 0) % 2 == 0  # even codes are BUY, see ObjTrade.get_order_type_map
+            open_price = details["ask"] if is_buy else details["bid"]
+            self.orders[order_id] = dict(
+                orderId=order_id,
+                symbol=details["symbol"],
+                orderType=payload.get("orderType"),
+                lotSize=payload.get("lotSize"),
+                fillPolicy=payload.get("fillPolicy", 0),
+                openPrice=open_price if is_market else payload.get("price"),
+                currentPrice=open_price,
+                stopLoss=payload.get("stopLoss"),
+                takeProfit=payload.get("takeProfit"),
+                isMarket=is_market,
+                isEnable=True, closable=True, editable=True,
+            )
+            self.unread_notifications += 1
+            return dict(clOrdId=order_id)
+
+    def get_orders(self, is_market: bool, symbol: str = None) -> list[dict]:
+        with self.lock:
+            return [
+                order for order in self.orders.values()
+                if order["isMarket"] == is_market and (not symbol or order["symbol"] == symbol)
+            ]
+
+    def remove_orders(self, order_ids) -> int:
+        with self.lock:
+            removed = [self.orders.pop(order_id, None) for order_id in order_ids]
+            self.unread_notifications += len([item for item in removed if item])
+            return len([item for item in removed if item])
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    # set by WTStubServer
+    state: StubState = None
+    latency: float = 0
+    error_rate: float = 0
+
+    # ------------------------ HELPERS ------------------------ #
+    def log_message(self, fmt, *args):
+        logger.debug(f"[Stub] {fmt % args}")
+
+    def _send(self, result=None, status=200, message=None, headers: dict = None):
+        body = json.dumps({"result": result} if message is None else {"message": message}).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_json(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return None
+        return json.loads(self.rfile.read(length))
+
+    def _handle(self, method: str):
+        url = urlsplit(self.path)
+        path = url.path.removeprefix("/api")
+        params = dict(parse_qsl(url.query))
+        payload = self._read_json() if method in ("POST", "PUT", "PATCH") else None
+
+        if self.latency:
+            time.sleep(random.uniform(self.latency * 0.5, self.latency * 1.5))
+
+        if self.error_rate and random.random() < self.error_rate:
+            return self._send(status=503, message="Service temporarily unavailable", headers={"Retry-After": "1"})
+
+        route = self.routes().get((method, path))
+        if not route:
+            return self._send(status=404, message=f"No route for {method} {path}")
+
+        try:
+            route(params, payload)
+        except KeyError as e:
+            self._send(status=400, message=str(e))
+        except Exception as e:
+            logger.error(f"[Stub] {method} {path} failed: {type(e).__name__}: {e}")
+            self._send(status=500, message=f"{type(e).__name__}: {e}")
+
+    def do_GET(self):
+        self._handle("GET")
+
+    def do_POST(self):
+        self._handle("POST")
+
+    def do_PUT(self):
+        self._handle("PUT")
+
+    def do_PATCH(self):
+        self._handle("PATCH")
+
+    def do_DELETE(self):
+        self._handle("DELETE")
+
+    # ------------------------ ROUTES ------------------------ #
+    def routes(self) -> dict:
+        login_routes = {
+            ("POST", endpoint): self.login
+            for endpoints in AuthAPI.endpoints.values() for endpoint in endpoints.values()
+        }
+        return login_routes | {
+            ("POST", "/trade/v2/market"): lambda params, payload: self.post_order(payload, is_market=True),
+            ("POST", "/trade/v2/limit"): lambda params, payload: self.post_order(payload, is_market=False),
+            ("PUT", "/trade/v1/bulk"): self.bulk_close,
+            ("PUT", "/trade/v1/limit/bulk"): self.bulk_close,
+            ("GET", "/order/v2"): lambda params, payload: self._send(self.state.get_orders(True, params.get("symbol"))),
+            ("GET", "/order/v1/pending"): lambda params, payload: self._send(self.state.get_orders(False, params.get("symbol"))),
+            ("GET", "/order/v1/counts"): self.order_counts,
+            ("GET", "/market/v1/symbol/detail"): self.symbol_detail,
+            ("GET", "/market/v1/symbols/all"): lambda params, payload: self._send(self._symbol_items()),
+            ("GET", "/market/v1/watchlists"): self.watchlists,
+            ("POST", "/market/v1/watchlist"): self.star_symbol,
+            ("DELETE", "/market/v1/watchlist"): self.unstar_symbol,
+            ("GET", "/statistics/v1/account"): self.account_statistics,
+            ("GET", "/notification/v1/summary"): self.notification_summary,
+            ("GET", "/user/v1/account"): self.user_account,
+            ("PATCH", "/user/v1/preference"): self.patch_preference,
+            ("PATCH", "/user/v1/order/hide/preference"): lambda params, payload: self._send(payload),
+            ("GET", "/config/v1/company/user"): lambda params, payload: self._send({"productSubscriptionList": [{"productSubscription": "PREMIUM"}]}),
+        }
+
+    def login(self, params, payload):
+        self._send({"token": f"stub-token-{payload.get('userId', 'user')}"})
+
+    def post_order(self, payload, is_market):
+        if not payload or not payload.get("lotSize"):
+            return self._send(status=400, message="Invalid volume")
+        self._send(self.state.place_order(payload, is_market))
+
+    def bulk_close(self, params, payload):
+        orders = payload.get("orderList", []) if isinstance(payload, dict) else payload or []
+        closed = self.state.remove_orders([item.get("orderId") for item in orders])
+        self._send({"success": closed, "failed": len(orders) - closed})
+
+    def order_counts(self, params, payload):
+        symbol = params.get("symbol")
+        self._send({
+            "marketOrderCounts": len(self.state.get_orders(True, symbol)),
+            "pendingOrderCounts": len(self.state.get_orders(False, symbol)),
+        })
+
+    @staticmethod
+    def _symbol_items():
+        return [dict(symbol=s["symbol"], type=s["type"], status="TRADING") for s in SYMBOLS]
+
+    def symbol_detail(self, params, payload):
+        details = next((s for s in SYMBOLS if s["symbol"] == params.get("symbol")), None)
+        if not details:
+            return self._send(status=400, message=f"Symbol not found: {params.get('symbol')}")
+
+        self._send(details | dict(enable=True, tradable=True, tradableExeMode=True, holiday=False))
+
+    def watchlists(self, params, payload):
+        if params.get("code") == "MY_WATCHLIST":
+            return self._send([item for item in self._symbol_items() if item["symbol"] in self.state.starred])
+        self._send(self._symbol_items()[:3])
+
+    def star_symbol(self, params, payload):
+        symbol = (payload or {}).get("symbol")
+        if symbol and symbol not in self.state.starred:
+            self.state.starred.append(symbol)
+        self._send({"symbol": symbol})
+
+    def unstar_symbol(self, params, payload):
+        symbol = params.get("symbol")
+        if symbol in self.state.starred:
+            self.state.starred.remove(symbol)
+        self._send({"symbol": symbol})
+
+    def account_statistics(self, params, payload):
+        self._send({
+            "accountBalance": dict(
+                balance=100000, margin=0, profitLoss=0, freeMargin=100000, equity=100000,
+                marginLevel=0, marginStopout=50, marginCall=100
+            ),
+            "realisedProfit": 0, "withdrawal": 0, "deposit": 100000, "credit": 0,
+        })
+
+    def notification_summary(self, params, payload):
+        self._send([{"notificationType": "ORDER", "unread": self.state.unread_notifications}])
+
+    def user_account(self, params, payload):
+        self._send({"tradingAccounts": [dict(metatraderId=1000001, accountName="Stub Account", accountType="LIVE", baseCurrency="USD", leverage=100)]})
+
+    def patch_preference(self, params, payload):
+        self.state.preferences[payload.get("type")] = payload.get("value")
+        self._send(payload)
+
+
+class WTStubServer:
+    """
+    Threaded local HTTP server implementing the endpoints used by src/apis.
+    :param latency: Average response latency (in seconds), actual latency is randomized ±50%
+    :param error_rate: Ratio of requests answered with 503 + Retry-After (0 - 1)
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, latency: float = 0, error_rate: float = 0):
+        handler = type("Handler", (StubHandler,), dict(state=StubState(), latency=latency, error_rate=error_rate))
+        self._server = ThreadingHTTPServer((host, port), handler)
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def state(self) -> StubState:
+        return self._server.RequestHandlerClass.state
+
+    @property
+    def url(self) -> str:
+        """Base url to use with --url option or RuntimeConfig.url"""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "WTStubServer":
+        """Start serving in a background thread"""
+        self._thread = threading.Thread(target=self._server.serve_forever, name="wt-stub-server", daemon=True)
+        self._thread.start()
+        logger.info(f"- WT stub server started at {self.url}")
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local WT backend stand-in server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0, help="Average response latency in milliseconds")
+    parser.add_argument("--error-rate", type=float, default=0, help="Ratio of requests failing with 503 (0 - 1)")
+    args = parser.parse_args()
+
+    server = WTStubServer(args.host, args.port, latency=args.latency / 1000, error_rate=args.error_rate)
+    print(f"WT stub server listening on {server.url} (latency: {args.latency}ms, error rate: {args.error_rate})")
+    try:
+        server._server.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+import base64
+import json
+import os
+import time
+
+from src.data.consts import TOKEN_CACHE_FILE
+from src.utils.common_utils import file_lock
+from src.utils.logging_utils import logger
+
+
+class TokenCache:
+    """
+    On-disk auth token cache shared across test sessions, xdist workers and CI shards on the same machine.
+    Tokens are keyed by tenant, client, server, account type and user, and are considered expired
+    REFRESH_MARGIN seconds before their real expiry so they get refreshed proactively.
+    """
+
+    DEFAULT_TTL = 30 * 60  # used when expiry cannot be read from the token
+    REFRESH_MARGIN = 5 * 60
+
+    _lock_file = TOKEN_CACHE_FILE.with_suffix(".lock")
+
+    @staticmethod
+    def make_key(*parts) -> str:
+        return "|".join(str(part).lower() for part in parts)
+
+    @classmethod
+    def _get_expiry(cls, token: str) -> float:
+        """Read exp claim from a JWT token, fall back to DEFAULT_TTL"""
+        try:
+            payload = token.split(".")[1]
+            payload += "=" * (-len(payload) % 4)
+            return float(json.loads(base64.urlsafe_b64decode(payload))["exp"])
+        except (IndexError, KeyError, TypeError, ValueError):
+            return time.time() + cls.DEFAULT_TTL
+
+    @classmethod
+    def refresh_at(cls, token: str) -> float:
+        """Time from which the token is considered expired and gets refreshed"""
+        return cls._get_expiry(token) - cls.REFRESH_MARGIN
+
+    @classmethod
+    def _read(cls) -> dict:
+        try:
+            with open(TOKEN_CACHE_FILE, "r") as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    @classmethod
+    def _write(cls, data: dict) -> None:
+        tmp_file = TOKEN_CACHE_FILE.with_suffix(".tmp")
+        with open(os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), "w") as f:
+            json.dump(data, f)
+        os.replace(tmp_file, TOKEN_CACHE_FILE)
+
+    @classmethod
+    def lock(cls):
+        """Inter-process lock, so only one worker logs in while the others wait for its token"""
+        return file_lock(cls._lock_file)
+
+    @classmethod
+    def get(cls, key: str) -> str | None:
+        """Return the cached token if it is not about to expire"""
+        entry = cls._read().get(key)
+        if entry and entry["expires_at"] - cls.REFRESH_MARGIN > time.time():
+            return entry["token"]
+        return None
+
+    @classmethod
+    def set(cls, key: str, token: str) -> None:
+        data = cls._read()
+        data = {k: v for k, v in data.items() if v["expires_at"] > time.time()}  # drop expired tokens
+        data[key] = dict(token=token, expires_at=cls._get_expiry(token))
+        cls._write(data)
+        logger.debug(f"[API] Token cached, expires in {int(data[key]['expires_at'] - time.time())}s")
+
+    @classmethod
+    def invalidate(cls, key: str, token: str = None) -> None:
+        """Remove cached token, only if it is still the given (rejected) token"""
+        data = cls._read()
+        if key in data and (token is None or data[key]["token"] == token):
+            del data[key]
+            cls._write(data)
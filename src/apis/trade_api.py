@@ -1,5 +1,6 @@
 import random
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
 import requests
@@ -7,11 +8,11 @@ import requests
 from src.apis.api_base import BaseAPI
 from src.apis.market_api import MarketAPI
 from src.apis.order_api import OrderAPI
+from src.apis.quote_service import QuoteService
 from src.data.consts import CHECK_ICON_COLOR, WARNING_ICON, FAILED_ICON_COLOR
 from src.data.enums import Expiry, TradeType, OrderType, SLTPType, AssetTabs
 from src.data.objects.trade_obj import ObjTrade
 from src.utils import DotDict
-from src.utils.format_utils import format_with_decimal
 from src.utils.logging_utils import logger
 from src.utils.trading_utils import calculate_trading_params
 
@@ -23,28 +24,15 @@ class TradeAPI(BaseAPI):
     _bulk_open_order = "/trade/v1/bulk"
     _bulk_pending_order = "/trade/v1/limit/bulk"
 
-    _symbol_details = DotDict()
-
     def __init__(self):
         super().__init__()
         self._order_api = OrderAPI()
         self._market_api = MarketAPI()
 
-    def _get_symbol_details(self, symbol) -> DotDict:
-        """Get and cache symbol details for calculating trade parameters."""
-        if symbol not in self._symbol_details:
-            resp = self._market_api.get_symbol_details(symbol=symbol)
-
-            self._symbol_details[symbol] = DotDict({
-                "point_step": resp["pointStep"],
-                "contract_size": resp["contractSize"],
-                "current_price": {
-                    TradeType.BUY: float(format_with_decimal(resp["ask"], resp["pointStep"])) if resp["ask"] else resp["ask"],
-                    TradeType.SELL: float(format_with_decimal(resp["bid"], resp["pointStep"])) if resp["bid"] else resp["bid"]
-                }
-            })
-
-        return self._symbol_details[symbol]
+    @staticmethod
+    def _get_symbol_details(symbol, refresh_price=False) -> DotDict:
+        """Get symbol specs and current price for calculating trade parameters."""
+        return DotDict(QuoteService.get_specs(symbol), current_price=QuoteService.get_prices(symbol, refresh=refresh_price))
 
     @staticmethod
     def _get_order_type_code(order_type: OrderType, trade_type: TradeType) -> int:
@@ -61,14 +49,14 @@ class TradeAPI(BaseAPI):
         tomorrow_9pm = now.replace(hour=21, minute=0, second=0, microsecond=0) + timedelta(days=move_days)
         return int(tomorrow_9pm.timestamp() * 1000)
 
-    def _build_payload(self, trade_object: ObjTrade) -> dict:
-        """Build the API payload for placing an order."""
+    def _build_payload(self, trade_object: ObjTrade, refresh_price=False) -> dict:
+        """Build the API payload for placing an order, refresh_price forces a new quote (e.g. after a rejection)."""
         symbol = trade_object.symbol
         trade_type = trade_object.trade_type
         order_type = trade_object.order_type
 
         # Get symbol details and current price
-        symbol_details = self._get_symbol_details(symbol)
+        symbol_details = self._get_symbol_details(symbol, refresh_price)
         current_price = symbol_details.current_price[trade_type]
 
         # Calculate trade parameters
@@ -99,9 +87,20 @@ class TradeAPI(BaseAPI):
         # Remove None values
         return {k: v for k, v in payload.items() if v is not None}
 
+    @staticmethod
+    def _get_placed_prices(order_type: OrderType, order_details: dict) -> dict:
+        """Get actual entry price (market orders only) and current price from placed order details."""
+        res = {"current_price": order_details.get("currentPrice")}
+
+        if order_type == OrderType.MARKET:
+            # Update entry price with actual executed price
+            res["entry_price"] = round(order_details["openPrice"], ndigits=ObjTrade.DECIMAL)
+
+        return res
+
     def _update_trade_object(self, trade_object: DotDict, payload: dict, response: dict, update_price=True):
         """Update trade object with response data and calculated values."""
-        symbol_details = self._symbol_details[trade_object.symbol]
+        symbol_details = QuoteService.get_specs(trade_object.symbol)
 
         # Update with response data
         payload["order_id"] = response["clOrdId"]
@@ -121,29 +120,9 @@ class TradeAPI(BaseAPI):
 
         # Get actual price from order details with retry mechanism
         if update_price:
-            max_retries = 3
-            retry_count = 0
-
-            while retry_count < max_retries:
-                order_details = self._order_api.get_orders_details(trade_object.symbol, trade_object.order_type, payload["order_id"])
-                if order_details:
-                    # Update entry price with actual executed price
-                    if trade_object.order_type == OrderType.MARKET:
-                        payload["entry_price"] = round(order_details["openPrice"], ndigits=ObjTrade.DECIMAL)
-
-                    # update current price
-                    payload["current_price"] = order_details.get("currentPrice")
-                    break
-                else:
-                    retry_count += 1
-                    if retry_count < max_retries:
-                        logger.warning(f"[API] {WARNING_ICON} Order details returned empty, retrying...")
-                        time.sleep(3)
-
-                    else:
-                        error_msg = f"[API] {FAILED_ICON_COLOR} Failed to get order details - order_id: {payload['order_id']}"
-                        logger.error(error_msg)
-                        raise requests.RequestException(error_msg)
+            order_id = payload["order_id"]
+            order_details = self._order_api.wait_for_orders([order_id], trade_object.order_type, trade_object.symbol)[order_id]
+            payload.update(self._get_placed_prices(trade_object.order_type, order_details))
 
         # Update the trade object
         trade_object.update(payload)
@@ -163,9 +142,11 @@ class TradeAPI(BaseAPI):
 
         for attempt in range(max_retries):
 
-            payload = self._build_payload(trade_object)
+            # rebuild payload from a fresh quote on retries, a stale price is the usual rejection cause
+            payload = self._build_payload(trade_object, refresh_price=attempt > 0)
             response = self.post(endpoint, payload, apply_retries=False, parse_result=False)
             response_json = response.json()
+            QuoteService.record_order(response.ok, attempt)
 
             if not response.ok:
                 # place order failed, retry with fresh payload
@@ -181,7 +162,7 @@ class TradeAPI(BaseAPI):
                         raise requests.RequestException(error_msg)
 
                     logger.warning(f"[API] {WARNING_ICON} Attempt {attempt + 1}/{max_retries}: Failed to place order - status_code: {response.status_code} - error: {response_json.get('message')}")
-                    time.sleep(3)
+                    time.sleep(0.5)
                     continue
 
             logger.info(f"[API] Order placed successfully, orderID: {response_json['result']['clOrdId']} {CHECK_ICON_COLOR}")
@@ -193,6 +174,44 @@ class TradeAPI(BaseAPI):
 
         return None
 
+    def post_orders(self, trade_objects: list[ObjTrade], concurrency: int = 5, update_price=True) -> list[dict]:
+        """
+        Place multiple trading orders in parallel with a bounded worker pool.
+
+        :param trade_objects: List of trade objects, one order is placed per object
+        :param concurrency: Maximum number of orders placed at the same time
+        :param update_price: If True, confirm all placed orders with one order fetch per asset tab and update actual prices
+        :return: List of API results in the same order as trade_objects
+        """
+        if not trade_objects:
+            return []
+
+        logger.debug(f"[API] Place {len(trade_objects)} orders (concurrency:{concurrency})")
+
+        # Load quotes once before fanning out, so workers share them instead of fetching each
+        for symbol in {trade_object.symbol for trade_object in trade_objects}:
+            self._get_symbol_details(symbol)
+
+        with ThreadPoolExecutor(max_workers=max(min(concurrency, len(trade_objects)), 1)) as executor:
+            results = list(executor.map(lambda trade_object: self.post_order(trade_object, update_price=False), trade_objects))
+
+        if update_price:
+            self._confirm_orders(trade_objects)
+
+        return results
+
+    def _confirm_orders(self, trade_objects: list[ObjTrade]):
+        """Confirm placed orders by order id, polling orders once per asset tab instead of once per order."""
+        symbols = {trade_object.symbol for trade_object in trade_objects}
+        symbol = symbols.pop() if len(symbols) == 1 else None
+
+        for tab in {AssetTabs.get_tab(trade_object.order_type) for trade_object in trade_objects}:
+            tab_objects = [trade_object for trade_object in trade_objects if AssetTabs.get_tab(trade_object.order_type) == tab]
+            all_details = self._order_api.wait_for_orders([trade_object.order_id for trade_object in tab_objects], tab_objects[0].order_type, symbol)
+
+            for trade_object in tab_objects:
+                trade_object.update(self._get_placed_prices(trade_object.order_type, all_details[trade_object.order_id]))
+
     def bulk_close_orders(self, orders, tab: AssetTabs):
         """
         Bulk close multiple orders in one API call
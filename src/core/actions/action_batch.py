@@ -0,0 +1,105 @@
+from typing import Callable, Literal
+
+from selenium.webdriver.common.actions.action_builder import ActionBuilder
+from selenium.webdriver.common.actions.key_input import KeyInput
+from selenium.webdriver.common.actions.pointer_input import PointerInput
+from selenium.webdriver.common.actions.wheel_input import WheelInput
+from selenium.webdriver.remote.webelement import WebElement
+
+from src.data.consts import EXPLICIT_WAIT
+
+
+class ActionBatch:
+    """
+    Pointer, wheel and key actions queued against elements resolved once, then sent in a single W3C actions call.
+    - mouse (web): moves are relative to the element center, the element is first scrolled into view by a wheel action.
+    - touch (mobile): moves go to the screen coordinates of the element center, as the gestures of MobileActions.
+    Devices are kept in sync with pauses, so actions are performed in the order queued.
+    """
+
+    TAP_HOLD = 0.1  # seconds between touch down and up
+
+    def __init__(self, driver, find_element: Callable, pointer: Literal["mouse", "touch"] = "mouse"):
+        self._driver = driver
+        self._find_element = find_element
+        self._touch = pointer == "touch"
+        self._pointer = PointerInput(pointer, "finger1" if self._touch else "mouse")
+        self._wheel = WheelInput("wheel")
+        self._keyboard = KeyInput("keyboard")
+        self._steps: list[tuple] = []  # (device, method, args, kwargs)
+
+    def __len__(self):
+        return len(self._steps)
+
+    def _add(self, device, method: str, *args, **kwargs) -> None:
+        self._steps.append((device, method, args, kwargs))
+
+    def _move(self, x: float, y: float, duration=0, origin: WebElement | str = "viewport") -> None:
+        self._add(self._pointer, "create_pointer_move", duration=duration, x=int(x), y=int(y), origin=origin)
+
+    def _press(self, hold: float = 0) -> None:
+        self._add(self._pointer, "create_pointer_down", button=0)
+        if hold:
+            self._add(self._pointer, "create_pause", hold)
+        self._add(self._pointer, "create_pointer_up", 0)
+
+    def click(self, target: tuple[str, str] | WebElement, times=1, interval: float = 0, timeout=EXPLICIT_WAIT) -> "ActionBatch":
+        """Queue clicks (taps on mobile) on the element, found once whatever the number of clicks"""
+        element = target if isinstance(target, WebElement) else self._find_element(target, timeout)
+
+        if self._touch:
+            rect = element.rect
+            self._move(rect["x"] + rect["width"] / 2, rect["y"] + rect["height"] / 2)
+        else:
+            self._add(self._wheel, "create_scroll", 0, 0, 0, 0, 0, element)
+            self._move(0, 0, origin=element)
+
+        for i in range(times):
+            if i and interval:
+                self.pause(interval)
+            self._press(self.TAP_HOLD if self._touch else 0)
+
+        return self
+
+    def tap(self, x: float, y: float, hold: float = TAP_HOLD) -> "ActionBatch":
+        """Queue a tap (click on web) at viewport coordinates"""
+        self._move(x, y)
+        self._press(hold)
+        return self
+
+    def swipe(self, start: tuple[float, float], end: tuple[float, float], hold=0.1, duration=250, release_pause: float = 0) -> "ActionBatch":
+        """Queue a press at start, a move to end in duration (ms) and a release"""
+        self._move(*start)
+        self._add(self._pointer, "create_pointer_down", button=0)
+        if hold:
+            self._add(self._pointer, "create_pause", hold)
+        self._move(*end, duration=duration)
+        if release_pause:
+            self._add(self._pointer, "create_pause", release_pause)
+        self._add(self._pointer, "create_pointer_up", 0)
+        return self
+
+    def send_keys(self, value: str) -> "ActionBatch":
+        """Queue key presses, typed into the focused element"""
+        for key in str(value):
+            self._add(self._keyboard, "create_key_down", key)
+            self._add(self._keyboard, "create_key_up", key)
+        return self
+
+    def pause(self, seconds: float) -> "ActionBatch":
+        self._add(self._pointer, "create_pause", seconds)
+        return self
+
+    def perform(self) -> None:
+        """Send all queued actions in one call"""
+        if not self._steps:
+            return
+
+        devices = {device for device, *_ in self._steps}
+        for device, method, args, kwargs in self._steps:
+            getattr(device, method)(*args, **kwargs)
+            for other in devices - {device}:
+                other.create_pause(0)
+
+        self._steps.clear()
+        ActionBuilder(self._driver, mouse=self._pointer, wheel=self._wheel, keyboard=self._keyboard).perform()
@@ -1,5 +1,8 @@
+import re
+import threading
 import time
-from contextlib import suppress
+import weakref
+from contextlib import contextmanager, suppress
 
 from selenium.common import StaleElementReferenceException
 from selenium.common.exceptions import TimeoutException
@@ -8,25 +11,113 @@ from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.wait import WebDriverWait
 
-from src.core.decorators import handle_stale_element, log_requests
+from src.core.actions.action_batch import ActionBatch
+from src.core.actions.wait_scheduler import WaitScheduler
+from src.core.decorators import handle_stale_element, log_requests, changes_ui, charges_wait
 from src.data.consts import EXPLICIT_WAIT, QUICK_WAIT, IMPLICIT_WAIT, CHECK_ICON_COLOR, FAILED_ICON_COLOR, WARNING_ICON
 from src.data.project_info import StepLogs
+from src.utils import DotDict
 from src.utils.allure_utils import attach_screenshot
 from src.utils.assert_utils import soft_assert
 from src.utils.logging_utils import logger
 
 
 class BaseActions:
+    """
+    Element actions shared by all platforms.
+
+    Resolved elements and read results are cached per driver for one DOM epoch, which any action changing the UI
+    (decorated with changes_ui) ends. Cached elements are re-checked against the wait condition before reuse,
+    resolved again when stale or older than ELEMENT_TTL. Positional locators (first row, n-th match, ...) are never
+    cached, live updates can move another node to that position. Read results also expire after READ_TTL,
+    so polling loops see page updates.
+    Timeout and poll interval of find_element are adjusted per locator by WaitScheduler.
+    """
+
     DEFAULT_CONDITION = EC.visibility_of_element_located
+    READ_TTL = 0.5
+    ELEMENT_TTL = 2
+    POSITIONAL_LOCATOR = re.compile(r"\[\s*(\d+|last\(\)|position\(\))|:(first|last|nth)-|:nth-last-")
+    POINTER = "mouse"  # pointer type of batched actions
+
+    last_ui_action = 0.0  # time.monotonic() when the last action changing the UI started, set by changes_ui
+
+    # wait condition: check of an already resolved element, conditions not listed here are not cached
+    ELEMENT_CHECKS = {
+        EC.presence_of_element_located: lambda element: True,
+        EC.visibility_of_element_located: lambda element: element.is_displayed(),
+        EC.element_to_be_clickable: lambda element: element.is_displayed() and element.is_enabled(),
+    }
+
+    _dom_caches = weakref.WeakKeyDictionary()  # driver: {elements: {locator: (expiry, element)}, reads: {key: (expiry, value)}}
+    _lock = threading.Lock()
+    _stats = DotDict(element_hits=0, read_hits=0, stale=0)
 
     def __init__(self, driver):
         self._driver = driver
         self._wait = WebDriverWait(driver=self._driver, timeout=EXPLICIT_WAIT)
         self._driver.implicitly_wait(IMPLICIT_WAIT)
 
+    # ----------------------------
+    # DOM epoch cache
+    # ----------------------------
+    @property
+    def _dom_cache(self) -> DotDict:
+        with self._lock:
+            if self._driver not in self._dom_caches:
+                self._dom_caches[self._driver] = DotDict(elements={}, reads={})
+            return self._dom_caches[self._driver]
+
+    def end_dom_epoch(self) -> bool:
+        """Drop elements and reads cached since the last action changing the UI, return True if any was cached"""
+        cache = self._dom_cache
+        cached = bool(cache.elements or cache.reads)
+        cache.elements.clear()
+        cache.reads.clear()
+        return cached
+
+    def _cached_element(self, locator: tuple[str, str], cond) -> WebElement | None:
+        """Return the element resolved for locator in this epoch if it still meets cond"""
+        entry = self._dom_cache.elements.get(locator)
+        if entry is None:
+            return None
+
+        expiry, element = entry
+        try:
+            if expiry > time.monotonic() and self.ELEMENT_CHECKS[cond](element):
+                self._stats.element_hits += 1
+                return element
+
+        except StaleElementReferenceException:
+            self._stats.stale += 1
+
+        self._dom_cache.elements.pop(locator, None)
+        return None
+
+    def _cached_read(self, key: tuple, read):
+        """Return read() cached for this epoch, at most READ_TTL old"""
+        reads = self._dom_cache.reads
+        entry = reads.get(key)
+        if entry and entry[0] > time.monotonic():
+            self._stats.read_hits += 1
+            return entry[1]
+
+        value = read()
+        reads[key] = (time.monotonic() + self.READ_TTL, value)
+        return value
+
+    @classmethod
+    def log_stats(cls) -> None:
+        if any(cls._stats.values()):
+            logger.debug(
+                f"[UI] DOM epoch cache - element lookups saved: {cls._stats.element_hits}, "
+                f"reads saved: {cls._stats.read_hits}, stale handles resolved again: {cls._stats.stale}"
+            )
+
     # ----------------------------
     # Main find_element wrapper with failure handler
     # ----------------------------
+    @charges_wait
     def find_element(
             self,
             locator: tuple[str, str],
@@ -45,16 +136,35 @@ class BaseActions:
         :return: WebElement or None.
         """
 
-        wait = self._wait if timeout == EXPLICIT_WAIT else WebDriverWait(self._driver, timeout)
+        cacheable = cond in self.ELEMENT_CHECKS and not self.POSITIONAL_LOCATOR.search(locator[1])
+        if cacheable and (element := self._cached_element(locator, cond)):
+            return element
+
+        requested_timeout = timeout
+        timeout, poll = WaitScheduler.schedule(locator, timeout, shorten=not raise_exception)
+
+        if timeout == EXPLICIT_WAIT and poll == WaitScheduler.DEFAULT_POLL:
+            wait = self._wait
+        else:
+            wait = WebDriverWait(self._driver, timeout, poll_frequency=poll)
+
+        start = time.monotonic()
         try:
-            return wait.until(cond(locator))
+            element = wait.until(cond(locator))
+            WaitScheduler.record(locator, time.monotonic() - start, found=True)
+            if cacheable:
+                self._dom_cache.elements[locator] = (time.monotonic() + self.ELEMENT_TTL, element)
+            return element
 
         except StaleElementReferenceException as e:
             logger.warning(f"{WARNING_ICON} {type(e).__name__} finding element for locator {locator}), retrying...")
             time.sleep(0.5)
-            return wait.until(cond(locator))
+            element = wait.until(cond(locator))
+            WaitScheduler.record(locator, time.monotonic() - start, found=True)
+            return element
 
         except TimeoutException as e:
+            WaitScheduler.record(locator, timeout, found=False, saved=requested_timeout - timeout)
             if show_log:
                 logger.warning(f"{WARNING_ICON} Element not found for {locator}: {type(e).__name__} after {timeout}(s)")
 
@@ -70,6 +180,7 @@ class BaseActions:
 
         return None
 
+    @charges_wait
     def find_elements(self, locator: tuple[str, str], timeout=EXPLICIT_WAIT, show_log=True) -> list[WebElement]:
         wait = self._wait if timeout == EXPLICIT_WAIT else WebDriverWait(self._driver, timeout)
         try:
@@ -92,6 +203,12 @@ class BaseActions:
 
         return self.wait_for_element_visible(locator, timeout, show_log=show_log)
 
+    def is_displayed_now(self, locator: tuple[str, str]) -> bool:
+        """One lookup without waiting: True if an element matching the locator is displayed"""
+        with suppress(StaleElementReferenceException):
+            return any(element.is_displayed() for element in self._driver.find_elements(*locator))
+        return False
+
     def is_element_enabled(self, locator: tuple[str, str], timeout=EXPLICIT_WAIT) -> bool:
         """Check if element is enabled."""
         element = self.find_element(locator, timeout, raise_exception=False, show_log=False)
@@ -105,6 +222,7 @@ class BaseActions:
         res = self.find_element(locator, timeout, raise_exception=False, show_log=show_log)
         return bool(res)
 
+    @charges_wait
     def wait_for_element_invisible(self, locator: tuple[str, str], timeout=EXPLICIT_WAIT, show_log=True) -> bool:
 
         def _check_invisible() -> bool:
@@ -125,6 +243,7 @@ class BaseActions:
     # Safe interactions
     # ----------------------------
 
+    @changes_ui
     @log_requests
     @handle_stale_element
     def click(
@@ -139,6 +258,7 @@ class BaseActions:
         if element:
             element.click()
 
+    @changes_ui
     @log_requests
     @handle_stale_element
     def javascript_click(
@@ -163,6 +283,27 @@ class BaseActions:
     def send_keys(self, **kwargs) -> None:
         pass
 
+    @contextmanager
+    def action_batch(self):
+        """
+        Queue clicks, gestures and key presses on the yielded ActionBatch, performed in one call when the block exits.
+        Example: with actions.action_batch() as batch: batch.click(btn_increase, times=10).click(btn_decrease, times=3)
+        """
+        batch = ActionBatch(self._driver, self.find_element, self.POINTER)
+        yield batch
+        batch.perform()
+        self.end_dom_epoch()
+
+    def fill_form(self, fields: dict[tuple[str, str], any], timeout=EXPLICIT_WAIT) -> None:
+        """
+        Input {locator: value} into form fields, None values are skipped.
+        Platforms override it to fill all fields at once.
+        """
+        for locator, value in fields.items():
+            if value is not None:
+                self.send_keys(locator, value, timeout=timeout)
+
+    @changes_ui
     @handle_stale_element
     def clear_field(
             self,
@@ -195,18 +336,41 @@ class BaseActions:
             show_log=True
     ) -> str | None:
         """Get attribute value from an element."""
-        element = self.find_element(
-            locator, timeout, EC.presence_of_element_located,
-            raise_exception=raise_exception, show_log=show_log
-        )
-        return element.get_attribute(attribute) if element else ""
+        def _read():
+            element = self.find_element(
+                locator, timeout, EC.presence_of_element_located,
+                raise_exception=raise_exception, show_log=show_log
+            )
+            return element.get_attribute(attribute) if element else ""
+
+        return self._cached_read(("attribute", locator, attribute), _read)
 
     @handle_stale_element
     def get_text_elements(self, locator, timeout=EXPLICIT_WAIT):
         """Get text of elements having same locator"""
-        elements = self.find_elements(locator, timeout)
-        res = [ele.text.strip() if ele else "" for ele in elements]
-        return res
+        return self.get_texts(locator, timeout)
+
+    # ----------------------------
+    # Bulk reads, platforms override them to read all elements in one call
+    # ----------------------------
+    def get_texts(self, locator: tuple[str, str], timeout=EXPLICIT_WAIT, show_log=True) -> list[str]:
+        """Get stripped text of all elements matching the locator"""
+        return [ele.text.strip() for ele in self.find_elements(locator, timeout, show_log=show_log)]
+
+    def get_attributes(self, locator: tuple[str, str], names: str | list[str], timeout=EXPLICIT_WAIT, show_log=True) -> list[dict]:
+        """Get attributes of all elements matching the locator: [{name: value}]"""
+        names = [names] if isinstance(names, str) else names
+        return [
+            {name: ele.get_attribute(name) for name in names}
+            for ele in self.find_elements(locator, timeout, show_log=show_log)
+        ]
+
+    def get_states(self, locator: tuple[str, str], timeout=EXPLICIT_WAIT, show_log=True) -> list[dict]:
+        """Get state of all elements matching the locator: [{displayed: bool, enabled: bool}]"""
+        return [
+            dict(displayed=ele.is_displayed(), enabled=ele.is_enabled())
+            for ele in self.find_elements(locator, timeout, show_log=show_log)
+        ]
 
     @handle_stale_element
     def get_text(
@@ -234,29 +398,33 @@ class BaseActions:
             error_message=f"Element with locator {locator} is {('not' if is_display else 'still')} displayed"
         )
 
-    def verify_elements_displayed(self, locators, timeout=EXPLICIT_WAIT, is_display=True):
-        all_res = []
-        failed_locator = []
-        locators = locators if isinstance(locators, list) else [locators]
+    def verify_absent_now(self, locator: tuple[str, str]):
+        """Verify the element is not displayed at this moment, without waiting for it to appear or disappear"""
+        soft_assert(not self.is_displayed_now(locator), True, error_message=f"Element with locator {locator} is displayed")
 
+    def check_elements_displayed(self, locators: list[tuple[str, str]], timeout=EXPLICIT_WAIT, is_display=True) -> dict:
+        """
+        Return {locator: passed}, passed meaning displayed (or not displayed if is_display is False).
+        Platforms override it to check all locators per poll.
+        """
         # wait for the first locator with full timeout
-        res = self.is_element_displayed(locators[0], timeout=timeout, is_display=is_display, show_log=is_display)
-        all_res.append(res)
-
-        if not res:
-            failed_locator.append(locators[0])
+        results = {locators[0]: self.is_element_displayed(locators[0], timeout=timeout, is_display=is_display, show_log=is_display)}
 
         # wait for the others locator with quick-wait as page already loaded
         for _locator in locators[1:]:
-            res = self.is_element_displayed(_locator, timeout=QUICK_WAIT, is_display=is_display, show_log=is_display)
-            all_res.append(res)
-            if not res:
-                failed_locator.append(_locator)
+            results[_locator] = self.is_element_displayed(_locator, timeout=QUICK_WAIT, is_display=is_display, show_log=is_display)
+
+        return results
+
+    def verify_elements_displayed(self, locators, timeout=EXPLICIT_WAIT, is_display=True):
+        locators = locators if isinstance(locators, list) else [locators]
+        results = self.check_elements_displayed(locators, timeout, is_display)
+        failed_locator = [locator for locator, passed in results.items() if not passed]
 
         logger.debug(
-            f"> Check {'elements_displayed' if is_display else 'elements_not_displayed'}: {CHECK_ICON_COLOR if all(all_res) else FAILED_ICON_COLOR}")
+            f"> Check {'elements_displayed' if is_display else 'elements_not_displayed'}: {CHECK_ICON_COLOR if not failed_locator else FAILED_ICON_COLOR}")
 
         soft_assert(
-            all(all_res), True,
+            not failed_locator, True,
             error_message=f"Elements with locators {failed_locator} are {('not' if is_display else 'still')} displayed"
         )
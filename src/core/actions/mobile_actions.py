@@ -1,18 +1,27 @@
 import builtins
+import itertools
+from contextlib import contextmanager, suppress
+
+from selenium.common import TimeoutException
+from selenium.webdriver.support.wait import WebDriverWait
 
-from selenium.webdriver.common.actions.action_builder import ActionBuilder
-from selenium.webdriver.common.actions.pointer_input import PointerInput
 from src.core.actions.base_actions import BaseActions
-from src.core.decorators import handle_stale_element
-from src.data.consts import EXPLICIT_WAIT
+from src.core.actions.page_snapshot import PageSnapshot
+from src.core.decorators import handle_stale_element, changes_ui, charges_wait
+from src.data.consts import EXPLICIT_WAIT, WARNING_ICON
 from src.data.project_info import RuntimeConfig
+from src.utils.logging_utils import logger
 
 
 class MobileActions(BaseActions):
+    POINTER = "touch"
+
     def __init__(self, driver=None):
         super().__init__(driver or getattr(builtins, 'android_driver') or getattr(builtins, 'ios_driver'))
-        self._action_builder = ActionBuilder(self._driver)
+        self._snapshot: PageSnapshot | None = None  # only kept inside page_snapshot() blocks
+        self._snapshot_scope = 0
 
+    @changes_ui
     def click_screen_position(self, x_percent=0.5, y_percent=0.5):
         """Click at a position by percentage of screen size.
         Example: (0.5, 0.5) = middle of screen.
@@ -24,14 +33,10 @@ class MobileActions(BaseActions):
         x = int(width * x_percent)
         y = int(height * y_percent)
 
-        finger = PointerInput("touch", "finger1")
-        actions = ActionBuilder(self._driver, mouse=finger)
-        actions.pointer_action.move_to_location(x=x, y=y)
-        actions.pointer_action.pointer_down()
-        actions.pointer_action.pause(0.1)
-        actions.pointer_action.release()
-        actions.perform()
+        with self.action_batch() as batch:
+            batch.tap(x, y)
 
+    @changes_ui
     @handle_stale_element
     def click_by_offset(
             self,
@@ -49,15 +54,10 @@ class MobileActions(BaseActions):
             x = rect['x'] + x_offset
             y = rect['y'] + y_offset
 
-            # Create touch pointer
-            finger = PointerInput("touch", "finger1")
-            actions = ActionBuilder(self._driver, mouse=finger)
-            actions.pointer_action.move_to_location(x=x, y=y)
-            actions.pointer_action.pointer_down()
-            actions.pointer_action.pause(0.1)
-            actions.pointer_action.release()
-            actions.perform()
+            with self.action_batch() as batch:
+                batch.tap(x, y)
 
+    @changes_ui
     @handle_stale_element
     def send_keys(
             self,
@@ -84,9 +84,129 @@ class MobileActions(BaseActions):
                 else:
                     element.send_keys("\n")
 
+    @changes_ui
+    @handle_stale_element
+    def fill_form(self, fields: dict[tuple[str, str], any], timeout=EXPLICIT_WAIT, platform=None) -> None:
+        """
+        Set the value of all fields (no tap nor keyboard dismissal per field), then dismiss the keyboard once.
+        None values are skipped.
+        """
+        platform = platform or RuntimeConfig.platform
+        element = None
+
+        for locator, value in fields.items():
+            if value is None:
+                continue
+
+            element = self.find_element(locator, timeout)
+            element.clear()
+            element.send_keys(str(value))
+
+        if not element:
+            return
+
+        if platform != "android":
+            element.send_keys("\n")
+
+        elif self._driver.is_keyboard_shown():  # hide_keyboard presses back (closing modals) if there is none
+            self.hide_keyboard()
+
+    # ----------------------------
+    # Bulk reads from page source snapshots
+    # ----------------------------
+    def get_snapshot(self, refresh=False) -> PageSnapshot:
+        """Return the snapshot of the current page_snapshot() block, or a fresh one"""
+        if refresh or self._snapshot is None:
+            snapshot = PageSnapshot(self._driver.page_source)
+            if self._snapshot_scope:
+                self._snapshot = snapshot
+            return snapshot
+
+        return self._snapshot
+
+    @contextmanager
+    def page_snapshot(self):
+        """
+        Evaluate all bulk reads and checks inside the block on one page source,
+        fetched on first use and again only after an action changing the UI.
+        Interactions (click, send_keys, ...) always use live lookups.
+        """
+        self._snapshot_scope += 1
+        try:
+            yield self
+        finally:
+            self._snapshot_scope -= 1
+            if not self._snapshot_scope:
+                self._snapshot = None
+
+    def end_dom_epoch(self) -> bool:
+        cached = self._snapshot is not None
+        self._snapshot = None
+        return super().end_dom_epoch() or cached
+
+    @charges_wait
+    def _poll_snapshot(self, check, timeout=EXPLICIT_WAIT):
+        """
+        Evaluate check(snapshot) on the current snapshot, then on fresh page sources until it returns a truthy value.
+        Raise TimeoutException after timeout.
+        """
+        wait = self._wait if timeout == EXPLICIT_WAIT else WebDriverWait(self._driver, timeout)
+        polls = itertools.count()
+        return wait.until(lambda _: check(self.get_snapshot(refresh=next(polls) > 0)))
+
+    def _find_in_source(self, locator: tuple[str, str], timeout=EXPLICIT_WAIT, show_log=True) -> tuple[PageSnapshot | None, list]:
+        """Wait until the locator matches nodes of the page source, return the snapshot and the nodes"""
+        try:
+            return self._poll_snapshot(lambda snapshot: (snapshot, nodes) if (nodes := snapshot.find_all(locator)) else False, timeout)
+
+        except TimeoutException as e:
+            if show_log:
+                logger.warning(f"{WARNING_ICON} Elements not found for {locator}: {type(e).__name__} after {timeout}(s)")
+
+        return None, []
+
+    def get_texts(self, locator: tuple[str, str], timeout=EXPLICIT_WAIT, show_log=True) -> list[str]:
+        if not PageSnapshot.supports(locator):
+            return super().get_texts(locator, timeout, show_log)
+
+        snapshot, nodes = self._find_in_source(locator, timeout, show_log)
+        return [snapshot.text(node) for node in nodes]
+
+    def get_attributes(self, locator: tuple[str, str], names: str | list[str], timeout=EXPLICIT_WAIT, show_log=True) -> list[dict]:
+        if not PageSnapshot.supports(locator):
+            return super().get_attributes(locator, names, timeout, show_log)
+
+        names = [names] if isinstance(names, str) else names
+        _, nodes = self._find_in_source(locator, timeout, show_log)
+        return [{name: node.get(name) for name in names} for node in nodes]
+
+    def get_states(self, locator: tuple[str, str], timeout=EXPLICIT_WAIT, show_log=True) -> list[dict]:
+        if not PageSnapshot.supports(locator):
+            return super().get_states(locator, timeout, show_log)
+
+        snapshot, nodes = self._find_in_source(locator, timeout, show_log)
+        return [dict(displayed=snapshot.is_node_displayed(node), enabled=snapshot.is_node_enabled(node)) for node in nodes]
+
+    def check_elements_displayed(self, locators: list[tuple[str, str]], timeout=EXPLICIT_WAIT, is_display=True) -> dict:
+        """Check all locators on the same page source per poll, instead of one device query per locator"""
+        if not all(PageSnapshot.supports(locator) for locator in locators):
+            return super().check_elements_displayed(locators, timeout, is_display)
+
+        results = {}
+
+        def _check(snapshot):
+            results.update({locator: snapshot.is_displayed(locator) == is_display for locator in locators})
+            return all(results.values())
+
+        with suppress(TimeoutException):
+            self._poll_snapshot(_check, timeout)
+
+        return results
+
     def get_content_desc(self, locator: tuple[str, str], timeout=EXPLICIT_WAIT):
         return self.get_attribute(locator, "content-desc", timeout=timeout)
 
+    @changes_ui
     def hide_keyboard(self):
         """Hide the keyboard if it's visible."""
         try:
@@ -99,10 +219,12 @@ class MobileActions(BaseActions):
                 # If both methods fail, try pressing back button
                 self.press_back()
 
+    @changes_ui
     def press_back(self):
         """Press device back button."""
         self._driver.press_keycode(4)  # Android back button keycode
 
+    @changes_ui
     def press_done(self):
         """Press the Done button on mobile keyboard."""
         try:
@@ -112,8 +234,9 @@ class MobileActions(BaseActions):
             # Fallback to hiding keyboard if Done action fails
             self.hide_keyboard()
 
-    def scroll_down(self, start_x_percent=0.85, scroll_step=0.4):
-        """Scroll down the viewport using W3C actions."""
+    @changes_ui
+    def scroll_down(self, start_x_percent=0.85, scroll_step=0.4, times=1):
+        """Scroll down the viewport using W3C actions, swiping `times` times in one call."""
         # Get screen dimensions
         screen_size = self._driver.get_window_size()
         screen_width = screen_size['width']
@@ -128,21 +251,12 @@ class MobileActions(BaseActions):
         end_y = max(int(screen_height * 0.1), start_y - scroll_distance)
         end_x = start_x
 
-        # Setup finger input for W3C actions
-        finger = PointerInput("touch", "finger1")
-        actions = ActionBuilder(self._driver, mouse=finger)
-
-        # Perform the scroll gesture
-        actions.pointer_action.move_to_location(start_x, start_y)
-        actions.pointer_action.pointer_down()
-        actions.pointer_action.pause(0.1)
-        actions.pointer_action.move_to_location(end_x, end_y)
-        actions.pointer_action.pause(0.1)
-        actions.pointer_action.release()
-
-        # Execute the action
-        actions.perform()
+        # Perform the scroll gestures
+        with self.action_batch() as batch:
+            for _ in range(times):
+                batch.swipe((start_x, start_y), (end_x, end_y), hold=0.1, release_pause=0.1)
 
+    @changes_ui
     def swipe_picker_wheel_down(self, locator):
         element = self.find_element(locator)
         rect = element.rect
@@ -150,26 +264,15 @@ class MobileActions(BaseActions):
         start_y = rect['y'] + rect['height'] * 0.7  # Start from 70% down the element
         end_y = rect['y'] + rect['height'] * 0.3  # End at 30% down the element
 
-        # Setup finger input
-        finger = PointerInput("touch", "finger1")
-        actions = ActionBuilder(self._driver, mouse=finger)
-
-        actions.pointer_action.move_to_location(center_x, start_y)
-        actions.pointer_action.pointer_down()
-        actions.pointer_action.pause(0.2)
-        actions.pointer_action.move_to_location(center_x, end_y)
-        actions.pointer_action.release()
-        actions.perform()
+        with self.action_batch() as batch:
+            batch.swipe((center_x, start_y), (center_x, end_y), hold=0.2)
 
+    @changes_ui
     def swipe_element_horizontal(self, locator, direction: str = "left"):
         """Perform swipe actions on a screen in the specified direction."""
         element = self.find_element(locator)
         rect = element.rect
 
-        # Setup finger input for swipe action
-        finger = PointerInput("touch", "finger1")
-        actions = ActionBuilder(self._driver, mouse=finger)
-
         # Horizontal scroll (left or right)
         if direction == "left":
             start_x = rect['x'] + rect['width'] * 0.95
@@ -181,8 +284,5 @@ class MobileActions(BaseActions):
         y = rect['y'] + rect['height'] / 2
 
         # Perform swipe action
-        actions.pointer_action.move_to_location(start_x, y)
-        actions.pointer_action.pointer_down()
-        actions.pointer_action.move_to_location(end_x, y)
-        actions.pointer_action.release()
-        actions.perform()
+        with self.action_batch() as batch:
+            batch.swipe((start_x, y), (end_x, y), hold=0)
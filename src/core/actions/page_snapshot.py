@@ -0,0 +1,125 @@
+import re
+from functools import lru_cache
+
+from appium.webdriver.common.appiumby import AppiumBy
+from lxml import etree
+
+
+@lru_cache(maxsize=512)
+def _compile_xpath(expression: str) -> etree.XPath:
+    return etree.XPath(expression)
+
+
+# UiSelector method: (node attribute, match)
+UI_SELECTOR_METHODS = {
+    "resourceId": ("resource-id", lambda attr, arg: attr == arg),
+    "text": ("text", lambda attr, arg: attr == arg),
+    "textContains": ("text", lambda attr, arg: arg in attr),
+    "textStartsWith": ("text", lambda attr, arg: attr.startswith(arg)),
+    "description": ("content-desc", lambda attr, arg: attr == arg),
+    "descriptionContains": ("content-desc", lambda attr, arg: arg in attr),
+    "descriptionStartsWith": ("content-desc", lambda attr, arg: attr.startswith(arg)),
+    "className": ("class", lambda attr, arg: attr == arg),
+}
+
+
+@lru_cache(maxsize=512)
+def _parse_ui_selector(expression: str) -> tuple[tuple[str, str], ...] | None:
+    """'new UiSelector().resourceId("a").text("b")' -> (("resourceId", "a"), ("text", "b")), None if not a flat selector"""
+    match = re.fullmatch(r'new UiSelector\(\)((?:\.\w+\("(?:[^"\\]|\\.)*"\))+)', expression.strip().rstrip(";"))
+    if not match:
+        return None
+
+    calls = tuple(
+        (method, arg.replace('\\"', '"'))
+        for method, arg in re.findall(r'\.(\w+)\("((?:[^"\\]|\\.)*)"\)', match.group(1))
+    )
+    return calls if all(method in UI_SELECTOR_METHODS for method, _ in calls) else None
+
+
+class PageSnapshot:
+    """
+    Android/ iOS page source parsed once, evaluating locators locally instead of querying the device.
+    Supports XPath, id, accessibility id (SUPPORTED) and flat Android UiSelector locators (no child/ parent selectors),
+    resolved the same way as the Appium drivers.
+
+    Recorded page sources (e.g. from common_utils.log_page_source) can be loaded with from_file for offline checks.
+    """
+
+    SUPPORTED = (AppiumBy.XPATH, AppiumBy.ID, AppiumBy.ACCESSIBILITY_ID)
+
+    def __init__(self, page_source: str | bytes):
+        if isinstance(page_source, str):
+            page_source = page_source.encode()
+
+        self.root = etree.fromstring(page_source, etree.XMLParser(huge_tree=True, remove_blank_text=True))
+        self.is_android = self.root.tag == "hierarchy"
+        self._cache: dict[tuple[str, str], list] = {}
+
+    @classmethod
+    def from_file(cls, path) -> "PageSnapshot":
+        with open(path, "rb") as f:
+            return cls(f.read())
+
+    @classmethod
+    def supports(cls, locator: tuple[str, str]) -> bool:
+        by, value = locator
+        return by in cls.SUPPORTED or (by == AppiumBy.ANDROID_UIAUTOMATOR and _parse_ui_selector(value) is not None)
+
+    def find_all(self, locator: tuple[str, str]) -> list:
+        """Return nodes matching the locator, in document order"""
+        if locator not in self._cache:
+            self._cache[locator] = self._match(locator)
+        return self._cache[locator]
+
+    def find(self, locator: tuple[str, str]):
+        nodes = self.find_all(locator)
+        return nodes[0] if nodes else None
+
+    def _match(self, locator: tuple[str, str]) -> list:
+        by, value = locator
+
+        if by == AppiumBy.XPATH:
+            return [node for node in _compile_xpath(value)(self.root) if isinstance(node, etree._Element)]
+
+        if by == AppiumBy.ACCESSIBILITY_ID:
+            attr = "content-desc" if self.is_android else "name"
+            return [node for node in self.root.iter() if node.get(attr) == value]
+
+        if by == AppiumBy.ID:
+            if not self.is_android:
+                return [node for node in self.root.iter() if node.get("name") == value]
+
+            # Android resource id, with or without app package
+            suffix = None if ":id/" in value else f":id/{value}"
+            return [
+                node for node in self.root.iter()
+                if node.get("resource-id") == value or (suffix and (node.get("resource-id") or "").endswith(suffix))
+            ]
+
+        if by == AppiumBy.ANDROID_UIAUTOMATOR and (calls := _parse_ui_selector(value)):
+            matchers = [(UI_SELECTOR_METHODS[method], arg) for method, arg in calls]
+            return [
+                node for node in self.root.iter()
+                if all(match(node.get(attr) or "", arg) for (attr, match), arg in matchers)
+            ]
+
+        raise ValueError(f"Locator strategy {by!r} can not be evaluated on page source")
+
+    # ----------------------------
+    # Node reads, same values as the WebElement ones
+    # ----------------------------
+    def text(self, node) -> str:
+        # Android text, iOS value falling back to label
+        text = node.get("text") if self.is_android else node.get("value") or node.get("label")
+        return (text or "").strip()
+
+    def is_node_displayed(self, node) -> bool:
+        return node.get("displayed" if self.is_android else "visible", "true") == "true"
+
+    @staticmethod
+    def is_node_enabled(node) -> bool:
+        return node.get("enabled", "true") == "true"
+
+    def is_displayed(self, locator: tuple[str, str]) -> bool:
+        return any(self.is_node_displayed(node) for node in self.find_all(locator))
@@ -0,0 +1,96 @@
+import sys
+import threading
+import time
+from collections import defaultdict
+
+from src.data.consts import WARNING_ICON
+from src.utils.logging_utils import logger
+
+
+class WaitLedger:
+    """
+    Charges the time spent in element waits to the current test and to the page-object method waiting.
+    Nested waits (e.g. find_element inside wait_for_element_visible) are charged once, to the outermost one.
+    A wait returning a falsy result (not found, still visible, timeout) is counted as timed out.
+
+    Tests waiting more than WAIT_BUDGET in total are logged, the biggest wait sinks are reported at session end.
+    """
+
+    WAIT_BUDGET = 60
+    TOP = 15
+
+    current_test = "session setup"
+
+    _local = threading.local()
+    _lock = threading.Lock()
+    _by_test: dict[str, float] = defaultdict(float)
+    _sinks: dict[tuple[str, str], list] = defaultdict(lambda: [0.0, 0, 0])  # (caller, action): [seconds, calls, timed out]
+
+    @classmethod
+    def start_test(cls, test: str) -> None:
+        cls.current_test = test
+
+    @classmethod
+    def end_test(cls) -> None:
+        waited = cls._by_test.get(cls.current_test, 0)
+        if waited > cls.WAIT_BUDGET:
+            logger.warning(f"{WARNING_ICON} Test waited {waited:.1f}s for elements (budget: {cls.WAIT_BUDGET}s)")
+
+    @staticmethod
+    def _caller() -> str:
+        """Page-object method (Class.method) the wait is done for, else the calling test function"""
+        frame = sys._getframe(1)
+        test_frame = None
+
+        while frame:
+            module = frame.f_globals.get("__name__", "")
+            if module.startswith("src.page_object."):
+                owner = frame.f_locals.get("self")
+                return f"{type(owner).__name__}.{frame.f_code.co_name}" if owner else f"{module}.{frame.f_code.co_name}"
+
+            if test_frame is None and module.startswith(("tests.", "conftest")):
+                test_frame = frame
+            frame = frame.f_back
+
+        return f"{test_frame.f_globals['__name__']}.{test_frame.f_code.co_name}" if test_frame else "-"
+
+    @classmethod
+    def charge(cls, action: str, call):
+        """Run call(), charging its duration if it is the outermost wait"""
+        if getattr(cls._local, "depth", 0):
+            return call()
+
+        cls._local.depth = 1
+        start = time.monotonic()
+        result = None
+        try:
+            result = call()
+            return result
+
+        finally:
+            cls._local.depth = 0
+            elapsed = time.monotonic() - start
+            caller = cls._caller()
+
+            with cls._lock:
+                cls._by_test[cls.current_test] += elapsed
+                sink = cls._sinks[caller, action]
+                sink[0] += elapsed
+                sink[1] += 1
+                sink[2] += not result
+
+    @classmethod
+    def log_report(cls) -> None:
+        if not cls._sinks:
+            return
+
+        total = sum(cls._by_test.values())
+        lines = [f"[UI] Element waits - total: {total:.1f}s, biggest sinks:"]
+        for (caller, action), (seconds, calls, timed_out) in sorted(cls._sinks.items(), key=lambda item: -item[1][0])[:cls.TOP]:
+            lines.append(f"  {seconds:>8.1f}s  {calls:>5} calls  {timed_out:>5} timed out  {caller} -> {action}")
+
+        lines.append("  Tests waiting the most:")
+        for test, seconds in sorted(cls._by_test.items(), key=lambda item: -item[1])[:cls.TOP]:
+            lines.append(f"  {seconds:>8.1f}s  {test}")
+
+        logger.debug("\n".join(lines))
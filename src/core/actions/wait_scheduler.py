@@ -0,0 +1,146 @@
+import json
+import os
+import threading
+from collections import defaultdict
+
+from src.data.consts import WAIT_STATS_FILE
+from src.data.project_info import RuntimeConfig
+from src.utils import DotDict
+from src.utils.common_utils import file_lock
+from src.utils.logging_utils import logger
+
+
+class WaitScheduler:
+    """
+    Timeout and poll interval of element waits learned per locator and backend (env, client), from the time-to-appear
+    recorded across runs in WAIT_STATS_FILE (merged at session end, shared by xdist workers).
+    - timeout: p99 of time-to-appear x SAFETY_FACTOR, MIN_TIMEOUT for locators never seen after MIN_SAMPLES waits.
+      Learned timeouts only shorten the requested one, never extend it, and only for waits allowed to miss
+      (raise_exception=False): waits for elements expected to be there always get the requested timeout.
+      A wait missing with a learned timeout is a probe for the next one, done with the requested timeout:
+      found there, its time-to-appear raises the learned timeout, missed again, the locator is absent indeed.
+    - poll interval: finer (FAST_POLL) for locators usually found within FAST_P90.
+    Disabled with --fixed_waits (waits use the requested timeout and the default poll), recording goes on.
+    """
+
+    SAFETY_FACTOR = 3
+    MIN_TIMEOUT = 2
+    MIN_SAMPLES = 10
+    MAX_SAMPLES = 50
+    DEFAULT_POLL = 0.5
+    FAST_POLL = 0.1
+    FAST_P90 = 1
+
+    enabled = True
+
+    _stats: dict[str, dict] | None = None  # key: {appear: [seconds], misses: int}, loaded from file on first use
+    _new = defaultdict(lambda: dict(appear=[], misses=0, probe=None))  # recorded in this session, not saved yet
+    _lock = threading.Lock()
+    _session = DotDict(shortened=0, saved=0.0)
+
+    @staticmethod
+    def _key(locator: tuple[str, str]) -> str:
+        return f"{RuntimeConfig.env}:{RuntimeConfig.client}:{RuntimeConfig.platform}:{locator[0]}={locator[1]}"
+
+    @staticmethod
+    def _read_file() -> dict:
+        try:
+            with open(WAIT_STATS_FILE, "r") as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    @classmethod
+    def _get(cls, key: str) -> tuple[dict | None, bool]:
+        """Return the stats of the key, saved and recorded in this session, and whether its next wait is a probe"""
+        with cls._lock:
+            if cls._stats is None:
+                cls._stats = cls._read_file()
+
+            stats, new = cls._stats.get(key), cls._new.get(key)
+            if not new:
+                return stats, bool(stats and stats.get("probe"))
+
+            stats = stats or dict(appear=[], misses=0)
+            appear = (stats["appear"] + new["appear"])[-cls.MAX_SAMPLES:]
+            return dict(appear=appear, misses=stats["misses"] + new["misses"]), new["probe"]
+
+    @staticmethod
+    def _percentile(samples: list[float], percent: float) -> float:
+        ordered = sorted(samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * percent))]
+
+    @classmethod
+    def schedule(cls, locator: tuple[str, str], timeout: float, shorten=True) -> tuple[float, float]:
+        """
+        Return (timeout, poll interval) to wait for the locator, timeout being the one requested by the caller
+        :param shorten: False to keep the requested timeout (element expected), only the poll interval is learned
+        """
+        stats, probe = cls._get(cls._key(locator))
+        if not cls.enabled or not stats:
+            return timeout, cls.DEFAULT_POLL
+
+        appear, misses = stats["appear"], stats["misses"]
+        learned, poll = timeout, cls.DEFAULT_POLL
+
+        if len(appear) >= cls.MIN_SAMPLES:
+            learned = max(cls._percentile(appear, 0.99) * cls.SAFETY_FACTOR, cls.MIN_TIMEOUT)
+            if cls._percentile(appear, 0.9) <= cls.FAST_P90:
+                poll = cls.FAST_POLL
+
+        elif not appear and misses >= cls.MIN_SAMPLES:
+            learned = cls.MIN_TIMEOUT  # absent by design
+
+        if shorten and not probe and learned < timeout:
+            with cls._lock:
+                cls._session.shortened += 1
+            return learned, poll
+
+        return timeout, poll
+
+    @classmethod
+    def record(cls, locator: tuple[str, str], elapsed: float, found: bool, saved: float = 0) -> None:
+        """
+        Record a wait: time to appear if found, else a miss
+        :param saved: requested minus scheduled timeout, wait time saved when the element is not found
+        """
+        key = cls._key(locator)
+        with cls._lock:
+            entry = cls._new[key]
+            if found:
+                entry["appear"].append(round(elapsed, 3))
+            else:
+                entry["misses"] += 1
+                cls._session.saved += saved
+
+            entry["probe"] = not found and saved > 0  # missed with a learned timeout, next wait is a probe
+
+    @classmethod
+    def save(cls) -> None:
+        """Merge the waits recorded in this session into WAIT_STATS_FILE"""
+        with cls._lock:
+            new, cls._new = cls._new, defaultdict(lambda: dict(appear=[], misses=0, probe=None))
+
+        if not new:
+            return
+
+        with file_lock(WAIT_STATS_FILE.with_suffix(".lock")):
+            stats = cls._read_file()
+            for key, recorded in new.items():
+                entry = stats.setdefault(key, dict(appear=[], misses=0))
+                entry["appear"] = (entry["appear"] + recorded["appear"])[-cls.MAX_SAMPLES:]
+                entry["misses"] += recorded["misses"]
+                entry["probe"] = recorded["probe"]
+
+            tmp_file = WAIT_STATS_FILE.with_suffix(".tmp")
+            with open(tmp_file, "w") as f:
+                json.dump(stats, f)
+            os.replace(tmp_file, WAIT_STATS_FILE)
+
+    @classmethod
+    def log_stats(cls) -> None:
+        if cls._session.shortened:
+            logger.debug(
+                f"[UI] Wait scheduler - timeouts shortened: {cls._session.shortened}, "
+                f"wait saved on absent elements: {cls._session.saved:.1f}s"
+            )
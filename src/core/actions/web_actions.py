@@ -1,9 +1,10 @@
 import builtins
+import pkgutil
 import time
 from typing import Literal
 
 from appium.webdriver import WebElement
-from selenium.common import TimeoutException
+from selenium.common import JavascriptException, TimeoutException
 from selenium.webdriver import ActionChains, Keys
 from selenium.webdriver.common.actions.action_builder import ActionBuilder
 from selenium.webdriver.common.actions.pointer_input import PointerInput
@@ -12,11 +13,144 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.wait import WebDriverWait
 
 from src.core.actions.base_actions import BaseActions
-from src.core.decorators import handle_stale_element, log_requests
-from src.data.consts import EXPLICIT_WAIT, QUICK_WAIT
+from src.core.decorators import handle_stale_element, log_requests, changes_ui, charges_wait
+from src.core.driver.network_monitor import NetworkMonitor
+from src.data.consts import EXPLICIT_WAIT, QUICK_WAIT, WARNING_ICON
 from src.utils.assert_utils import soft_assert
 from src.utils.logging_utils import logger
 
+# Resolve a selenium locator (by, value) to a list of elements inside the browser
+JS_LOCATOR_STRATEGIES = {By.XPATH, By.CSS_SELECTOR, By.ID, By.NAME, By.CLASS_NAME, By.TAG_NAME}
+
+JS_FIND_ALL = """
+function findAll(by, value, root) {
+    root = root || document;
+    if (by === 'xpath') {
+        const res = document.evaluate(value, root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        return Array.from({length: res.snapshotLength}, (_, i) => res.snapshotItem(i));
+    }
+    const css = {
+        'css selector': value,
+        'id': `[id="${value}"]`,
+        'name': `[name="${value}"]`,
+        'class name': `.${value}`,
+        'tag name': value,
+    }[by];
+    if (css === undefined) throw new Error(`Unsupported locator strategy: ${by}`);
+    return Array.from(root.querySelectorAll(css));
+}
+"""
+
+JS_READ_ELEMENTS = JS_FIND_ALL + """
+const [by, value, names] = arguments;
+
+function isShown(el) {
+    return !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length) && getComputedStyle(el).visibility !== 'hidden';
+}
+
+function getAttr(el, name) {
+    // same as WebElement.get_attribute: property if any, else attribute
+    const prop = el[name];
+    if (typeof prop === 'boolean') return prop ? 'true' : null;
+    if (prop !== undefined && prop !== null && typeof prop !== 'object' && typeof prop !== 'function') return String(prop);
+    return el.getAttribute(name);
+}
+
+return findAll(by, value).map(el => ({
+    text: isShown(el) ? (el.innerText || '').trim() : '',
+    displayed: isShown(el),
+    enabled: !el.disabled,
+    attrs: Object.fromEntries((names || []).map(name => [name, getAttr(el, name)])),
+}));
+"""
+
+JS_WAIT_DOM_STABLE = JS_FIND_ALL + """
+const [by, value, quietMs, timeoutMs, watchText, done] = arguments;
+const scope = (by && findAll(by, value)[0]) || document.body;
+
+let quietTimer, deadline;
+const finish = (stable) => {
+    observer.disconnect();
+    clearTimeout(quietTimer);
+    clearTimeout(deadline);
+    done(stable);
+};
+const observer = new MutationObserver(() => {
+    clearTimeout(quietTimer);
+    quietTimer = setTimeout(() => finish(true), quietMs);
+});
+
+observer.observe(scope, {
+    childList: true,
+    subtree: true,
+    characterData: watchText,
+    attributes: true,
+    attributeFilter: ['class', 'style', 'disabled', 'hidden', 'aria-hidden', 'aria-expanded'],
+});
+quietTimer = setTimeout(() => finish(true), quietMs);
+deadline = setTimeout(() => finish(false), timeoutMs);
+"""
+
+# Same visibility check as WebElement.is_displayed (selenium atom)
+JS_IS_DISPLAYED = pkgutil.get_data("selenium.webdriver.remote", "isDisplayed.js").decode("utf8")
+
+JS_CHECK_DISPLAYED = JS_FIND_ALL + f"const isDisplayed = ({JS_IS_DISPLAYED});" + """
+const [locators, isDisplay, timeoutMs, pollMs, done] = arguments;
+const deadline = Date.now() + timeoutMs;
+
+function check() {
+    // first match only, as find_element
+    const results = locators.map(([by, value]) => {
+        const el = findAll(by, value)[0];
+        return !!(el && isDisplayed(el)) === isDisplay;
+    });
+    if (results.every(Boolean) || Date.now() >= deadline) done(results);
+    else setTimeout(check, pollMs);
+}
+check();
+"""
+
+JS_FILL_FORM = JS_FIND_ALL + """
+const [fields] = arguments;
+const elements = fields.map(([by, value]) => findAll(by, value)[0]);
+if (!elements.every(Boolean)) return false;  // nothing set until all fields are rendered
+
+// native setter, as React tracks the value set through the element instance and ignores the event otherwise
+const setters = elements.map(el => (Object.getOwnPropertyDescriptor(Object.getPrototypeOf(el), 'value') || {}).set);
+if (!setters.every(Boolean)) return 'unsupported';  // not an input/ textarea/ select, nothing set
+
+elements.forEach((el, i) => {
+    el.focus();
+    setters[i].call(el, fields[i][2]);
+    el.dispatchEvent(new Event('input', {bubbles: true}));
+    el.dispatchEvent(new Event('change', {bubbles: true}));
+    el.blur();
+});
+return true;
+"""
+
+JS_READ_VALUES = JS_FIND_ALL + """
+return arguments[0].map(([by, value]) => {
+    const el = findAll(by, value)[0];
+    return el ? el.value : null;
+});
+"""
+
+JS_SNAPSHOT_TABLE = JS_FIND_ALL + """
+const [by, value, cellSelector, keyAttr] = arguments;
+let rows = findAll(by, value);
+rows = rows.flatMap(row => ['TABLE', 'TBODY', 'THEAD'].includes(row.tagName) ? Array.from(row.querySelectorAll('tr')) : [row]);
+
+return rows.map(row => {
+    const cells = {};
+    for (const cell of row.querySelectorAll(cellSelector)) {
+        const key = cell.getAttribute(keyAttr);
+        if (key !== null && !(key in cells)) cells[key] = (cell.innerText || cell.textContent || '').trim();
+    }
+    return cells;
+}).filter(cells => Object.keys(cells).length);
+"""
+
 
 class WebActions(BaseActions):
     def __init__(self, driver=None):
@@ -40,6 +174,7 @@ class WebActions(BaseActions):
             self._action_chains.double_click(element).perform()
             element.send_keys(str(value))
 
+    @changes_ui
     @handle_stale_element
     @log_requests
     def send_keys(self, locator, value, use_action_chain=False, timeout=EXPLICIT_WAIT):
@@ -60,6 +195,42 @@ class WebActions(BaseActions):
             sent_value = element.get_attribute("value")
             logger.debug(f"> Resent value: {sent_value!r}")
 
+    @charges_wait
+    def _set_values(self, fields: dict[tuple[str, str], str], timeout=EXPLICIT_WAIT) -> bool:
+        """Set all values in one script once all fields are rendered, False if not set (not rendered, no value setter)"""
+        wait = self._wait if timeout == EXPLICIT_WAIT else WebDriverWait(self._driver, timeout)
+        args = [[*locator, value] for locator, value in fields.items()]
+
+        try:
+            return wait.until(lambda d: d.execute_script(JS_FILL_FORM, args)) is True
+
+        except (TimeoutException, JavascriptException):
+            return False
+
+    @changes_ui
+    @log_requests
+    def fill_form(self, fields: dict[tuple[str, str], any], timeout=EXPLICIT_WAIT) -> None:
+        """
+        Set all values in one script firing the input/ change events React listens to, then read them back at once.
+        Fields keeping another value are typed again with send_keys.
+        """
+        fields = {locator: str(value) for locator, value in fields.items() if value is not None}
+        if not fields:
+            return
+
+        if not all(by in JS_LOCATOR_STRATEGIES for by, _ in fields):
+            return super().fill_form(fields, timeout)
+
+        if not self._set_values(fields, timeout):  # send_keys types them, or raises/ logs missing fields as usual
+            return super().fill_form(fields, QUICK_WAIT)
+
+        sent_values = self._driver.execute_script(JS_READ_VALUES, [list(locator) for locator in fields])
+        for (locator, value), sent_value in zip(fields.items(), sent_values):
+            if sent_value != value:
+                logger.warning(f"> Sent value: {sent_value} != Input value: {value}. Retry sending: {value!r}")
+                self.send_keys(locator, value, timeout=QUICK_WAIT)
+
+    @changes_ui
     @handle_stale_element
     @log_requests
     def click_by_offset(
@@ -98,28 +269,106 @@ class WebActions(BaseActions):
 
         return res
 
+    @charges_wait
+    def _read_elements(self, locator: tuple[str, str], names: list[str] = None, timeout=EXPLICIT_WAIT, show_log=True) -> list[dict]:
+        """Read text, state and attributes of all elements matching the locator in one script call"""
+        wait = self._wait if timeout == EXPLICIT_WAIT else WebDriverWait(self._driver, timeout)
+
+        try:
+            return wait.until(lambda d: d.execute_script(JS_READ_ELEMENTS, *locator, names) or False)
+
+        except TimeoutException as e:
+            if show_log:
+                logger.warning(f"{WARNING_ICON} Elements not found for {locator}: {type(e).__name__} after {timeout}(s)")
+
+        return []
+
+    def is_displayed_now(self, locator: tuple[str, str]) -> bool:
+        return any(item["displayed"] for item in self._driver.execute_script(JS_READ_ELEMENTS, *locator, []))
+
+    def get_texts(self, locator: tuple[str, str], timeout=EXPLICIT_WAIT, show_log=True) -> list[str]:
+        return [item["text"] for item in self._read_elements(locator, timeout=timeout, show_log=show_log)]
+
+    def get_attributes(self, locator: tuple[str, str], names: str | list[str], timeout=EXPLICIT_WAIT, show_log=True) -> list[dict]:
+        names = [names] if isinstance(names, str) else names
+        return [item["attrs"] for item in self._read_elements(locator, names, timeout, show_log)]
+
+    def get_states(self, locator: tuple[str, str], timeout=EXPLICIT_WAIT, show_log=True) -> list[dict]:
+        return [
+            dict(displayed=item["displayed"], enabled=item["enabled"])
+            for item in self._read_elements(locator, timeout=timeout, show_log=show_log)
+        ]
+
+    @charges_wait
+    def check_elements_displayed(self, locators: list[tuple[str, str]], timeout=EXPLICIT_WAIT, is_display=True) -> dict:
+        """Check all locators in one script, polling in the browser until all pass or timeout"""
+        if not all(by in JS_LOCATOR_STRATEGIES for by, _ in locators):
+            return super().check_elements_displayed(locators, timeout, is_display)
+
+        try:
+            results = self._driver.execute_async_script(
+                JS_CHECK_DISPLAYED, [list(locator) for locator in locators], is_display, int(timeout * 1000), 100
+            )
+        except TimeoutException:  # script timeout shorter than timeout
+            return super().check_elements_displayed(locators, QUICK_WAIT, is_display)
+
+        return dict(zip(locators, results))
+
+    @charges_wait
+    def snapshot_table(
+            self,
+            locator: tuple[str, str],
+            key_attr="data-testid",
+            cell_selector: str = None,
+            timeout=EXPLICIT_WAIT,
+            show_log=True,
+    ) -> list[dict[str, str]]:
+        """
+        Read rows and cells of a table with a single script call.
+        :param locator: Locator of the rows (or of the table/ tbody containing them)
+        :param key_attr: Cell attribute used as key of the cell text
+        :param cell_selector: CSS selector of the cells inside a row (default: cells having key_attr)
+        :return: [{key_attr value: cell text}] per row, rows without cells are skipped, [] if none found after timeout
+        """
+        args = (JS_SNAPSHOT_TABLE, *locator, cell_selector or f"[{key_attr}]", key_attr)
+        wait = self._wait if timeout == EXPLICIT_WAIT else WebDriverWait(self._driver, timeout)
+
+        try:
+            return wait.until(lambda d: d.execute_script(*args) or False)
+
+        except TimeoutException as e:
+            if show_log:
+                logger.warning(f"{WARNING_ICON} Table rows not found for {locator}: {type(e).__name__} after {timeout}(s)")
+
+        return []
+
+    @changes_ui
     @log_requests
     def goto(self, url):
         """Navigate to a URL and wait for the page to be fully loaded."""
         self._driver.get(url)
 
+    @changes_ui
     @log_requests
     def refresh(self):
         self._driver.refresh()
 
     def get_current_url(self):
-        return self._driver.current_url
+        return self._cached_read(("url",), lambda: self._driver.current_url)
 
+    @changes_ui
     @log_requests
     def scroll_to_element(self, locator: tuple[str, str], timeout=EXPLICIT_WAIT):
         element = self.find_element(locator, timeout)
         self._driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", element)
 
+    @changes_ui
     @log_requests
     def scroll_picker_down(self, locator: tuple[str, str], timeout=EXPLICIT_WAIT):
         wheel = self.find_element(locator, timeout)
         self._action_chains.click_and_hold(wheel).move_by_offset(0, -50).release().pause(0.5).perform()
 
+    @changes_ui
     @log_requests
     def scroll_container_down(self, locator: tuple[str, str], scroll_step: float = 0.5):
         """Scroll a container element down by a smaller step to avoid missing items"""
@@ -133,6 +382,7 @@ class WebActions(BaseActions):
         except Exception as e:
             logger.warning(f"Error scrolling container {locator}: {e}")
 
+    @changes_ui
     @log_requests
     def drag_element_horizontal(self, locator: tuple[str, str], direction:Literal["left", "right"] | str = "left", timeout=EXPLICIT_WAIT):
         x_offset = -200 if direction == "left" else 200
@@ -147,6 +397,7 @@ class WebActions(BaseActions):
             action.pointer_action.pointer_up()
             action.perform()
 
+    @charges_wait
     def wait_for_url(self, url: str, timeout: int = EXPLICIT_WAIT, retries=1):
         """Wait for the current URL to match the expected URL with retry mechanism."""
         wait = self._wait if timeout == EXPLICIT_WAIT else WebDriverWait(self._driver, timeout)
@@ -163,10 +414,103 @@ class WebActions(BaseActions):
 
         return self._driver.current_url
 
+    @charges_wait
+    def wait_for_dom_stable(
+            self,
+            scope_locator: tuple[str, str] = None,
+            quiet_ms: int = 200,
+            timeout: float = EXPLICIT_WAIT,
+            watch_text=False,
+    ) -> bool:
+        """
+        Wait until the subtree of scope_locator had no DOM mutation for quiet_ms, use instead of fixed sleeps.
+        :param scope_locator: Element to observe (default/ not found: whole page), keep it narrow on pages with live prices
+        :param quiet_ms: Mutation free window (in milliseconds) considered as stable
+        :param timeout: Maximum wait (in seconds), the page is used as it is after that
+        :param watch_text: Also count text changes as mutations
+        :return: True if stable, False on timeout
+        """
+        by, value = scope_locator or (None, None)
+        try:
+            stable = self._driver.execute_async_script(JS_WAIT_DOM_STABLE, by, value, quiet_ms, int(timeout * 1000), watch_text)
+
+        except TimeoutException:  # script timeout shorter than timeout
+            stable = False
+
+        if not stable:
+            logger.debug(f"- DOM {'of ' + str(scope_locator) + ' ' if scope_locator else ''}still changing after {timeout}(s)")
+
+        return bool(stable)
+
+    @charges_wait
+    def wait_for_content(self, locator: tuple[str, str], timeout: float = EXPLICIT_WAIT, attribute: str = None) -> bool:
+        """
+        Wait until an element of locator has a non-empty text (or attribute, e.g. "value" of inputs filled async).
+        :return: True once filled, False on timeout
+        """
+        names = [attribute] if attribute else []
+
+        def _filled(driver) -> bool:
+            items = driver.execute_script(JS_READ_ELEMENTS, *locator, names)
+            return any((item["attrs"][attribute] if attribute else item["text"]) for item in items)
+
+        wait = self._wait if timeout == EXPLICIT_WAIT else WebDriverWait(self._driver, timeout)
+        try:
+            return wait.until(_filled)
+
+        except TimeoutException:
+            logger.debug(f"- {attribute or 'text'} of {locator} still empty after {timeout}(s)")
+
+        return False
+
+    @property
+    def network_monitoring(self) -> bool:
+        """True if browser requests are tracked (Chrome with --enable_cdp)"""
+        return NetworkMonitor.enabled
+
+    def network_requested_since(self, since: float, ignore_patterns: list[str] = None) -> bool:
+        """True if the browser sent a request after since (time.monotonic()), False if CDP is not enabled"""
+        return self.network_monitoring and NetworkMonitor.requested_since(since, ignore_patterns)
+
+    @charges_wait
+    def wait_for_network_idle(
+            self,
+            idle_ms: int = 500,
+            timeout: float = EXPLICIT_WAIT,
+            ignore_patterns: list[str] = None,
+            since: float = None,
+    ) -> bool:
+        """
+        Wait until no XHR/ fetch request is in flight and none finished for idle_ms (requires --enable_cdp).
+        :param idle_ms: Request free window (in milliseconds) considered as idle
+        :param timeout: Maximum wait (in seconds)
+        :param ignore_patterns: Url regex of long-lived/ polling requests to leave out (e.g. price streams)
+        :param since: time.monotonic() taken before the triggering action, wait for the requests it started
+        :return: True if idle, False on timeout or if CDP is not enabled
+        """
+        if not self.network_monitoring:
+            return False
+
+        end_time = time.time() + timeout
+        while True:
+            if hasattr(self._driver, 'get_performance_logs'):  # events not streamed
+                self._driver.get_performance_logs()
+
+            if NetworkMonitor.is_idle(idle_ms, ignore_patterns, since):
+                return True
+
+            if time.time() > end_time:
+                logger.debug(f"- Network not idle after {timeout}(s), pending: {NetworkMonitor.pending_requests(ignore_patterns)}")
+                return False
+
+            time.sleep(0.1)
+
+    @changes_ui
     def switch_to_iframe(self):
         iframe = self._wait.until(EC.presence_of_element_located((By.TAG_NAME, "iframe")))
         self._driver.switch_to.frame(iframe)
 
+    @changes_ui
     def switch_to_default(self):
         self._driver.switch_to.default_content()
 
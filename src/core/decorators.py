@@ -1,5 +1,6 @@
 import functools
 import inspect
+import itertools
 import json
 import time
 
@@ -7,15 +8,58 @@ import requests
 from selenium.common import StaleElementReferenceException, ElementNotInteractableException, \
     ElementClickInterceptedException
 
-from src.data.consts import WARNING_ICON, FAILED_ICON
+from src.apis.rate_limiter import RateLimiter, CircuitBreaker, RetryBudget, CircuitOpenError, RetryBudgetExceeded
+from src.core.actions.wait_ledger import WaitLedger
+from src.data.consts import WARNING_ICON, FAILED_ICON, API_LOG_SAMPLE_RATE
 from src.data.project_info import StepLogs
 from src.utils.allure_utils import attach_verify_table, log_verification_result, attach_screenshot
 from src.utils.format_utils import format_request_log
-from src.utils.logging_utils import logger
+from src.utils.logging_utils import logger, LazyLog
+
+_request_counter = itertools.count()
+
+
+def _option_reader(func, skip=0, **fallbacks):
+    """
+    Resolve where the given options of func are passed, once at decoration time.
+    Returns read(args, kwargs) -> {option: value}, only doing index and dict lookups per call.
+    :param skip: Number of leading positional args not included in args passed to read (e.g. self)
+    :param fallbacks: option: value to use when func has no such parameter
+    """
+    params = list(inspect.signature(func).parameters.values())
+    positional = [p.name for p in params if p.kind in (p.POSITIONAL_ONLY, p.POSITIONAL_OR_KEYWORD)]
+    by_name = {p.name: p for p in params if p.kind not in (p.VAR_POSITIONAL, p.VAR_KEYWORD)}
+
+    specs = []  # (option, index in args, default, accepts keyword)
+    for name, fallback in fallbacks.items():
+        param = by_name.get(name)
+        if param is None:
+            specs.append((name, None, fallback, False))
+            continue
+
+        index = positional.index(name) - skip if name in positional else None
+        default = None if param.default is param.empty else param.default
+        specs.append((name, index, default, param.kind != param.POSITIONAL_ONLY))
+
+    def read(args, kwargs):
+        res = {}
+        for name, index, default, keyword in specs:
+            if index is not None and 0 <= index < len(args):
+                res[name] = args[index]
+            elif keyword:
+                res[name] = kwargs.get(name, default)
+            else:
+                res[name] = default
+        return res
+
+    return read
 
 
 def log_requests(func):
-    """Decorator to log candlestick requests using Chrome DevTools Protocol"""
+    """
+    Decorator to log candlestick requests using Chrome DevTools Protocol.
+    No-op when the network events are streamed by CDPListener, performance log is only attached as fallback.
+    """
 
     @functools.wraps(func)
     def wrapper(self, *args, **kwargs):
@@ -35,16 +79,41 @@ def log_requests(func):
     return wrapper
 
 
+def changes_ui(func):
+    """
+    Record when an action changing the UI starts (see BaseActions.last_ui_action),
+    end the DOM epoch (cached elements, reads and page snapshot) once it is done
+    """
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        self.last_ui_action = time.monotonic()
+        try:
+            return func(self, *args, **kwargs)
+        finally:
+            self.end_dom_epoch()
+
+    return wrapper
+
+
+def charges_wait(func):
+    """Charge the time spent in the wait to the current test and page-object method, see WaitLedger"""
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        return WaitLedger.charge(func.__name__, lambda: func(self, *args, **kwargs))
+
+    return wrapper
+
+
 def attach_table_details(func):
+    read_options = _option_reader(func, check_contains=None, log_details=None, desc="", err_msg="")
+
     @functools.wraps(func)
     def _wrapper(*args, **kwargs):
         __tracebackhide__ = True
 
-        # Use inspect to get all function parameters including defaults
-        sig = inspect.signature(func)
-        bound_args = sig.bind(*args, **kwargs)
-        bound_args.apply_defaults()  # This applies default values
-        all_args = bound_args.arguments
+        all_args = read_options(args, kwargs)
 
         actual, expected, *_ = args
 
@@ -88,26 +157,30 @@ def attach_table_details(func):
 
 
 def handle_stale_element(func):
+    read_options = _option_reader(func, skip=1, raise_exception=None)
+
     @functools.wraps(func)
     def wrapper(self, *args, **kwargs):
         __tradebackhide__ = True
 
-        # Use inspect to get all function parameters including defaults
-        sig = inspect.signature(func)
-        bound_args = sig.bind(self, *args, **kwargs)
-        bound_args.apply_defaults()  # This applies default values
-        all_args = bound_args.arguments
-
         max_retries = 3
-        raise_exception = all_args.get("raise_exception")
+        raise_exception = read_options(args, kwargs)["raise_exception"]
+        resolved_again = False
 
-        for attempt in range(max_retries + 1):  # +1 for initial attempt
+        attempt = 0
+        while attempt <= max_retries:  # +1 for initial attempt
             try:
                 return func(self, *args, **kwargs)
             except (StaleElementReferenceException, ElementNotInteractableException, ElementClickInterceptedException) as e:
 
-                if attempt < max_retries:
-                    logger.warning(f"{WARNING_ICON} {type(e).__name__} for locator {args[0]} (attempt {attempt + 1}/{max_retries + 1}), retrying...")
+                if isinstance(e, StaleElementReferenceException) and self.end_dom_epoch() and not resolved_again:
+                    # element cached in this DOM epoch went stale, resolve it again without using a retry
+                    resolved_again = True
+                    continue
+
+                attempt += 1
+                if attempt <= max_retries:
+                    logger.warning(f"{WARNING_ICON} {type(e).__name__} for locator {args[0]} (attempt {attempt}/{max_retries + 1}), retrying...")
                     continue
 
                 else:
@@ -134,21 +207,30 @@ def after_request(base_delay=1.0, max_delay=10.0, max_retries=3):
     """
 
     def decorator(func):
+        # Option positions and defaults are resolved once here, not on every request
+        read_options = _option_reader(
+            func, skip=1, endpoint="", apply_retries=True, fields_to_show=None, parse_result=True, truncate_len=5
+        )
+
         @functools.wraps(func)
         def wrapper(self, *args, **kwargs):
             __tracebackhide__ = True
 
-            # Extract optional arguments
-            sig = inspect.signature(func)
-            bound_args = sig.bind(self, *args, **kwargs)
-            bound_args.apply_defaults()
-            all_args = bound_args.arguments
-
             # Get options with defaults
-            apply_retries = all_args.get("apply_retries", True)
-            fields_to_show = all_args.get("fields_to_show", None)
-            parse_result = all_args.get("parse_result", True)
-            truncate_len = all_args.get("truncate_len", 5)
+            options = read_options(args, kwargs)
+            endpoint = options["endpoint"]
+            apply_retries = options["apply_retries"]
+            fields_to_show = options["fields_to_show"]
+            parse_result = options["parse_result"]
+            truncate_len = options["truncate_len"]
+
+            def _log_request(resp):
+                # Failed requests are always logged, successful ones are sampled by API_LOG_SAMPLE_RATE
+                if getattr(resp, "ok", False) and next(_request_counter) % API_LOG_SAMPLE_RATE:
+                    return
+
+                # Formatting is deferred until the record is emitted, skipped entirely if debug log is off
+                logger.debug("%s", LazyLog(format_request_log, resp, log_resp=True, fields_to_show=fields_to_show, truncate_len=truncate_len))
 
             def _parse_result(resp):
                 if not parse_result:
@@ -160,37 +242,76 @@ def after_request(base_delay=1.0, max_delay=10.0, max_retries=3):
                 except (json.JSONDecodeError, AttributeError):
                     return getattr(resp, "text", resp)
 
+            def _is_unauthorized(resp):
+                # Expired/ revoked token: login again and resend with the new token
+                return getattr(resp, "status_code", None) == 401 and self.reauthenticate()
+
+            def _send():
+                # Refresh an expiring token, fail fast on a broken endpoint, wait for a rate limit token, then send
+                self.refresh_token()
+                CircuitBreaker.check(endpoint)
+                RateLimiter.acquire(endpoint)
+
+                try:
+                    resp = func(self, *args, **kwargs)
+                except requests.RequestException:
+                    CircuitBreaker.record(endpoint, success=False)
+                    raise
+
+                CircuitBreaker.record(endpoint, success=resp.status_code < 500)
+
+                retry_after = RateLimiter.get_retry_after(resp)
+                if retry_after:
+                    RateLimiter.block(endpoint, retry_after)
+
+                _log_request(resp)
+                return resp
+
+            def _backoff(attempt, resp=None):
+                delay = max(min(base_delay * (2 ** attempt), max_delay), RateLimiter.get_retry_after(resp))
+                RetryBudget.consume(delay)
+                return delay
+
             # Handle single request without retries
             if not apply_retries:
-                response = func(self, *args, **kwargs)
-                logger.debug(f"{format_request_log(response, log_resp=True, fields_to_show=fields_to_show, truncate_len=truncate_len)}")
+                response = _send()
+
+                if _is_unauthorized(response):
+                    response = _send()
+
                 return _parse_result(response)
 
             # Handle requests with retries
             for attempt in range(max_retries):
                 try:
-                    response = func(self, *args, **kwargs)
-                    logger.debug(f"{format_request_log(response, log_resp=True, fields_to_show=fields_to_show, truncate_len=truncate_len)}")
+                    response = _send()
 
                     if response.ok:
                         return _parse_result(response)
 
+                    if attempt < max_retries - 1 and _is_unauthorized(response):
+                        continue
+
                     # Handle failed response
                     if attempt == max_retries - 1:
                         error_msg = f"{FAILED_ICON} API request failed with status_code: {response.status_code} - {response.text.strip()}"
                         logger.error(error_msg)
                         raise requests.exceptions.RequestException(error_msg)
 
-                    delay = min(base_delay * (2 ** attempt), max_delay)
-                    logger.warning(f"Request failed (attempt {attempt + 1}/{max_retries}), status_code: {response.status_code} - {response.text.strip()}, retrying in {delay:2f}s...")
+                    delay = _backoff(attempt, response)
+                    logger.warning(f"Request failed (attempt {attempt + 1}/{max_retries}), status_code: {response.status_code} - {response.text.strip()}, retrying in {delay:.2f}s...")
                     time.sleep(delay)
 
+                except (CircuitOpenError, RetryBudgetExceeded) as e:
+                    logger.error(f"{FAILED_ICON} {e}")
+                    raise
+
                 except Exception as e:
                     # Handle exceptions during request
                     if attempt == max_retries - 1:
                         raise e
 
-                    delay = min(base_delay * (2 ** attempt), max_delay)
+                    delay = _backoff(attempt)
                     logger.warning(f"Request failed (attempt {attempt + 1}/{max_retries}), retrying in {delay:.2f}s. Error: {e}")
                     time.sleep(delay)
 
@@ -0,0 +1,82 @@
+"""
+Micro-benchmark of the per-call overhead added by the framework decorators.
+
+Compares option extraction with inspect.signature().bind() on every call (previous implementation)
+against the reader resolved once at decoration time (_option_reader), and measures the full
+handle_stale_element / after_request wrappers around no-op functions.
+
+Run:
+    python -m src.core.decorators_benchmark --number 100000
+"""
+import argparse
+import inspect
+import timeit
+
+import requests
+
+from src.apis.rate_limiter import RateLimiter
+from src.core.decorators import _option_reader, handle_stale_element, after_request
+
+
+class _Actions:
+    """Stand-in with the signatures of the decorated WebActions/ BaseAPI methods"""
+    _driver = None
+
+    def click(self, locator, timeout=None, raise_exception=True, show_log=True):
+        return locator
+
+    def get(self, endpoint: str, params: dict = None, fields_to_show=None, apply_retries=True, parse_result=True, truncate_len=5):
+        resp = requests.Response()
+        resp.status_code = 200
+        return resp
+
+    def refresh_token(self):
+        pass
+
+    def reauthenticate(self):
+        return False
+
+
+def _bind_options(func, self, *args, **kwargs):
+    """Previous implementation: introspect the function on every call"""
+    bound_args = inspect.signature(func).bind(self, *args, **kwargs)
+    bound_args.apply_defaults()
+    return bound_args.arguments
+
+
+def _timeit(stmt, number) -> float:
+    """Return per-call time in microseconds, best of 5 runs"""
+    return min(timeit.repeat(stmt, number=number, repeat=5)) / number * 1e6
+
+
+def run(number: int) -> dict[str, float]:
+    """Return {case: per-call time in microseconds}"""
+    actions = _Actions()
+    locator = ("css selector", "#id")
+    read_options = _option_reader(_Actions.click, skip=1, raise_exception=None)
+
+    wrapped_click = handle_stale_element(_Actions.click)
+    wrapped_get = after_request()(_Actions.get)
+    RateLimiter.RATES["bench"] = (1e9, 1e9)  # measure the limiter bookkeeping, not throttling
+
+    return {
+        "options - bind per call (before)": _timeit(lambda: _bind_options(_Actions.click, actions, locator, raise_exception=False), number),
+        "options - cached reader (after)": _timeit(lambda: read_options((locator,), dict(raise_exception=False)), number),
+        "click - bare": _timeit(lambda: _Actions.click(actions, locator), number),
+        "click - handle_stale_element": _timeit(lambda: wrapped_click(actions, locator), number),
+        "get - bare": _timeit(lambda: _Actions.get(actions, "/bench", parse_result=False), number),
+        "get - after_request": _timeit(lambda: wrapped_get(actions, "/bench", parse_result=False), number),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-call overhead of the framework decorators")
+    parser.add_argument("--number", type=int, default=100000, help="Calls per measurement")
+    args = parser.parse_args()
+
+    for case, usec in run(args.number).items():
+        print(f"{case:<36}{usec:>8.2f} µs")
+
+
+if __name__ == "__main__":
+    main()
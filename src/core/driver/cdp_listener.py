@@ -0,0 +1,166 @@
+import itertools
+import json
+import re
+import threading
+from collections import deque
+
+import requests
+import websocket
+
+from src.core.driver.network_monitor import NetworkMonitor
+from src.utils import DotDict
+from src.utils.logging_utils import logger
+
+
+class CDPListener:
+    """
+    Receives CDP Network events of the browser as they arrive, on a background thread attached to the DevTools websocket,
+    instead of draining the performance log through the WebDriver command channel around every action.
+
+    Events update NetworkMonitor (in-flight requests), and requests matching URL_FILTERS are timed
+    into a bounded store (last MAX_RECORDS), queried with get_timings.
+    handle_event is also fed from the performance log when the DevTools websocket is not reachable (remote grid).
+    """
+
+    URL_FILTERS = [r"/candlestick"]
+    MAX_RECORDS = 500
+
+    streaming = False
+
+    _ws = None
+    _thread = None
+    _send_lock = threading.Lock()
+    _store_lock = threading.Lock()
+    _ids = itertools.count(1)
+    _pending: dict[str, DotDict] = {}  # requestId: record of filtered requests not finished yet
+    _records: deque = deque(maxlen=MAX_RECORDS)
+
+    # ----------------------------
+    # Request store
+    # ----------------------------
+    @classmethod
+    def handle_event(cls, method: str, params: dict) -> None:
+        NetworkMonitor.handle_event(method, params)
+
+        if method == "Network.requestWillBeSent":
+            url = params["request"]["url"]
+            if any(re.search(pattern, url) for pattern in cls.URL_FILTERS):
+                with cls._store_lock:
+                    cls._pending[params["requestId"]] = DotDict(
+                        url=url, start_time=params["timestamp"], status=None, response_time=None
+                    )
+
+        elif method == "Network.responseReceived":
+            with cls._store_lock:
+                record = cls._pending.get(params["requestId"])
+                if record:
+                    record.status = params["response"]["status"]
+
+        elif method in ("Network.loadingFinished", "Network.loadingFailed"):
+            with cls._store_lock:
+                record = cls._pending.pop(params["requestId"], None)
+                if not record:
+                    return
+
+                record.response_time = params["timestamp"] - record.start_time
+                cls._records.append(record)
+
+            logger.debug(f"=========> API - {record.url}")
+            logger.debug(f"=========> Status: {record.status} -- Response time: {record.response_time:.2f} s")
+
+    @classmethod
+    def get_timings(cls, pattern: str = None) -> list[DotDict]:
+        """
+        Return finished requests (url, status, response_time in seconds) in completion order
+        :param pattern: Url regex to select part of the recorded requests
+        """
+        with cls._store_lock:
+            records = list(cls._records)
+        return [record for record in records if not pattern or re.search(pattern, record.url)]
+
+    @classmethod
+    def clear(cls) -> None:
+        with cls._store_lock:
+            cls._pending.clear()
+            cls._records.clear()
+
+    # ----------------------------
+    # DevTools websocket
+    # ----------------------------
+    @staticmethod
+    def _get_ws_url(driver) -> str | None:
+        # remote grid exposes the endpoint as capability, local chromedriver its debugger address
+        if ws_url := driver.capabilities.get("se:cdp"):
+            return ws_url
+
+        address = driver.capabilities.get("goog:chromeOptions", {}).get("debuggerAddress")
+        if address:
+            return requests.get(f"http://{address}/json/version", timeout=5).json()["webSocketDebuggerUrl"]
+
+        return None
+
+    @classmethod
+    def _send(cls, method: str, params: dict = None, session_id: str = None) -> None:
+        message = dict(id=next(cls._ids), method=method, params=params or {})
+        if session_id:
+            message["sessionId"] = session_id
+
+        with cls._send_lock:
+            cls._ws.send(json.dumps(message))
+
+    @classmethod
+    def _listen(cls, ws) -> None:
+        while True:
+            try:
+                message = json.loads(ws.recv())
+            except (websocket.WebSocketException, OSError, ValueError):
+                break  # closed by stop() or browser gone
+
+            method = message.get("method")
+            if not method:
+                continue  # command response
+
+            try:
+                if method == "Target.attachedToTarget":
+                    # every page (including new tabs) gets its own session, enable Network events on it
+                    cls._send("Network.enable", session_id=message["params"]["sessionId"])
+
+                elif method.startswith("Network."):
+                    cls.handle_event(method, message["params"])
+
+            except Exception as e:
+                logger.error(f"Error processing CDP event {method}: {str(e)}")
+
+        cls.streaming = False
+
+    @classmethod
+    def start(cls, driver) -> bool:
+        """Attach to the DevTools websocket of the browser, return False if it is not reachable"""
+        try:
+            ws_url = cls._get_ws_url(driver)
+            if not ws_url:
+                return False
+
+            cls._ws = websocket.create_connection(ws_url, timeout=10, suppress_origin=True)
+            cls._ws.settimeout(None)
+
+        except Exception as e:
+            logger.debug(f"- DevTools websocket not available: {str(e)}")
+            return False
+
+        cls._thread = threading.Thread(target=cls._listen, args=(cls._ws,), name="cdp-listener", daemon=True)
+        cls._thread.start()
+        cls._send("Target.setAutoAttach", dict(autoAttach=True, waitForDebuggerOnStart=False, flatten=True))
+
+        cls.streaming = True
+        return True
+
+    @classmethod
+    def stop(cls) -> None:
+        if cls._ws:
+            cls._ws.close()
+            cls._thread.join(timeout=5)
+
+        cls._ws = cls._thread = None
+        cls.streaming = False
+        cls.clear()
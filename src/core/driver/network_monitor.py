@@ -0,0 +1,87 @@
+import re
+import threading
+import time
+from collections import deque
+
+
+class NetworkMonitor:
+    """
+    Tracks in-flight XHR/ fetch requests of the browser from CDP Network events (Chrome with --enable_cdp),
+    so actions can wait for the requests they triggered instead of guessing from loader visibility.
+
+    Long-lived or polling requests (e.g. price streams) can be excluded from idle checks
+    globally with IGNORE_PATTERNS or per call with ignore_patterns (url regex).
+    """
+
+    TRACKED_TYPES = {"XHR", "Fetch"}
+    IGNORE_PATTERNS: list[str] = [
+        r"/chart/v\d+/candlestick",  # chart polling on trade pages
+        r"/market/v\d+/symbol/detail",  # live price polling of the selected symbol
+    ]
+
+    enabled = False
+
+    _inflight: dict[str, dict] = {}  # requestId: {url, start}
+    _finished: deque = deque(maxlen=500)  # (url, start, end) of recently finished requests
+    _lock = threading.Lock()
+
+    @classmethod
+    def reset(cls, enabled=False) -> None:
+        with cls._lock:
+            cls.enabled = enabled
+            cls._inflight.clear()
+            cls._finished.clear()
+
+    @classmethod
+    def handle_event(cls, method: str, params: dict) -> None:
+        """Update in-flight requests from a CDP Network event"""
+        if method == "Network.requestWillBeSent":
+            if params.get("type") in cls.TRACKED_TYPES:
+                with cls._lock:
+                    cls._inflight[params["requestId"]] = dict(url=params["request"]["url"], start=time.monotonic())
+
+        elif method in ("Network.loadingFinished", "Network.loadingFailed"):
+            with cls._lock:
+                request = cls._inflight.pop(params.get("requestId"), None)
+                if request:
+                    cls._finished.append((request["url"], request["start"], time.monotonic()))
+
+    @classmethod
+    def _is_ignored(cls, url: str, patterns: list[str]) -> bool:
+        return any(re.search(pattern, url) for pattern in patterns)
+
+    @classmethod
+    def pending_requests(cls, ignore_patterns: list[str] = None) -> list[str]:
+        """Urls of the in-flight requests not matching ignore patterns"""
+        patterns = cls.IGNORE_PATTERNS + (ignore_patterns or [])
+        with cls._lock:
+            return [item["url"] for item in cls._inflight.values() if not cls._is_ignored(item["url"], patterns)]
+
+    @classmethod
+    def is_idle(cls, idle_ms: int, ignore_patterns: list[str] = None, since: float = None) -> bool:
+        """
+        True if no request is in flight and none finished within the last idle_ms.
+        :param since: time.monotonic() of the triggering action, the idle window never starts before it
+        """
+        patterns = cls.IGNORE_PATTERNS + (ignore_patterns or [])
+
+        with cls._lock:
+            if any(not cls._is_ignored(item["url"], patterns) for item in cls._inflight.values()):
+                return False
+
+            last_activity = max(
+                (end for url, _, end in reversed(cls._finished) if not cls._is_ignored(url, patterns)), default=0
+            )
+
+        return time.monotonic() - max(last_activity, since or 0) >= idle_ms / 1000
+
+    @classmethod
+    def requested_since(cls, since: float, ignore_patterns: list[str] = None) -> bool:
+        """True if a request not matching ignore patterns started after since (time.monotonic())"""
+        patterns = cls.IGNORE_PATTERNS + (ignore_patterns or [])
+
+        with cls._lock:
+            started = [(item["url"], item["start"]) for item in cls._inflight.values()]
+            started += [(url, start) for url, start, _ in cls._finished]
+
+        return any(start >= since and not cls._is_ignored(url, patterns) for url, start in started)
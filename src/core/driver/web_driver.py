@@ -7,6 +7,8 @@ from botocore.config import Config
 from selenium import webdriver
 from selenium.webdriver import ChromeOptions, FirefoxOptions, SafariOptions
 
+from src.core.driver.cdp_listener import CDPListener
+from src.core.driver.network_monitor import NetworkMonitor
 from src.data.consts import WEB_APP_DEVICE
 from src.data.project_info import DriverList, RuntimeConfig
 from src.utils.logging_utils import logger
@@ -17,7 +19,6 @@ project_arn = os.getenv('DF_PROJECT_ARN')
 
 class WebDriver:
     _driver = None
-    _request_times = {}
 
     @classmethod
     def init_driver(cls, browser="chrome", headless=False, enable_cdp=False):
@@ -35,8 +36,9 @@ class WebDriver:
                 if headless:
                     options.add_argument("--headless")
 
-                # Enable Chrome DevTools Protocol if requested
-                if enable_cdp:
+                # Enable Chrome DevTools Protocol if requested, network events are read from the DevTools websocket
+                # locally, remote grids may not expose it so events are also buffered to the performance log there
+                if enable_cdp and RuntimeConfig.argo_cd:
                     options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
 
                 if RuntimeConfig.argo_cd:
@@ -59,62 +61,33 @@ class WebDriver:
                 else:
                     driver = webdriver.Chrome(options=options)
 
-                # --- If CDP enabled, attach logging ---
+                # --- If CDP enabled, attach network listener ---
                 if enable_cdp:
                     driver.execute_cdp_cmd('Network.enable', {})
-
-                    def process_browser_log_entry(entry):
-                        try:
-                            response = json.loads(entry['message'])['message']
-                            method = response.get('method')
-
-                            # request start
-                            if method == 'Network.requestWillBeSent':
-                                request_id = response['params']['requestId']
-                                url = response['params']['request']['url']
-                                if '/candlestick' in url:
-                                    cls._request_times[request_id] = {
-                                        'url': url,
-                                        'start_time': response['params']['timestamp'],
-                                        'status': None,
-                                        'response_time': None
-                                    }
-
-                            # response metadata
-                            elif method == 'Network.responseReceived':
-                                request_id = response['params']['requestId']
-                                if request_id in cls._request_times:
-                                    cls._request_times[request_id]['status'] = response['params']['response']['status']
-
-                            # response complete
-                            elif method == 'Network.loadingFinished':
-                                request_id = response['params']['requestId']
-                                if request_id in cls._request_times:
-                                    end_time = response['params']['timestamp']
-                                    start_time = cls._request_times[request_id]['start_time']
-                                    duration = end_time - start_time
-
-                                    req_data = cls._request_times[request_id]
-                                    req_data['response_time'] = duration
-
-                                    logger.debug(f"=========> API /candlestick - {req_data['url']}")
-                                    logger.debug(f"=========> Status: {req_data['status']} -- Response time: {req_data['response_time']:.2f} s")
-
-                                    del cls._request_times[request_id]
-
-                        except Exception as e:
-                            logger.error(f"Error processing browser log: {str(e)}")
-
-                    def get_performance_logs():
-                        try:
-                            browser_logs = driver.get_log('performance')
-                            for entry in browser_logs:
-                                process_browser_log_entry(entry)
-                        except Exception as e:
-                            logger.error(f"Error getting performance logs: {str(e)}")
-
-                    # attach helper to driver
-                    driver.get_performance_logs = get_performance_logs
+                    NetworkMonitor.reset(enabled=True)
+
+                    if not CDPListener.start(driver):
+                        if not RuntimeConfig.argo_cd:
+                            logger.warning("DevTools websocket not available, network events are not recorded")
+                            NetworkMonitor.reset()
+                        else:
+                            # fallback: drain performance log around actions (see log_requests)
+                            def get_performance_logs():
+                                try:
+                                    browser_logs = driver.get_log('performance')
+                                except Exception as e:
+                                    logger.error(f"Error getting performance logs: {str(e)}")
+                                    return
+
+                                for entry in browser_logs:
+                                    try:
+                                        message = json.loads(entry['message'])['message']
+                                        CDPListener.handle_event(message.get('method'), message.get('params', {}))
+                                    except Exception as e:
+                                        logger.error(f"Error processing browser log: {str(e)}")
+
+                            # attach helper to driver
+                            driver.get_performance_logs = get_performance_logs
 
             case "firefox":
                 options = FirefoxOptions()
@@ -143,4 +116,5 @@ class WebDriver:
             DriverList.all_drivers[RuntimeConfig.platform].quit()
             DriverList.all_drivers[RuntimeConfig.platform] = None
 
-        cls._request_times.clear()
+        CDPListener.stop()
+        NetworkMonitor.reset()
@@ -0,0 +1,350 @@
+"""
+Locator optimizer: collects every page-object locator, times it against a live or recorded DOM and proposes
+an equivalent CSS/ ID (web) or UiSelector/ accessibility id (Android, iOS) form, kept only if both match the same elements.
+
+Run against a recorded page (web: HTML opened in headless Chrome, mobile: page source XML):
+    python -m src.core.locator_optimizer web --source page.html --top 20
+    python -m src.core.locator_optimizer android --source screen.xml --output rewrites.json
+
+Or against the live DOM of a running session, e.g. from a breakpoint:
+    LocatorOptimizer(driver).run("web")
+
+Templated locators (with {}) can not be evaluated, their rewrite is listed as unverified.
+"""
+import argparse
+import importlib
+import json
+import pkgutil
+import re
+import time
+from pathlib import Path
+
+from appium.webdriver.common.appiumby import AppiumBy
+from selenium.webdriver.common.by import By
+
+from src.core.actions.page_snapshot import PageSnapshot
+from src.core.actions.web_actions import JS_FIND_ALL
+from src.utils import DotDict
+
+STRATEGIES = {getattr(AppiumBy, name) for name in dir(AppiumBy) if name.isupper()}
+
+# Signs of expensive XPath, listed in the report
+COSTLY_XPATH = {
+    "text()": "text node scan",
+    "translate(": "translate()",
+    "ancestor::": "ancestor walk",
+    "following-sibling::": "sibling walk",
+    "preceding-sibling::": "sibling walk",
+}
+
+JS_COMPARE_LOCATORS = JS_FIND_ALL + """
+const [original, candidate, repeat] = arguments;
+
+function measure(locator) {
+    let nodes;
+    const start = performance.now();
+    for (let i = 0; i < repeat; i++) nodes = findAll(locator[0], locator[1]);
+    return [nodes, (performance.now() - start) / repeat];
+}
+
+const [nodes, originalMs] = measure(original);
+const result = {count: nodes.length, original_ms: originalMs};
+
+if (candidate) {
+    const [candidateNodes, candidateMs] = measure(candidate);
+    result.candidate_ms = candidateMs;
+    result.identical = nodes.length === candidateNodes.length && nodes.every((node, i) => node === candidateNodes[i]);
+}
+return result;
+"""
+
+_STEP = re.compile(r"(//?)(\*|[A-Za-z][\w.-]*)((?:\[[^\[\]]+\])*)")
+_COND = re.compile(
+    r"""\s*(?:
+        @(?P<attr>[\w-]+)\s*=\s*(?P<value>'[^']*'|"[^"]*")
+        | (?P<func>contains|starts-with)\(\s*@(?P<func_attr>[\w-]+)\s*,\s*(?P<func_value>'[^']*'|"[^"]*")\s*\)
+        | @(?P<exists>[\w-]+)
+    )\s*""",
+    re.VERBOSE,
+)
+
+
+def _parse_conditions(predicate: str) -> list[tuple[str, str, str]] | None:
+    """"@a='x' and contains(@b,'y')" -> [("=", "a", "x"), ("contains", "b", "y")], None if not only attribute tests"""
+    conditions = []
+    for part in re.split(r"\s+and\s+", predicate):
+        match = _COND.fullmatch(part)
+        if not match:
+            return None
+
+        if match["attr"]:
+            conditions.append(("=", match["attr"], match["value"][1:-1]))
+        elif match["func"]:
+            conditions.append((match["func"], match["func_attr"], match["func_value"][1:-1]))
+        else:
+            conditions.append(("exists", match["exists"], ""))
+
+    return conditions
+
+
+def parse_xpath(xpath: str) -> list[tuple[str, str, list]] | None:
+    """
+    Parse simple XPath made of steps with attribute predicates only: [(axis, tag, conditions)].
+    Return None for anything else (positions, text(), axes, functions other than contains/ starts-with)
+    """
+    steps, pos = [], 0
+    while pos < len(xpath):
+        match = _STEP.match(xpath, pos)
+        if not match:
+            return None
+
+        axis, tag, predicates = match.groups()
+        conditions = []
+        for predicate in re.findall(r"\[([^\[\]]+)\]", predicates):
+            parsed = _parse_conditions(predicate)
+            if parsed is None:
+                return None
+            conditions.extend(parsed)
+
+        steps.append((axis, tag, conditions))
+        pos = match.end()
+
+    return steps if steps and steps[0][0] == "//" else None
+
+
+def _css_string(value: str) -> str:
+    return f"'{value}'" if "'" not in value else '"' + value.replace('"', '\\"') + '"'
+
+
+def _ui_string(value: str) -> str:
+    return '"' + value.replace('"', '\\"') + '"'
+
+
+CSS_OPERATORS = {"=": "=", "contains": "*=", "starts-with": "^="}
+
+UI_SELECTOR_CONDITIONS = {
+    ("=", "resource-id"): "resourceId",
+    ("=", "text"): "text",
+    ("contains", "text"): "textContains",
+    ("starts-with", "text"): "textStartsWith",
+    ("=", "content-desc"): "description",
+    ("contains", "content-desc"): "descriptionContains",
+    ("starts-with", "content-desc"): "descriptionStartsWith",
+    ("=", "class"): "className",
+}
+
+
+def rewrite_locator(locator: tuple[str, str], platform: str) -> tuple[str, str] | None:
+    """Return a faster locator selecting the same elements as the XPath locator, None if there is no known rewrite"""
+    by, value = locator
+    if by != By.XPATH or not (steps := parse_xpath(value)):
+        return None
+
+    if platform in ("web", "web_app"):
+        if len(steps) == 1 and steps[0][1] == "*" and len(steps[0][2]) == 1 and steps[0][2][0][:2] == ("=", "id"):
+            return By.ID, steps[0][2][0][2]
+
+        selectors = []
+        for axis, tag, conditions in steps:
+            attrs = "".join(
+                f"[{attr}]" if op == "exists" else f"[{attr}{CSS_OPERATORS[op]}{_css_string(val)}]"
+                for op, attr, val in conditions
+            )
+            selector = (tag if tag != "*" or not attrs else "") + attrs
+            selectors.append(selector if not selectors else (" > " if axis == "/" else " ") + selector)
+
+        return By.CSS_SELECTOR, "".join(selectors)
+
+    if len(steps) > 1:
+        return None
+
+    _, tag, conditions = steps[0]
+
+    if platform == "ios":
+        if tag == "*" and len(conditions) == 1 and conditions[0][:2] == ("=", "name"):
+            return AppiumBy.ACCESSIBILITY_ID, conditions[0][2]
+        return None
+
+    if tag == "*" and len(conditions) == 1:
+        op, attr, val = conditions[0]
+        if (op, attr) == ("=", "content-desc"):
+            return AppiumBy.ACCESSIBILITY_ID, val
+
+        # ids without package would be completed with the app package by UiAutomator2 (React Native testIDs have none)
+        if (op, attr) == ("=", "resource-id") and ":id/" in val:
+            return AppiumBy.ID, val
+
+    if tag != "*":
+        conditions = [("=", "class", tag)] + conditions
+
+    if not conditions or any((op, attr) not in UI_SELECTOR_CONDITIONS for op, attr, _ in conditions):
+        return None
+
+    calls = "".join(f".{UI_SELECTOR_CONDITIONS[op, attr]}({_ui_string(val)})" for op, attr, val in conditions)
+    return AppiumBy.ANDROID_UIAUTOMATOR, f"new UiSelector(){calls}"
+
+
+class LocatorRegistry:
+    """Locators ((by, value) class attributes) of all page objects of a platform"""
+
+    @staticmethod
+    def collect(platform: str) -> list[DotDict]:
+        """Return [DotDict(owner, locator)], owner as <module>.<Class>.<attribute>"""
+        package = importlib.import_module(f"src.page_object.{platform}")
+        entries = []
+
+        for module_info in pkgutil.walk_packages(package.__path__, f"{package.__name__}."):
+            module = importlib.import_module(module_info.name)
+
+            for cls in vars(module).values():
+                if not isinstance(cls, type) or cls.__module__ != module.__name__:
+                    continue
+
+                for name, value in vars(cls).items():
+                    if (
+                            isinstance(value, tuple) and len(value) == 2
+                            and all(isinstance(item, str) for item in value) and value[0] in STRATEGIES
+                    ):
+                        name = re.sub(rf"^_{cls.__name__.lstrip('_')}__", "__", name)  # un-mangle private names
+                        owner = f"{module.__name__.removeprefix('src.page_object.')}.{cls.__name__}.{name}"
+                        entries.append(DotDict(owner=owner, locator=value))
+
+        return entries
+
+
+class LocatorOptimizer:
+    """
+    Time the locators of a platform and their rewrites against a live driver or a recorded mobile page source,
+    a rewrite is verified if both locators match the same elements in the same order.
+    """
+
+    def __init__(self, driver=None, snapshot: PageSnapshot = None, repeat: int = 20):
+        if not (driver or snapshot):
+            raise ValueError("A driver or a page snapshot is required")
+
+        self.driver = driver
+        self.snapshot = snapshot
+        self.repeat = repeat
+
+    def _measure_mobile(self, locator) -> tuple[list, float]:
+        """Return (matched element ids or nodes, seconds per lookup)"""
+        start = time.perf_counter()
+        for _ in range(self.repeat):
+            if self.snapshot:
+                nodes = self.snapshot._match(locator)
+            else:
+                nodes = [element.id for element in self.driver.find_elements(*locator)]
+        return nodes, (time.perf_counter() - start) / self.repeat
+
+    def compare(self, locator: tuple[str, str], candidate: tuple[str, str] = None, web=False) -> DotDict:
+        """Return DotDict(count, original_ms, candidate_ms, identical) of a locator and its rewrite"""
+        if self.snapshot and not (
+                PageSnapshot.supports(locator) and (not candidate or PageSnapshot.supports(candidate))
+        ):
+            return DotDict(count=None, original_ms=None, candidate_ms=None, identical=None)
+
+        if web:  # measured in the page, without the WebDriver roundtrip
+            result = self.driver.execute_script(JS_COMPARE_LOCATORS, locator, candidate, self.repeat)
+            return DotDict(dict(candidate_ms=None, identical=None) | result)
+
+        nodes, original_time = self._measure_mobile(locator)
+        result = DotDict(count=len(nodes), original_ms=original_time * 1000, candidate_ms=None, identical=None)
+
+        if candidate:
+            candidate_nodes, candidate_time = self._measure_mobile(candidate)
+            result.candidate_ms = candidate_time * 1000
+            result.identical = len(nodes) == len(candidate_nodes) and all(
+                a is b or a == b for a, b in zip(nodes, candidate_nodes)
+            )
+
+        return result
+
+    def run(self, platform: str) -> list[DotDict]:
+        """Return one DotDict per page-object locator, the slowest first"""
+        results, measured = [], {}
+
+        for entry in LocatorRegistry.collect(platform):
+            locator = entry.locator
+            entry.rewrite = rewrite_locator(locator, platform)
+            entry.costs = sorted({hint for pattern, hint in COSTLY_XPATH.items() if pattern in locator[1]})
+
+            if "{}" in locator[1]:
+                entry.update(count=None, original_ms=None, candidate_ms=None, identical=None, status="templated")
+            else:
+                if locator not in measured:
+                    measured[locator] = self.compare(locator, entry.rewrite, web=platform in ("web", "web_app"))
+
+                entry.update(measured[locator])
+                if entry.original_ms is None:
+                    entry.status = "not evaluated"
+                elif not entry.rewrite:
+                    entry.status = "no rewrite"
+                elif not entry.count:
+                    entry.status = "no match"  # nothing to compare on this page
+                else:
+                    entry.status = "verified" if entry.identical else "different match"
+
+            results.append(entry)
+
+        return sorted(results, key=lambda item: (item.original_ms is None, -(item.original_ms or 0), -len(item.costs)))
+
+    @staticmethod
+    def report(results: list[DotDict], top: int = 20) -> str:
+        """Worst offenders table: slowest evaluated locators, then templated ones with costly XPath"""
+        def fmt(value):
+            return f"{value:.3f}" if value is not None else "-"
+
+        rows = [r for r in results if r.original_ms is not None][:top]
+        rows += [r for r in results if r.original_ms is None and r.costs][:max(top - len(rows), 0)]
+
+        lines = [f"{'original ms':>12}{'rewrite ms':>12}{'matches':>9}  {'status':<16}locator"]
+        for r in rows:
+            lines.append(f"{fmt(r.original_ms):>12}{fmt(r.candidate_ms):>12}{r.count if r.count is not None else '-':>9}  {r.status:<16}{r.owner}")
+            lines.append(f"{'':>35}{r.locator}")
+            if r.costs:
+                lines.append(f"{'':>35}costly: {', '.join(r.costs)}")
+            if r.rewrite:
+                lines.append(f"{'':>35}-> {r.rewrite}")
+
+        return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time page-object locators and propose faster equivalent locators")
+    parser.add_argument("platform", choices=["web", "web_app", "android", "ios"])
+    parser.add_argument("--source", required=True, help="Recorded page: HTML for web, page source XML for mobile")
+    parser.add_argument("--top", type=int, default=20, help="Number of worst offenders to show")
+    parser.add_argument("--repeat", type=int, default=20, help="Lookups per measurement")
+    parser.add_argument("--output", help="Save verified rewrites {owner: [by, value]} to this JSON file")
+    args = parser.parse_args()
+
+    driver = None
+    if args.platform in ("web", "web_app"):
+        from selenium import webdriver
+
+        options = webdriver.ChromeOptions()
+        options.add_argument("--headless")
+        driver = webdriver.Chrome(options=options)
+        driver.get(Path(args.source).resolve().as_uri())
+        optimizer = LocatorOptimizer(driver=driver, repeat=args.repeat)
+    else:
+        optimizer = LocatorOptimizer(snapshot=PageSnapshot.from_file(args.source), repeat=args.repeat)
+
+    try:
+        results = optimizer.run(args.platform)
+    finally:
+        if driver:
+            driver.quit()
+
+    print(LocatorOptimizer.report(results, args.top))
+
+    verified = {r.owner: list(r.rewrite) for r in results if r.status == "verified"}
+    print(f"\n{len(verified)} verified rewrites, {sum(r.status == 'templated' and bool(r.rewrite) for r in results)} unverified (templated)")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(verified, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
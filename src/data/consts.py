@@ -4,6 +4,10 @@ from pathlib import Path
 ROOTDIR = Path(__file__).parent.parent.parent
 CONFIG_DIR = ROOTDIR / "config"
 VIDEO_DIR = ROOTDIR / ".videos"
+CASSETTE_DIR = ROOTDIR / ".cassettes"
+TOKEN_CACHE_FILE = ROOTDIR / ".token_cache.json"
+RATE_LIMIT_FILE = ROOTDIR / ".rate_limit.json"
+WAIT_STATS_FILE = ROOTDIR / ".wait_stats.json"
 SRC_DIR = ROOTDIR / "src"
 DATA_DIR = SRC_DIR / "data"
 
@@ -15,6 +19,10 @@ SHORT_WAIT = 2
 LONG_WAIT = 15
 QUICK_WAIT = 0.5
 
+# API request logging
+API_LOG_MAX_LEN = 10000  # max characters of a logged response body, 0: no limit
+API_LOG_SAMPLE_RATE = 1  # log 1 of every N successful requests, failed requests are always logged
+
 CHECK_ICON = "✔"
 FAILED_ICON = "✘"
 CHECK_ICON_COLOR = "✅"
@@ -159,19 +159,22 @@ class ObjSymbol:
     def _get_all_symbols(cls):
         """Get all current available symbols, including all status"""
         from src.apis.api_client import APIClient
-        resp = APIClient().market.get_watchlist_items(WatchListTab.ALL, get_symbols=False)
+        resp = APIClient().market.get_watchlist_items(WatchListTab.ALL, get_symbols=False, use_cache=True)
         return resp
 
     @classmethod
     def _get_symbol_details(cls, symbol):
         from src.apis.api_client import APIClient
-        symbol_detail = APIClient().market.get_symbol_details(symbol)
+        symbol_detail = APIClient().market.get_symbol_details(symbol, use_cache=True)
         return symbol_detail
 
     @classmethod
     def _get_all_orders(cls):
         """Get all current market and pending orders for filter disabled symbols"""
-        from src.apis.api_client import APIClient
-        market_orders = APIClient().order.get_orders_details(order_type=OrderType.MARKET, exclude_issue_symbols=False)
-        pending_orders = APIClient().order.get_orders_details(order_type=OrderType.LIMIT, exclude_issue_symbols=False)
+        from src.apis.async_api_client import AsyncAPIClient
+        with AsyncAPIClient() as client:
+            market_orders, pending_orders = client.gather(
+                client.order.get_orders_details(order_type=OrderType.MARKET, exclude_issue_symbols=False),
+                client.order.get_orders_details(order_type=OrderType.LIMIT, exclude_issue_symbols=False)
+            )
         return market_orders + pending_orders
@@ -119,27 +119,32 @@ class TradingModals(BaseTrade):
         self.actions.click(self.__btn_bulk_delete_confirm)
 
     def cancel_bulk_delete(self, timeout=QUICK_WAIT):
-        self.actions.click(self.__btn_bulk_delete_cancel, timeout=timeout, raise_exception=False)
+        if self.actions.is_displayed_now(self.__btn_bulk_delete_cancel):
+            self.actions.click(self.__btn_bulk_delete_cancel, timeout=timeout, raise_exception=False)
 
     def cancel_delete_order(self, timeout=QUICK_WAIT):
-        self.actions.click(self.__btn_cancel_delete_order, timeout=timeout, raise_exception=False)
+        if self.actions.is_displayed_now(self.__btn_cancel_delete_order):
+            self.actions.click(self.__btn_cancel_delete_order, timeout=timeout, raise_exception=False)
 
     def confirm_bulk_close(self, option: BulkCloseOpts = BulkCloseOpts.ALL):
         """Click the bulk close confirm button."""
         self.actions.click(cook_element(self.__btn_bulk_close_confirm, locator_format(option)))
 
     def cancel_bulk_close(self, timeout=QUICK_WAIT):
-        self.actions.click(self.__btn_bulk_close_cancel, timeout=timeout, raise_exception=False, show_log=False)
+        if self.actions.is_displayed_now(self.__btn_bulk_close_cancel):
+            self.actions.click(self.__btn_bulk_close_cancel, timeout=timeout, raise_exception=False, show_log=False)
 
     def cancel_close_order(self, timeout=QUICK_WAIT):
-        self.actions.click(self.__btn_cancel_close_order, timeout=timeout, raise_exception=False, show_log=False)
+        if self.actions.is_displayed_now(self.__btn_cancel_close_order):
+            self.actions.click(self.__btn_cancel_close_order, timeout=timeout, raise_exception=False, show_log=False)
 
     # Edit Confirmation Modal Actions
     def click_btn_edit_order(self):
         self.actions.click(self.__btn_edit_order)
 
     def cancel_edit_order(self):
-        self.actions.click(self.__btn_cancel_edit_order, timeout=QUICK_WAIT, raise_exception=False, show_log=False)
+        if self.actions.is_displayed_now(self.__btn_cancel_edit_order):
+            self.actions.click(self.__btn_cancel_edit_order, timeout=QUICK_WAIT, raise_exception=False, show_log=False)
 
     def confirm_update_order(self):
         self.actions.click(self.__btn_confirm_update_order)
@@ -87,12 +87,17 @@ class AssetTab(BaseTrade):
 
         # get expanded item details 
         tab = AssetTabs.HISTORY if tab.is_history() else tab
-        res = {
-            ele.get_attribute("resource-id").split("-column-")[-1].replace("-value", "").replace("-", "_"): ele.text.strip()
-            for ele in self.actions.find_elements(cook_element(self.__expand_items, tab.col_locator()))
-        }
-        # get order-type
-        res["order_type"] = self.actions.get_text(self.__item_order_type)
+        locator = cook_element(self.__expand_items, tab.col_locator())
+
+        # read all values from one page source instead of querying the device per field
+        with self.actions.page_snapshot():
+            ids = [item["resource-id"] for item in self.actions.get_attributes(locator, "resource-id")]
+            res = {
+                _id.split("-column-")[-1].replace("-value", "").replace("-", "_"): value
+                for _id, value in zip(ids, self.actions.get_texts(locator))
+            }
+            # get order-type
+            res["order_type"] = next(iter(self.actions.get_texts(self.__item_order_type)), "")
 
         # reformat size vs volume column for consistent
         if "size" in res:
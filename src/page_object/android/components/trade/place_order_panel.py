@@ -176,19 +176,13 @@ class PlaceOrderPanel(BaseTrade):
         self.actions.send_keys(self.__txt_volume, volume, hide_keyboard=True)
         return volume
 
-    def _input_price(self, value: Any, order_type: Optional[OrderType] = None) -> None:
-        """Input trade price for order type: Limit, Stop, Stop Limit."""
+    def _input_prices(self, entry_price: Any, stop_limit_price: Any, order_type: Optional[OrderType] = None) -> None:
+        """Input trade price (Limit, Stop, Stop Limit) and stop limit price (Stop limit) at once."""
         if order_type == OrderType.MARKET:
             return
-        logger.debug(f"- Input price: {value!r}")
-        self.actions.send_keys(self.__txt_price, value, hide_keyboard=True)
-
-    def _input_stop_price(self, value: Any, order_type: Optional[OrderType] = None) -> None:
-        """Input stop limit price for order type 'Stop limit'."""
-        if order_type != OrderType.STOP_LIMIT:
-            return
-        logger.debug(f"- Input stop limit price: {value!r}")
-        self.actions.send_keys(self.__txt_stop_limit_price, value, hide_keyboard=True)
+        stop_limit_price = stop_limit_price if order_type == OrderType.STOP_LIMIT else None
+        logger.debug(f"- Input price: {entry_price!r}, stop limit price: {stop_limit_price!r}")
+        self.actions.fill_form({self.__txt_price: entry_price, self.__txt_stop_limit_price: stop_limit_price})
 
     def place_oct_order(self, trade_object: ObjTrade) -> None:
         """
@@ -252,8 +246,7 @@ class PlaceOrderPanel(BaseTrade):
         prices = calculate_trading_params(self.get_live_price(trade_type), trade_type, order_type, sl_type=sl_type, tp_type=tp_type)
 
         # Input prices
-        self._input_price(prices.entry_price, order_type)
-        self._input_stop_price(prices.stop_limit_price, order_type)
+        self._input_prices(prices.entry_price, prices.stop_limit_price, order_type)
 
         # Select fill_policy
         not trade_object.get("fill_policy") or self._select_fill_policy(trade_object.fill_policy)
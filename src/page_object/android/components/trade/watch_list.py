@@ -47,10 +47,8 @@ class WatchList(BaseTrade):
         if tab:
             self.select_tab(tab)
 
-        elements = self.actions.find_elements(self.__items)
-        if elements:
-            res = [ele.text.strip() for ele in elements]
-            res = [item for item in res if item]  # remove empty text if any
+        res = [item for item in self.actions.get_texts(self.__items) if item]  # remove empty text if any
+        if res:
             return res if not random_symbol else random.choice(res)
 
         return []
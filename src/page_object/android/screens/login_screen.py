@@ -63,8 +63,7 @@ class LoginScreen(BaseScreen):
             self.select_language(language)
 
         self.select_account_tab(account_type or RuntimeConfig.account)
-        self.actions.send_keys(self.__txt_user_id, str(userid))
-        self.actions.send_keys(self.__txt_password, str(password))
+        self.actions.fill_form({self.__txt_user_id: userid, self.__txt_password: password})
         self.actions.click(self.__btn_sign_in)
 
         if wait:
@@ -38,7 +38,7 @@ class AssetTab(BaseTrade):
     # expand item
     __expand_items = (AppiumBy.ACCESSIBILITY_ID, "asset-{}-list-item-expand")  # tab
     __btn_cancel_expand_item = (AppiumBy.ACCESSIBILITY_ID, "action-sheet-cancel-button")
-    __expanded_values = (AppiumBy.IOS_CLASS_CHAIN, '**/XCUIElementTypeStaticText[`name CONTAINS "asset-{}-column" AND name CONTAINS "-value"`]')  # tab.col_locator() - common of order's values
+    __expanded_values = (AppiumBy.XPATH, "//XCUIElementTypeStaticText[contains(@name, 'asset-{}-column') and contains(@name, '-value')]")  # tab.col_locator() - common of order's values
     __expanded_order_type = (AppiumBy.ACCESSIBILITY_ID, "asset-order-type")
     __expanded_symbol = (AppiumBy.ACCESSIBILITY_ID, "asset-detailed-header-symbol")
     __expand_item_profit_loss = (AppiumBy.ACCESSIBILITY_ID, "asset-open-list-item-expand")
@@ -91,13 +91,17 @@ class AssetTab(BaseTrade):
 
         # re-assign tab in cased of history - to get correct col locator
         tab = AssetTabs.HISTORY if tab.is_history() else tab
-        res = {
-            ele.get_attribute("name").split("-column-")[-1].replace("-value", "").replace("-", "_"): ele.text.strip()
-            for ele in self.actions.find_elements(cook_element(self.__expanded_values, tab.col_locator()))
-        }
-
-        res["order_type"] = self.actions.get_text(self.__expanded_order_type)
-        res["symbol"] = self.actions.get_text(self.__expanded_symbol)
+        locator = cook_element(self.__expanded_values, tab.col_locator())
+
+        # read all values from one page source instead of querying the device per field
+        with self.actions.page_snapshot():
+            names = [item["name"] for item in self.actions.get_attributes(locator, "name")]
+            res = {
+                name.split("-column-")[-1].replace("-value", "").replace("-", "_"): value
+                for name, value in zip(names, self.actions.get_texts(locator))
+            }
+            res["order_type"] = next(iter(self.actions.get_texts(self.__expanded_order_type)), "")
+            res["symbol"] = next(iter(self.actions.get_texts(self.__expanded_symbol)), "")
 
         logger.debug(f"Item summary: {format_dict_to_string(res)}")
 
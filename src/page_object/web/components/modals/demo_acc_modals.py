@@ -1,4 +1,3 @@
-import time
 from typing import List, Literal
 
 from selenium.webdriver.common.by import By
@@ -35,6 +34,7 @@ class DemoAccountModal(BasePage):
     __item_country_dial_code = (By.XPATH, "//div[@data-testid='country-dial-code-item' and contains(text(), '(+{})')]")
     __txt_phone_number = (By.CSS_SELECTOR, data_testid('demo-account-creation-modal-phone'))
     __deposit = (By.XPATH, "//div[text()='Deposit']")
+    __deposit_value = (By.XPATH, "//div[text()='Deposit']/following-sibling::div")
     __item_deposit = (By.XPATH, "//div[@data-testid='deposit-dropdown-item' and text()='{}']")
     __chb_agreement_unchecked = (By.CSS_SELECTOR, "div[data-testid='demo-account-creation-modal-agreement-unchecked'] div")
     __chb_agreement_checked = (By.CSS_SELECTOR, "div[data-testid='demo-account-creation-modal-agreement-checked'] div")
@@ -82,13 +82,9 @@ class DemoAccountModal(BasePage):
         self.actions.click(self.__btn_next)
 
     def fill_demo_account_creation_form(self, account_info: ObjDemoAccount, default_deposit=True, submit=True):
-        time.sleep(1)  # wait a bit for loading default deposit value
+        self.actions.wait_for_content(self.__deposit_value, timeout=1)  # wait for loading default deposit value
 
-        if account_info.name:
-            self.input_name(account_info.name)
-
-        if account_info.email:
-            self.input_email(account_info.email)
+        self.actions.fill_form({self.__txt_name: account_info.name or None, self.__txt_email: account_info.email or None})
 
         if account_info.dial_code:
             self.select_dial_code(account_info.dial_code)
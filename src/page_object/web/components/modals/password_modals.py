@@ -29,9 +29,11 @@ class PasswordModal(BasePage):
             old_password (str): Current password
             new_password (str): New password to set
         """
-        self.actions.send_keys(self.__txt_old_password, old_password)
-        self.actions.send_keys(self.__txt_new_password, new_password)
-        self.actions.send_keys(self.__txt_confirm_new_password, new_password)
+        self.actions.fill_form({
+            self.__txt_old_password: old_password,
+            self.__txt_new_password: new_password,
+            self.__txt_confirm_new_password: new_password,
+        })
         self.actions.click(self.__btn_confirm)
         if close:
             self.close()
@@ -47,6 +49,5 @@ class PasswordModal(BasePage):
     __btn_submit = (By.XPATH, "//button[text()='Submit']")
 
     def fill_reset_password_form(self, email=random_email(), account_id=random_userid()):
-        self.actions.send_keys(self.__txt_email, email)
-        self.actions.send_keys(self.__txt_account_id, account_id)
+        self.actions.fill_form({self.__txt_email: email, self.__txt_account_id: account_id})
         self.actions.click(self.__btn_submit)
@@ -11,7 +11,7 @@ from src.page_object.web.components.trade.base_trade import BaseTrade
 from src.utils.assert_utils import soft_assert
 from src.utils.common_utils import data_testid, cook_element
 from src.utils.format_utils import locator_format, format_dict_to_string
-from src.utils.logging_utils import logger
+from src.utils.logging_utils import logger, LazyLog
 
 
 class TradingModals(BaseTrade):
@@ -163,35 +163,23 @@ class TradingModals(BaseTrade):
 
     # Control buttons
     def control_price(self, order_type: OrderType, stp_price=True, price=True, stop_loss=True, take_profit=True):
-
+        buttons = []  # locators still to format with increase/ decrease
         if stp_price and order_type.is_stp_limit():
-            for _ in range(random.randint(10, 20)):
-                self.actions.click(cook_element(self.__btn_inc_dec_stp_price, "increase"))
-
-            for _ in range(random.randint(1, 10)):
-                self.actions.click(cook_element(self.__btn_inc_dec_stp_price, "decrease"))
+            buttons.append(self.__btn_inc_dec_stp_price)
 
         if price and order_type != OrderType.MARKET:
-            for _ in range(random.randint(10, 20)):
-                self.actions.click(cook_element(self.__btn_inc_dec_price, "increase"))
-
-            for _ in range(random.randint(1, 10)):
-                self.actions.click(cook_element(self.__btn_inc_dec_price, "decrease"))
+            buttons.append(self.__btn_inc_dec_price)
 
         if stop_loss:
-            sl_type = SLTPType.sample_values()
-            for _ in range(random.randint(10, 20)):
-                self.actions.click(cook_element(self.__btn_inc_dec_sl, sl_type.lower(), "increase"))
-
-            for _ in range(random.randint(1, 10)):
-                self.actions.click(cook_element(self.__btn_inc_dec_sl, sl_type.lower(), "decrease"))
+            buttons.append(cook_element(self.__btn_inc_dec_sl, SLTPType.sample_values().lower()))
 
         if take_profit:
-            tp_type = SLTPType.sample_values()
-            for _ in range(random.randint(10, 20)):
-                self.actions.click(cook_element(self.__btn_inc_dec_tp, tp_type.lower(), "increase"))
-            for _ in range(random.randint(1, 10)):
-                self.actions.click(cook_element(self.__btn_inc_dec_tp, tp_type.lower(), "decrease"))
+            buttons.append(cook_element(self.__btn_inc_dec_tp, SLTPType.sample_values().lower()))
+
+        with self.actions.action_batch() as batch:
+            for button in buttons:
+                batch.click(cook_element(button, "increase"), times=random.randint(10, 20))
+                batch.click(cook_element(button, "decrease"), times=random.randint(1, 10))
 
     def _get_trade_confirmation(self):
         labels = self.actions.get_text_elements(self.__confirm_labels)
@@ -204,7 +192,7 @@ class TradingModals(BaseTrade):
         if "size" in actual:
             actual["volume"] = actual.pop("size")
 
-        logger.debug(f"- Actual: {format_dict_to_string(actual)}")
+        logger.debug("- Actual: %s", LazyLog(format_dict_to_string, actual))
         return actual
 
     def _get_edit_trade_confirmation(self):
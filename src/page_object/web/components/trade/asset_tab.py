@@ -13,7 +13,7 @@ from src.page_object.web.components.trade.base_trade import BaseTrade
 from src.utils.assert_utils import soft_assert
 from src.utils.common_utils import data_testid, cook_element, convert_strtime
 from src.utils.format_utils import extract_asset_tab_number, format_dict_to_string, locator_format
-from src.utils.logging_utils import logger
+from src.utils.logging_utils import logger, LazyLog
 from src.utils.trading_utils import calculate_partial_close, get_sl_tp, get_pending_price, get_stop_price
 
 
@@ -58,9 +58,11 @@ class AssetTab(BaseTrade):
     __col_order_ids_by_tab = (By.CSS_SELECTOR, data_testid('asset-{}-column-order-id'))
     __col_order_ids = (By.CSS_SELECTOR, "*[data-testid$='-column-order-id']")
 
-    __first_item = (By.CSS_SELECTOR, "tr:first-of-type *[data-testid*='asset-{}-column']")
+    __first_item = (By.CSS_SELECTOR, "tr:first-of-type")
+    __asset_table = (By.XPATH, "//table[.//*[contains(@data-testid, '-column-order-id')]]")
     __item_by_id = (By.XPATH, "//*[@data-testid='asset-{}-column-order-id' and text()='{}']")
-    __cols_by_id = (By.XPATH, "//*[@data-testid='asset-{}-column-order-id' and text()='{}']/parent::tr/*[contains(@data-testid, 'asset')]")
+    __row_by_id = (By.XPATH, "//*[@data-testid='asset-{}-column-order-id' and text()='{}']/parent::tr")
+    __cells = "*[data-testid*='asset-{}-column']"
 
     # Close order confirmation locators
     __txt_close_order = (By.CSS_SELECTOR, data_testid('close-order-input-volume'))
@@ -76,7 +78,11 @@ class AssetTab(BaseTrade):
 
     def get_tab_amount(self, tab: AssetTabs) -> int:
         """Get the number of items in the specified tab."""
-        time.sleep(2)
+        # the count is updated asynchronously once the orders are fetched: wait for the requests to settle
+        start = time.monotonic()
+        if not self.actions.wait_for_network_idle(idle_ms=1000, timeout=2):
+            time.sleep(max(0.0, 2 - (time.monotonic() - start)))
+
         amount = self.actions.get_text(cook_element(self.__tab, locator_format(tab)))
         res = extract_asset_tab_number(amount)
         logger.debug(f"> Tab amount: {res} ({tab.value})")
@@ -86,7 +92,7 @@ class AssetTab(BaseTrade):
         """Get the latest order ID from the specified tab."""
         locator = cook_element(self.__col_order_ids_by_tab, tab.col_locator())
         not wait or self.wait_for_spin_loader()
-        time.sleep(1) # wait a bit for the loading icon totally disappeared
+        self.actions.wait_for_dom_stable(self.__asset_table, timeout=1)  # wait for the rows loaded with the loader gone
         order_id = self.actions.get_text(locator)
         logger.debug(f"- Latest orderID: {order_id!r}")
         return order_id
@@ -105,10 +111,10 @@ class AssetTab(BaseTrade):
 
     def get_item_data(self, tab: AssetTabs, order_id=None, trade_object: ObjTrade = None):
         """Get item data based on order_id or last item, DO NOT leave tab & trade_object = None at the same time"""
-        locator = cook_element(self.__cols_by_id if order_id else self.__first_item, tab.col_locator(), order_id)
-        elements = self.actions.find_elements(locator)
+        locator = cook_element(self.__row_by_id, tab.col_locator(), order_id) if order_id else self.__first_item
+        rows = self.actions.snapshot_table(locator, cell_selector=self.__cells.format(tab.col_locator()))
         res = {
-            ele.get_attribute("data-testid").split("column-")[-1].replace("-", "_"): ele.text.strip() for ele in elements
+            key.split("column-")[-1].replace("-", "_"): value for key, value in (rows[0] if rows else {}).items()
         }
 
         # reformat size vs volume column
@@ -119,7 +125,7 @@ class AssetTab(BaseTrade):
         if tab.is_history():
             res["volume"] = res["volume"].split(" / ")[0]
 
-        logger.debug(f"- Item summary: {format_dict_to_string(res)}")
+        logger.debug("- Item summary: %s", LazyLog(format_dict_to_string, res))
         if trade_object is not None:
             res.pop("order_type", None)
             trade_object |= res
@@ -238,15 +244,14 @@ class AssetTab(BaseTrade):
         not min_volume or self.actions.click(self.__btn_min_volume)
         not max_volume or self.actions.click(self.__btn_max_volume)
 
-        if inc_step:
-            inc_step = inc_step if isinstance(inc_step, int) else random.randint(10, 20)
-            for _ in range(inc_step):
-                self.actions.click(cook_element(self.__inc_dec_volume, "increase", inc_step))
+        with self.actions.action_batch() as batch:
+            if inc_step:
+                inc_step = inc_step if isinstance(inc_step, int) else random.randint(10, 20)
+                batch.click(cook_element(self.__inc_dec_volume, "increase"), times=inc_step)
 
-        if dec_step:
-            dec_step = dec_step if isinstance(dec_step, int) else random.randint(1, 10)
-            for _ in range(dec_step):
-                self.actions.click(cook_element(self.__inc_dec_volume, "decrease", dec_step))
+            if dec_step:
+                dec_step = dec_step if isinstance(dec_step, int) else random.randint(1, 10)
+                batch.click(cook_element(self.__inc_dec_volume, "decrease"), times=dec_step)
 
     def apply_sorting(self, option: Optional[SortOptions] = None) -> None:
         """Apply sorting to the items in the current tab."""
@@ -254,7 +259,7 @@ class AssetTab(BaseTrade):
         self.actions.click(self.__order_sort)
         self.actions.click(cook_element(self.__opt_sort, option))
         self.actions.click(self.__order_sort)
-        time.sleep(0.5)
+        self.actions.wait_for_dom_stable(self.__asset_table, timeout=0.5)
 
     def set_column_preference(
             self,
@@ -272,7 +277,7 @@ class AssetTab(BaseTrade):
         custom = "checked" if unchecked else "unchecked"
         self.select_tab(tab)
         self.actions.click(self.__col_preference)
-        time.sleep(1)  # wait a bit
+        self.actions.wait_for_element_visible(self.__btn_save_changes, timeout=1, show_log=False)
 
         for option in options:
             locator = cook_element(self.__chb_col_preference, custom, option)
@@ -290,7 +295,7 @@ class AssetTab(BaseTrade):
         btn_save = self.actions.find_element(self.__btn_save_changes)
         if btn_save.is_enabled():
             self.actions.click(self.__btn_save_changes)
-            time.sleep(2)  # wait a bit
+            self.actions.wait_for_dom_stable(self.__asset_table, timeout=2)  # columns updated
 
         if close_modal:
             self.actions.click(cook_element(self.__btn_close_col_preference))
@@ -98,13 +98,17 @@ class BaseTrade(BasePage):
         self.actions.click(cook_element(self.__btn_bulk_close_confirm, locator_format(option)))
 
     def cancel_bulk_delete(self, timeout=QUICK_WAIT):
-        self.actions.click(self.__btn_bulk_delete_cancel, timeout=timeout, raise_exception=False, show_log=False)
+        if self.actions.is_displayed_now(self.__btn_bulk_delete_cancel):
+            self.actions.click(self.__btn_bulk_delete_cancel, timeout=timeout, raise_exception=False, show_log=False)
 
     def cancel_delete_order(self, timeout=QUICK_WAIT):
-        self.actions.click(self.__btn_cancel_delete_order, timeout=timeout, raise_exception=False, show_log=False)
+        if self.actions.is_displayed_now(self.__btn_cancel_delete_order):
+            self.actions.click(self.__btn_cancel_delete_order, timeout=timeout, raise_exception=False, show_log=False)
 
     def cancel_bulk_close(self, timeout=QUICK_WAIT):
-        self.actions.click(self.__btn_bulk_close_cancel, timeout=timeout, raise_exception=False, show_log=False)
+        if self.actions.is_displayed_now(self.__btn_bulk_close_cancel):
+            self.actions.click(self.__btn_bulk_close_cancel, timeout=timeout, raise_exception=False, show_log=False)
 
     def cancel_close_order(self, timeout=QUICK_WAIT):
-        self.actions.click(self.__btn_cancel_close_order, timeout=timeout, raise_exception=False, show_log=False)
+        if self.actions.is_displayed_now(self.__btn_cancel_close_order):
+            self.actions.click(self.__btn_cancel_close_order, timeout=timeout, raise_exception=False, show_log=False)
@@ -1,5 +1,4 @@
 import random
-import time
 from contextlib import suppress
 from typing import Literal
 
@@ -13,7 +12,7 @@ from src.page_object.web.components.trade.base_trade import BaseTrade
 from src.utils import DotDict
 from src.utils.common_utils import data_testid, cook_element
 from src.utils.format_utils import locator_format, format_dict_to_string
-from src.utils.logging_utils import logger
+from src.utils.logging_utils import logger, LazyLog
 from src.utils.trading_utils import calculate_trading_params
 
 
@@ -83,14 +82,14 @@ class PlaceOrderPanel(BaseTrade):
         """Get current stop loss value from input field."""
         locator = cook_element(self.__txt_stop_loss, SLTPType.PRICE.lower())
         self.actions.click(locator)
-        time.sleep(0.5)
+        self.actions.wait_for_content(locator, timeout=0.5, attribute="value")
         return self.actions.get_value(locator)
 
     def _get_input_tp(self) -> str:
         """Get current take profit value from input field."""
         locator = cook_element(self.__txt_take_profit, SLTPType.PRICE.lower())
         self.actions.click(locator)
-        time.sleep(0.5)
+        self.actions.wait_for_content(locator, timeout=0.5, attribute="value")
         return self.actions.get_value(locator)
 
     def _get_input_price(self):
@@ -154,17 +153,11 @@ class PlaceOrderPanel(BaseTrade):
         }
         inc_step = inc_step or random.randint(10, 20)
         dec_step = dec_step or random.randint(1, inc_step - 1)
-        for _ in range(inc_step):
-            if button_type in ["sl", "tp"]:
-                self.actions.click(cook_element(locators[button_type], sl_tp_type.lower(), "increase"))
-            else:
-                self.actions.click(cook_element(locators[button_type], "increase"))
-
-        for _ in range(dec_step):
-            if button_type in ["sl", "tp"]:
-                self.actions.click(cook_element(locators[button_type], sl_tp_type.lower(), "decrease"))
-            else:
-                self.actions.click(cook_element(locators[button_type], "decrease"))
+        args = (sl_tp_type.lower(),) if button_type in ["sl", "tp"] else ()
+
+        with self.actions.action_batch() as batch:
+            batch.click(cook_element(locators[button_type], *args, "increase"), times=inc_step)
+            batch.click(cook_element(locators[button_type], *args, "decrease"), times=dec_step)
 
     def control_volume(self, inc_step: int | None = None, dec_step: int | None = None) -> None:
         """Adjust volume using control buttons."""
@@ -210,7 +203,7 @@ class PlaceOrderPanel(BaseTrade):
             return
 
         logger.debug(f"- Select trade type: {trade_type.upper()!r}")
-        time.sleep(1)
+        self.actions.wait_for_dom_stable(locator, timeout=1)
         self.actions.click(locator)
         self._select_trade_type(trade_type, retries - 1)
 
@@ -227,7 +220,7 @@ class PlaceOrderPanel(BaseTrade):
 
         logger.debug(f"- Select order type: {order_type.capitalize()!r}")
         self.actions.click(self.__drp_order_type)
-        time.sleep(1)
+        self.actions.wait_for_dom_stable(self.__drp_order_type, timeout=1)
         self.actions.click(locator)
 
         # Recursive call
@@ -303,13 +296,32 @@ class PlaceOrderPanel(BaseTrade):
         """Input volume value."""
         self._input_trade_value(self.__txt_volume, value, "volume")
 
-    def _input_price(self, value: any) -> None:
-        """Input trade price for order type: Limit, Stop, Stop Limit."""
-        self._input_trade_value(self.__txt_price, value, "price")
+    def _input_prices(
+            self,
+            order_type: OrderType,
+            entry_price: any = None,
+            stop_limit_price: any = None,
+            stop_loss: any = None,
+            take_profit: any = None,
+            sl_type: SLTPType = SLTPType.PRICE,
+            tp_type: SLTPType = SLTPType.PRICE,
+    ) -> None:
+        """Input price, stop limit price, SL and TP at once, fields not applying to the order type are skipped."""
+        fields = {
+            self.__txt_price: entry_price if order_type != OrderType.MARKET else None,
+            self.__txt_stop_limit_price: stop_limit_price if order_type == OrderType.STOP_LIMIT else None,
+        }
+        if sl_type:
+            fields[cook_element(self.__txt_stop_loss, sl_type.lower())] = stop_loss
+        if tp_type:
+            fields[cook_element(self.__txt_take_profit, tp_type.lower())] = take_profit
+
+        logger.debug(f"- Input prices: {[value for value in fields.values() if value is not None]}")
+        self.actions.fill_form(fields)
 
-    def _input_stop_limit_price(self, value: any) -> None:
-        """Input stop limit price for order type 'Stop limit'."""
-        self._input_trade_value(self.__txt_stop_limit_price, value, "stop limit price")
+        # clear SL/ TP not set
+        sl_type or self._input_sl(None, None)
+        tp_type or self._input_tp(None, None)
 
     def place_order(
             self,
@@ -343,21 +355,11 @@ class PlaceOrderPanel(BaseTrade):
         # Calculate input prices
         trade_params = calculate_trading_params(self.get_live_price(trade_type), trade_type, order_type, sl_type=sl_type, tp_type=tp_type)
 
-        # Input price
-        if order_type != OrderType.MARKET:
-            self._input_price(trade_params.entry_price)
-
-        # Input stop limit price
-        if order_type == OrderType.STOP_LIMIT:
-            self._input_stop_limit_price(trade_params.stop_limit_price)
-
-        # Input SL
-        stop_loss = trade_params.stop_loss
-        self._input_sl(stop_loss, sl_type)
-
-        # Input TP
-        take_profit = trade_params.take_profit
-        self._input_tp(take_profit, tp_type)
+        # Input price, stop limit price, SL and TP
+        stop_loss, take_profit = trade_params.stop_loss, trade_params.take_profit
+        self._input_prices(
+            order_type, trade_params.entry_price, trade_params.stop_limit_price, stop_loss, take_profit, sl_type, tp_type
+        )
 
         # Select Fill Policy
         not trade_object.get("fill_policy") or self._select_fill_policy(trade_object.fill_policy)
@@ -390,7 +392,7 @@ class PlaceOrderPanel(BaseTrade):
             'expiry': trade_object.get("expiry")
         }
 
-        logger.debug(f"- Order Summary: {format_dict_to_string(trade_details)}")
+        logger.debug("- Order Summary: %s", LazyLog(format_dict_to_string, trade_details))
         self._click_place_order_btn()
         trade_object |= {k: v for k, v in trade_details.items() if v}
 
@@ -438,14 +440,7 @@ class PlaceOrderPanel(BaseTrade):
         tp = invalid_price.take_profit if take_profit else valid_price.take_profit
 
         # Input prices
-        if order_type != OrderType.MARKET:
-            self._input_price(price)
-
-        if order_type == OrderType.STOP_LIMIT:
-            self._input_stop_limit_price(stp_price)
-
-        self._input_sl(sl, SLTPType.PRICE)
-        self._input_tp(tp, SLTPType.PRICE)
+        self._input_prices(order_type, price, stp_price, sl, tp)
 
         self._click_place_order_btn()
         not submit or self.confirm_trade()
@@ -476,7 +471,7 @@ class PlaceOrderPanel(BaseTrade):
             'take_profit': '--',
         }
 
-        logger.debug(f"- Order Summary: {format_dict_to_string(trade_details)}")
+        logger.debug("- Order Summary: %s", LazyLog(format_dict_to_string, trade_details))
         trade_object |= trade_details
 
     def place_order_by_control_button(
@@ -510,15 +505,7 @@ class PlaceOrderPanel(BaseTrade):
         if input_value:
             logger.debug("- Input value before using control buttons")
             self._input_volume(random.randint(1, 10))
-
-            if order_type == OrderType.STOP_LIMIT:
-                self._input_stop_limit_price(prices.stop_limit_price)
-
-            if order_type != OrderType.MARKET:
-                self._input_price(prices.entry_price)
-
-            self._input_sl(prices.stop_loss, SLTPType.PRICE)
-            self._input_tp(prices.take_profit, SLTPType.PRICE)
+            self._input_prices(order_type, prices.entry_price, prices.stop_limit_price, prices.stop_loss, prices.take_profit)
 
         logger.debug("- Adjust price using increase and decrease button")
         self.control_volume()
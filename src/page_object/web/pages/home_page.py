@@ -1,5 +1,3 @@
-import time
-
 from selenium.webdriver.common.by import By
 
 from src.core.actions.web_actions import WebActions
@@ -53,6 +51,7 @@ class HomePage(BasePage):
 
     __item_search_result = (By.XPATH, "//div[@data-testid='symbol-input-search-items']//div[contains(text(), '{}')]")
     __items_search_result = (By.CSS_SELECTOR, data_testid('symbol-input-search-items'))
+    __search_result = (By.CSS_SELECTOR, data_testid('symbol-dropdown-result'))
     __empty_message = (By.CSS_SELECTOR, "div[data-testid='symbol-dropdown-result'] > div[data-testid='empty-message']")
 
     # ------------------------ ACTIONS ------------------------ #
@@ -100,7 +99,7 @@ class HomePage(BasePage):
 
     def search_and_select_symbol(self, symbol):
         self.search_symbol(symbol)
-        time.sleep(1)
+        self.actions.wait_for_dom_stable(self.__search_result, timeout=1)
         self.select_item_from_search_result(symbol)
 
     def delete_search_history(self, check_displayed=True):
@@ -156,9 +155,8 @@ class HomePage(BasePage):
         self.actions.verify_elements_displayed(locators, is_display=is_display, timeout=SHORT_WAIT if len(locators) > 1 else QUICK_WAIT)
 
     def verify_acc_total_balance(self):
-        balance_items = self.actions.find_elements(self.__account_balance_item)
         sum_balance = sum(
-            [remove_comma(element.text.strip()) for element in balance_items]
+            [remove_comma(text) for text in self.actions.get_texts(self.__account_balance_item)]
         )
         total_balance = self.actions.get_text(self.__total_account_balance)
         soft_assert(sum_balance, remove_comma(total_balance.replace("USD", "")))
@@ -202,8 +200,7 @@ class HomePage(BasePage):
         self.actions.verify_element_displayed(cook_element(self.__item_search_result, symbol))
 
     def verify_wildcard_search_result(self, search_text: str):
-        elements = self.actions.find_elements(self.__items_search_result)
-        texts = [ele.text.strip() for ele in elements]
+        texts = self.actions.get_texts(self.__items_search_result)
 
         for text in texts:
             logger.debug(f"Check {text!r} contains {search_text!r}")
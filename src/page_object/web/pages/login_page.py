@@ -83,8 +83,7 @@ class LoginPage(BasePage):
 
         logger.debug(f"- Login with user: {userid!r}")
         self.select_account_type(account_type or RuntimeConfig.account)
-        self.input_user_id(str(userid))
-        self.input_password(str(password))
+        self.actions.fill_form({self.__txt_user_id: userid, self.__txt_password: password})
         self.click_sign_in()
         not wait or self.wait_for_spin_loader()
 
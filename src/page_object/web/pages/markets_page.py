@@ -1,5 +1,4 @@
 import random
-import time
 
 from selenium.webdriver.common.by import By
 
@@ -33,6 +32,7 @@ class MarketsPage(BasePage):
         By.XPATH, "//div[contains(@data-testid, 'symbol-preference-option-{}') and text()='{}']//div"
         # checked or unchecked
     )
+    __symbol_preference_options = (By.CSS_SELECTOR, data_testid('symbol-preference-options'))
     __symbol_preference = (By.XPATH, "//div[@data-testid='symbol-preference-options']/div")
     __btn_save_changes = (By.CSS_SELECTOR, data_testid('symbol-preference-save'))
     __btn_close_preference = (By.CSS_SELECTOR, data_testid('symbol-preference-close'))
@@ -66,11 +66,10 @@ class MarketsPage(BasePage):
     ):
         self.watch_list.select_tab(tab, wait=False)
         self.actions.click(self.__btn_symbol_preference)
-        time.sleep(1)  # wait a bit
+        self.actions.wait_for_dom_stable(self.__symbol_preference_options, timeout=1)
         custom = "checked" if unchecked else "unchecked"
 
-        elements = self.actions.find_elements(self.__symbol_preference)
-        symbol_list = sorted(ele.text.strip() for ele in elements)
+        symbol_list = sorted(self.actions.get_texts(self.__symbol_preference))
 
         if show_all and self.actions.is_element_displayed(cook_element(self.__chb_show_all, custom)):
             logger.debug("- Check/ Uncheck Show All")
@@ -103,7 +102,7 @@ class MarketsPage(BasePage):
         if self.actions.is_element_enabled(self.__btn_save_changes, timeout=QUICK_WAIT):
             logger.debug("- Click on btn save changes")
             self.actions.click(self.__btn_save_changes)
-            time.sleep(1)  # wait a bit
+            self.actions.wait_for_dom_stable(self.__symbol_preference_options, timeout=1)
 
         logger.debug("- Close symbol preference setting")
         self.actions.click(cook_element(self.__btn_close_preference))
@@ -95,10 +95,7 @@ class SignalPage(BasePage):
     def get_current_symbols(self, tab: SignalTab = SignalTab.SIGNAL_LIST):
         """Get current displayed symbols on screen"""
         self.select_tab(tab)
-        elements = self.actions.find_elements(self.__items)
-        if elements:
-            return [ele.text.strip() for ele in elements]
-        return []
+        return self.actions.get_texts(self.__items)
 
     def __toggle_star_symbol(self, symbols: str | list = None, all_symbols: bool = False, mark_star: bool = True):
         """Helper function to toggle star status for symbols
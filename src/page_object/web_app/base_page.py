@@ -69,9 +69,20 @@ class BasePage:
     def go_back(self):
         self.actions.click(self.__btn_nav_back)
 
-    def wait_for_spin_loader(self, timeout: int | float = 20):
-        """Wait for the loader to be invisible."""
-        if self.actions.is_element_displayed(self.__spin_loader, timeout=3):
+    def wait_for_spin_loader(self, timeout: int | float = 20, since: float = None):
+        """
+        Wait for the loader to be invisible.
+        :param since: time.monotonic() taken before the action triggering the loader, default: start of the last UI action
+        """
+        since = since or self.actions.last_ui_action
+        appear_timeout = 3
+
+        # once the requests started by the action are done, the loader is either shown or not coming.
+        # No request seen yet (e.g. not reported), keep the full appear timeout for a late loader
+        if self.actions.wait_for_network_idle(timeout=3, since=since) and self.actions.network_requested_since(since):
+            appear_timeout = QUICK_WAIT
+
+        if self.actions.is_element_displayed(self.__spin_loader, timeout=appear_timeout):
             logger.debug("- Wait for spin loader to disappear")
             self.actions.wait_for_element_invisible(self.__spin_loader, timeout=timeout)
 
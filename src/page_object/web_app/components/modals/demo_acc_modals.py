@@ -1,4 +1,3 @@
-import time
 from typing import List, Literal
 
 from selenium.webdriver.common.by import By
@@ -68,7 +67,7 @@ class DemoAccountModal(BasePage):
         self.actions.click(self.__btn_agree_and_continue)
 
     def fill_demo_account_creation_form(self, account_info: ObjDemoAccount, default_deposit=True):
-        time.sleep(1)  # wait a bit for loading default deposit value
+        self.actions.wait_for_content(self.__deposit, timeout=1)  # wait for loading default deposit value
 
         if account_info.name:
             self.input_name(account_info.name)
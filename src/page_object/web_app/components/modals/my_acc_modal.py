@@ -1,5 +1,3 @@
-import time
-
 from selenium.webdriver.common.by import By
 
 from src.core.actions.web_actions import WebActions
@@ -64,11 +62,9 @@ class MyAccountModal(BasePage):
         soft_assert(actual, exp_dict, tolerance=1, tolerance_fields=AccSummary.list_values(except_val=AccSummary.BALANCE), field_tolerances={AccSummary.PROFIT_LOSS: 5})
 
     def verify_balance_items_displayed(self, is_display=True):
-        time.sleep(1)  # Wait for 1 second
         locators = [cook_element(self.__items, item.lower()) for item in AccSummary.checkbox_list()]
         self.actions.verify_elements_displayed(locators, is_display=is_display, timeout=SHORT_WAIT)
 
     def verify_note_items_displayed(self, is_display=True):
-        time.sleep(1)  # Wait for 1 second
         locators = [cook_element(self.__items, item.lower()) for item in AccSummary.note_list()]
         self.actions.verify_elements_displayed(locators, is_display=is_display, timeout=SHORT_WAIT)
\ No newline at end of file
@@ -8,7 +8,7 @@ from src.page_object.web_app.components.trade.base_trade import BaseTrade
 from src.utils.assert_utils import soft_assert
 from src.utils.common_utils import cook_element, data_testid
 from src.utils.format_utils import locator_format, format_dict_to_string
-from src.utils.logging_utils import logger
+from src.utils.logging_utils import logger, LazyLog
 from src.utils.trading_utils import calculate_trading_params
 
 
@@ -79,7 +79,7 @@ class TradingModals(BaseTrade):
         if "size" in actual:
             actual["volume"] = actual.pop("size")
 
-        logger.debug(f"- Actual: {format_dict_to_string(actual)}")
+        logger.debug("- Actual: %s", LazyLog(format_dict_to_string, actual))
         return actual
 
     def _get_edit_trade_confirmation(self):
@@ -95,7 +95,7 @@ class TradingModals(BaseTrade):
         if "size" in actual:
             actual["volume"] = actual.pop("size")
 
-        logger.debug(f"- Actual: {format_dict_to_string(actual)}")
+        logger.debug("- Actual: %s", LazyLog(format_dict_to_string, actual))
         return actual
 
     def is_edit_confirm_modal_displayed(self):
@@ -173,6 +173,7 @@ class TradingModals(BaseTrade):
             self._select_expiry(trade_object.expiry)
 
     def click_update_order_btn(self):
+        self.actions.wait_for_dom_stable(self.__btn_update_order, timeout=1)  # button state updated from the inputs
         self.actions.click(self.__btn_update_order, timeout=SHORT_WAIT, raise_exception=False)
 
     def confirm_update_order(self, confirm=True, timeout=EXPLICIT_WAIT):
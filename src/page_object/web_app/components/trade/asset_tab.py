@@ -70,11 +70,12 @@ class AssetTab(BaseTrade):
 
     def get_last_order_id(self, tab: AssetTabs, wait=True):
         """Get the latest order ID from the specified tab."""
+        locator = cook_element(self.__order_id_items, tab.col_locator())
         if wait:
             self.wait_for_spin_loader()
-            time.sleep(0.5)  # wait a bit for the icon totally disappear
+            self.actions.wait_for_content(locator, timeout=0.5)  # order ids rendered once the loader is gone
 
-        order_id = self.actions.get_text(cook_element(self.__order_id_items, tab.col_locator())).split(": ")[-1]
+        order_id = self.actions.get_text(locator).split(": ")[-1]
         logger.debug(f"- Latest orderID: {order_id!r}")
         return order_id
 
@@ -85,7 +86,7 @@ class AssetTab(BaseTrade):
         if trade_object.get("order_id"):
             expand_item = cook_element(self.__expand_item_by_id, trade_object.order_id, tab.col_locator())
 
-        time.sleep(0.5)
+        self.actions.wait_for_dom_stable(expand_item, timeout=0.5)
         self.actions.click(expand_item)
         logger.debug("- Item expanded, getting item data...")
 
@@ -153,7 +154,7 @@ class AssetTab(BaseTrade):
 
     def bulk_delete_orders(self) -> None:
         """Delete multiple pending orders at once."""
-        time.sleep(1)
+        self.actions.wait_for_dom_stable(self.__btn_bulk_delete, timeout=1)
         self.actions.click(self.__btn_bulk_delete)
         self.click_confirm_btn()
 
@@ -193,7 +194,7 @@ class AssetTab(BaseTrade):
             close_obj |= dict(volume=values.close_volume, units=values.close_units)
 
         # input closed volume
-        time.sleep(0.5)
+        self.actions.wait_for_dom_stable(self.__txt_close_volume, timeout=0.5)
         self.actions.send_keys(self.__txt_close_volume, close_volume)
 
         if confirm:
@@ -245,7 +246,6 @@ class AssetTab(BaseTrade):
         # Get current price to re-calculate prices
         self.__trade_modals.fill_update_order(trade_object, sl_type, tp_type)
 
-        time.sleep(1)
         self.__trade_modals.click_update_order_btn()
 
         # check if edit confirm modal is displayed
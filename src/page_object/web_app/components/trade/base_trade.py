@@ -1,5 +1,3 @@
-import time
-
 from selenium.webdriver.common.by import By
 
 from src.core.actions.web_actions import WebActions
@@ -52,9 +50,10 @@ class BaseTrade(BasePage):
     # One Click Trading Modal Actions
     def confirm_oct(self, confirm=True):
         """Confirm enable OCT or not"""
-        time.sleep(0.5)
         logger.debug(f"- Confirm enable OCT: {confirm!r}")
-        self.actions.click(self.__btn_oct_confirm if confirm else self.__btn_oct_cancel)
+        locator = self.__btn_oct_confirm if confirm else self.__btn_oct_cancel
+        self.actions.wait_for_dom_stable(locator, timeout=0.5)  # modal opening
+        self.actions.click(locator)
 
     # Trade Confirmation Modal Actions
     def confirm_trade(self, confirm=True):
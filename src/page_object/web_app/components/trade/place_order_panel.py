@@ -67,14 +67,14 @@ class PlaceOrderPanel(BaseTrade):
         """Get current stop loss value from input field."""
         locator = cook_element(self.__txt_stop_loss, SLTPType.PRICE.lower())
         self.actions.click(locator)
-        time.sleep(0.5)
+        self.actions.wait_for_content(locator, timeout=0.5, attribute="value")
         return self.actions.get_value(locator)
 
     def _get_input_tp(self) -> str:
         """Get current take profit value from input field."""
         locator = cook_element(self.__txt_take_profit, SLTPType.PRICE.lower())
         self.actions.click(locator)
-        time.sleep(0.5)
+        self.actions.wait_for_content(locator, timeout=0.5, attribute="value")
         return self.actions.get_value(locator)
 
     # ------------------------ ACTIONS ------------------------ #
@@ -103,8 +103,9 @@ class PlaceOrderPanel(BaseTrade):
     def _select_trade_type(self, trade_type: TradeType, normal_mode=True) -> None:
         """Select trade type (BUY/SELL)."""
         logger.debug(f"- Select trade type: {trade_type.upper()!r}")
-        time.sleep(0.5)
-        self.actions.click(cook_element(self.__btn_trade if normal_mode else self.__btn_oct_trade, trade_type.lower()))
+        locator = cook_element(self.__btn_trade if normal_mode else self.__btn_oct_trade, trade_type.lower())
+        self.actions.wait_for_dom_stable(locator, timeout=0.5)
+        self.actions.click(locator)
 
     def _select_order_type(self, order_type: OrderType) -> None:
         """Select order type (MARKET/LIMIT/STOP/STOP_LIMIT)."""
@@ -147,7 +148,7 @@ class PlaceOrderPanel(BaseTrade):
 
         logger.debug(f"- Select expiry: {expiry.title()!r}")
         self.actions.click(self.__drp_expiry)
-        time.sleep(0.5)
+        self.actions.wait_for_dom_stable(self.__drp_expiry, timeout=0.5)
         self.actions.click(cook_element(self.__opt_expiry, locator_format(expiry)))
 
         # select date in case expiry specified date
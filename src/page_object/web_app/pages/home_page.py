@@ -1,5 +1,3 @@
-import time
-
 from selenium.webdriver.common.by import By
 
 from src.core.actions.web_actions import WebActions
@@ -96,8 +94,7 @@ class HomePage(BasePage):
         self.actions.verify_element_displayed(cook_element(self.__item_search_result, symbol))
 
     def verify_wildcard_search_result(self, search_text: str):
-        elements = self.actions.find_elements(self.__items_search_result)
-        texts = [ele.text.strip() for ele in elements]
+        texts = self.actions.get_texts(self.__items_search_result)
 
         for text in texts:
             logger.debug(f"Check {text!r} contains {search_text!r}")
@@ -111,7 +108,6 @@ class HomePage(BasePage):
         soft_assert(text, UIMessages.NO_ITEM_AVAILABLE)
 
     def verify_search_history_deleted(self):
-        time.sleep(1)
         self.actions.verify_element_displayed(self.__item_search_history, is_display=False)
         self.actions.verify_element_displayed(self.__search_history, is_display=False)
 
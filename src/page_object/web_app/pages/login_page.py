@@ -1,5 +1,3 @@
-import time
-
 from selenium.webdriver.common.by import By
 
 from src.core.actions.web_actions import WebActions
@@ -47,7 +45,7 @@ class LoginPage(BasePage):
         self.actions.click(cook_element(self.__opt_language, language))
 
     def click_open_demo_account(self):
-        time.sleep(2)
+        self.actions.wait_for_dom_stable(cook_element(self.__tab_account_type, AccountType.DEMO), timeout=2)
         self.select_account_tab(AccountType.DEMO)
         self.actions.click(self.__open_demo_account)
 
@@ -10,7 +10,7 @@ from src.data.project_info import DriverList, StepLogs
 from src.utils import DotDict
 from src.utils.allure_utils import attach_screenshot
 from src.utils.format_utils import format_dict_to_string, remove_comma, format_str_price, is_float
-from src.utils.logging_utils import logger
+from src.utils.logging_utils import logger, LazyLog
 
 """Utilities"""
 
@@ -94,7 +94,7 @@ def compare_dict(
     diff_keys = []
     tolerance_info = {}
 
-    logger.debug(f"> Compare data: {format_dict_to_string(expected=expected, actual=actual)}")
+    logger.debug("> Compare data: %s", LazyLog(format_dict_to_string, expected=expected, actual=actual))
     # compare if length of two dicts are the same
     all_res.append(set(actual.keys()) == set(expected.keys()))
 
@@ -1,5 +1,6 @@
 import subprocess
 import xml.dom.minidom
+from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
 
 from src.data.consts import ROOTDIR
@@ -7,6 +8,12 @@ from src.data.enums import Language
 from src.data.project_info import DriverList, RuntimeConfig
 from src.utils.logging_utils import logger
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
 
 def log_page_source(name="page_source"):
     platform = RuntimeConfig.platform
@@ -151,3 +158,20 @@ def pretty_time(seconds):
         return "%s%dm%ds" % (sign_string, minutes, seconds)
     else:
         return "%s%ds" % (sign_string, seconds)
+
+
+@contextmanager
+def file_lock(path):
+    """Inter-process exclusive lock on a local file, shared by xdist workers and parallel sessions"""
+    with open(path, "a+") as f:
+        if fcntl:
+            fcntl.flock(f, fcntl.LOCK_EX)
+        else:
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(f, fcntl.LOCK_UN)
+            else:
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
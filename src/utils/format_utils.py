@@ -5,7 +5,7 @@ from typing import Dict, Any
 
 from requests import Response
 
-from src.data.consts import SEND_ICON, RECEIVE_ICON
+from src.data.consts import SEND_ICON, RECEIVE_ICON, API_LOG_MAX_LEN
 from src.utils.logging_utils import logger
 
 
@@ -301,13 +301,16 @@ def format_response(resp: Response, fields_to_show: list[str] = None, truncate_l
 
     return response_text
 
-def format_request_log(resp: Response, log_resp=False, fields_to_show=None, truncate_len=5) -> str:
+def format_request_log(resp: Response, log_resp=False, fields_to_show=None, truncate_len=5, max_len=API_LOG_MAX_LEN) -> str:
 
     # Format request content
     request = format_request(resp)
-    response = format_response(resp, fields_to_show, truncate_len)
 
     if log_resp:
+        response = format_response(resp, fields_to_show, truncate_len)
+        if max_len and len(response) > max_len:
+            response = f"{response[:max_len]}\n... ({len(response) - max_len} more chars)"
+
         return f"{SEND_ICON}  Request Sent: \n{request}\n\n {RECEIVE_ICON}  Response Received: \n{response}\n\n"
 
     return f"{SEND_ICON}  Request Sent: \n{request}\n\n"
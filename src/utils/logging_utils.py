@@ -31,6 +31,28 @@ def record_steps_log(func):
     return wrapper
 
 
+class LazyLog:
+    """
+    Defer building an expensive log message until a handler actually emits the record.
+    The message is built once, then reused by the other handlers emitting the same record.
+    Usage: logger.debug("%s", LazyLog(format_func, *args, **kwargs))
+    """
+
+    __slots__ = ("_func", "_args", "_kwargs", "_message")
+
+    def __init__(self, func, *args, **kwargs):
+        self._func = func
+        self._args = args
+        self._kwargs = kwargs
+        self._message = None
+
+    def __str__(self):
+        if self._message is None:
+            self._message = str(self._func(*self._args, **self._kwargs))
+            self._func = self._args = self._kwargs = None  # release the formatted objects
+        return self._message
+
+
 logger = logging.getLogger("pythonLog")
 LOG_COLOR = {
     logging.DEBUG: Fore.LIGHTBLACK_EX,
@@ -23,8 +23,8 @@ def setup_bulk_asset_test(android, symbol):
 
         trade_object = ObjTrade(order_type=order_type, symbol=symbol)
         logger.info(f"- Place {create_amount} {trade_object.trade_type.upper()} {trade_object.order_type.upper()}")
-        for _ in range(create_amount):
-            APIClient().trade.post_order(trade_object, update_price=False)
+        trade_objects = [ObjTrade(trade_type=trade_object.trade_type, order_type=order_type, symbol=symbol) for _ in range(create_amount)]
+        APIClient().trade.post_orders(trade_objects, update_price=False)
 
         logger.info("- Navigate to Asset Page")
         android.trade_screen.navigate_to(Features.ASSETS)
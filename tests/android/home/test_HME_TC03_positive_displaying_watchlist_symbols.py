@@ -1,6 +1,7 @@
 import pytest
 
 from src.apis.api_client import APIClient
+from src.apis.async_api_client import AsyncAPIClient
 from src.data.enums import WatchListTab, Features
 from src.data.objects.symbol_obj import ObjSymbol
 from src.utils.logging_utils import logger
@@ -37,9 +38,9 @@ def setup_test():
         if not symbols and tab == WatchListTab.FAVOURITES:
             _list_symbol = ObjSymbol().all_symbols[:3]
 
-            for symbol in _list_symbol:
-                logger.info(f"- Mark star symbol: {symbol!r}")
-                APIClient().market.post_starred_symbol(symbol)
+            logger.info(f"- Mark star symbols: {', '.join(_list_symbol)!r}")
+            with AsyncAPIClient() as client:
+                client.gather(*[client.market.post_starred_symbol(symbol) for symbol in _list_symbol])
 
             symbols = _list_symbol
 
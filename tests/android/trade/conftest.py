@@ -62,8 +62,8 @@ def setup_bulk_test(android, symbol):
 
         if not order_ids:
             logger.info(f"- Place {create_amount} {order_type.upper()} orders")
-            for _ in range(create_amount):
-                APIClient().trade.post_order(ObjTrade(order_type=order_type, symbol=symbol), update_price=False)
+            trade_objects = [ObjTrade(order_type=order_type, symbol=symbol) for _ in range(create_amount)]
+            APIClient().trade.post_orders(trade_objects, update_price=False)
 
         android.trade_screen.navigate_to(Features.HOME)
         android.home_screen.navigate_to(Features.TRADE)
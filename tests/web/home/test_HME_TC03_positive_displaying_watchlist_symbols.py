@@ -3,6 +3,7 @@ import random
 import pytest
 
 from src.apis.api_client import APIClient
+from src.apis.async_api_client import AsyncAPIClient
 from src.data.enums import WatchListTab
 from src.data.objects.symbol_obj import ObjSymbol
 from src.utils.logging_utils import logger
@@ -60,9 +61,9 @@ def setup_test(web):
             symbols = ObjSymbol().all_symbols
             _list_symbol = random.sample(symbols, 10) if len(symbols) >= 10 else symbols
 
-            for symbol in _list_symbol:
-                logger.info(f"- Mark star symbol: {symbol!r}")
-                APIClient().market.post_starred_symbol(symbol)
+            logger.info(f"- Mark star symbols: {', '.join(_list_symbol)!r}")
+            with AsyncAPIClient() as client:
+                client.gather(*[client.market.post_starred_symbol(symbol) for symbol in _list_symbol])
 
             symbols = _list_symbol
             web.home_page.refresh_page()
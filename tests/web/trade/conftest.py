@@ -79,11 +79,9 @@ def setup_bulk_test(web, symbol):
         order_ids = APIClient().order.get_order_id_list(symbol, order_type)
 
         if not order_ids:
-            trade_object = ObjTrade(order_type=order_type, symbol=symbol)
-
             logger.info(f"- Place {create_amount} {order_type.upper()} orders")
-            for _ in range(create_amount):
-                APIClient().trade.post_order(trade_object, update_price=False)
+            trade_objects = [ObjTrade(order_type=order_type, symbol=symbol) for _ in range(create_amount)]
+            APIClient().trade.post_orders(trade_objects)  # confirmed placed before listing order ids
 
             web.trade_page.wait_for_spin_loader()
             web.trade_page.asset_tab.wait_for_tab_amount(asset_tab, expected_amount=create_amount)
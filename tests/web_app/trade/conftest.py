@@ -98,8 +98,8 @@ def setup_bulk_test(web_app, symbol):
 
         if not order_ids:
             logger.info(f"- Place {create_amount} {order_type.upper()} orders")
-            for _ in range(create_amount):
-                APIClient().trade.post_order(ObjTrade(order_type=order_type, symbol=symbol), update_price=False)
+            trade_objects = [ObjTrade(order_type=order_type, symbol=symbol) for _ in range(create_amount)]
+            APIClient().trade.post_orders(trade_objects)  # confirmed placed before listing order ids
 
         web_app.trade_page.navigate_to(Features.HOME)
         web_app.home_page.navigate_to(Features.TRADE)